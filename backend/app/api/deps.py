@@ -3,54 +3,57 @@ API dependencies for dependency injection
 Provides database sessions and authentication
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import SessionLocal
+from app.core.database import AsyncSessionLocal
 from app.core.security import verify_token
 from app.models.user import User
-from app.services.auth_service import get_user_by_username
+from app.services.auth_service import get_user_identity
 
 # Security scheme for JWT Bearer token
 security = HTTPBearer()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency to get database session
+    Dependency to get an async database session
 
     Yields:
-        Database session
+        Async database session
 
     Example:
         @app.get("/items")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def read_items(db: DBSession):
+            return (await db.scalars(select(Item))).all()
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[Session, Depends(get_db)],
 ) -> User:
     """
     Dependency to get current authenticated user from JWT token
 
+    Users never change after creation, so their identity is cached by
+    username (see get_user_identity) and most requests authenticate without
+    any query. On a cache miss the user is loaded in a short-lived session
+    that is closed before the route runs, so its pooled connection is not
+    held during long AI calls. The returned user is transient: its columns
+    are set, but it belongs to no session and has no loaded relationships,
+    so routes that need the database must use their own DBSession.
+
     Args:
         credentials: JWT Bearer token from Authorization header
-        db: Database session
 
     Returns:
-        Current user object
+        Current user object (not attached to any session)
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -77,15 +80,14 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    # Get user from database
-    user = get_user_by_username(db, username)
-    if user is None:
+    identity = await get_user_identity(username)
+    if identity is None:
         raise credentials_exception
 
-    return user
+    return identity.to_user()
 
 
 # Type aliases for cleaner route signatures
-DBSession = Annotated[Session, Depends(get_db)]
+DBSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
@@ -3,10 +3,19 @@ Health check endpoints
 Verify API and database connectivity
 """
 
+from typing import Any
+
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import text
 
 from app.api.deps import DBSession
+from app.core.database import pool_stats
+from app.services.ai_service import ai_service
+from app.services.auth_service import user_identity_cache
+from app.services.prefetch_service import recipe_prefetcher
+from app.services.recipe_cache import recipe_cache
+from app.services.recipe_generation_service import details_flight
+from app.services.user_service import user_preferences_cache
 
 router = APIRouter()
 
@@ -24,7 +33,7 @@ async def health_check(db: DBSession) -> dict[str, str]:
     """
     try:
         # Test database connection
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         raise HTTPException(
@@ -33,6 +42,33 @@ async def health_check(db: DBSession) -> dict[str, str]:
         ) from e
 
 
+@router.get("/health/stats")  # type: ignore[misc]
+async def health_stats() -> dict[str, Any]:
+    """
+    In-process DB pool, AI limiter, circuit breaker, cache, request
+    coalescing and prefetch statistics
+
+    Returns:
+        DB connection pool usage, AI concurrency window, queue
+        depth and retry counts, circuit breaker state and failure rates,
+        size, bytes and hit/miss counters per cache, in-flight counters per
+        coalescer, queue depth and counters of the prefetch workers
+    """
+    return {
+        "db_pool": pool_stats(),
+        "ai_limiter": ai_service.limiter.stats(),
+        "ai_circuit_breaker": ai_service.breaker.stats(),
+        "recipe_list_cache": ai_service.recipe_list_cache.stats(),
+        "recipe_cache": recipe_cache.stats(),
+        "auth_cache": user_identity_cache.stats(),
+        "preferences_cache": user_preferences_cache.stats(),
+        "recipe_list_flight": ai_service.recipe_list_flight.stats(),
+        "recipe_details_flight": ai_service.recipe_details_flight.stats(),
+        "recipe_store_flight": details_flight.stats(),
+        "recipe_prefetch": recipe_prefetcher.stats(),
+    }
+
+
 @router.get("/")  # type: ignore[misc]
 async def root() -> dict[str, str]:
     """Root endpoint - basic API info"""
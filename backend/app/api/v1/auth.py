@@ -41,7 +41,7 @@ async def login(request: LoginRequest, db: DBSession) -> TokenResponse:
         }
     """
     try:
-        user, access_token = authenticate_user(db, request.username)
+        user, access_token = await authenticate_user(db, request.username)
 
         return TokenResponse(
             access_token=access_token,
@@ -3,30 +3,132 @@ Recipe routes
 Generate recipes with AI, get details, and manage saved recipes
 """
 
-from typing import cast
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Literal, TypeVar, cast
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import CurrentUser, DBSession
+from app.core.config import settings
+from app.models.saved_recipe import SavedRecipe
+from app.models.user import User
 from app.schemas.recipe import (
-    RecipeCreate,
+    RECIPE_NAME_MAX_LENGTH,
+    RecipeDetailsBatchRequest,
+    RecipeDetailsBatchResponse,
     RecipeDetailsRequest,
     RecipeGenerateRequest,
+    RecipeListItem,
     RecipeListResponse,
     RecipeResponse,
+    RecipeSummary,
+    SavedRecipeBulkRequest,
+    SavedRecipeBulkResponse,
+    SavedRecipeBulkResult,
+    SavedRecipePage,
     SavedRecipeResponse,
+    SavedRecipeSummary,
+    SavedRecipeSummaryPage,
+)
+from app.services.ai_service import (
+    AICircuitOpenError,
+    AIServiceUnavailableError,
+    ai_service,
+)
+from app.services.prefetch_service import recipe_prefetcher
+from app.services.recipe_cache import get_cached_recipe
+from app.services.recipe_generation_service import (
+    generate_recipe_details_batch,
+    generate_recipe_details_once,
+    get_stored_recipe,
+    stream_recipe_details,
+    suggest_stored_recipes,
 )
-from app.services.ai_service import ai_service
 from app.services.recipe_service import (
-    create_recipe,
-    get_recipe_by_name,
+    bulk_update_saved_recipes,
+    ensure_recipe_saved_for_user,
+    get_saved_recipe_for_user,
+    get_saved_recipe_summaries_for_user,
     get_saved_recipes_for_user,
     save_recipe_for_user,
     unsave_recipe_for_user,
 )
+from app.services.user_service import get_cached_user_preferences
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.sse import SSE_HEADERS, format_sse
 
 router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
+GenerationRequest = TypeVar(
+    "GenerationRequest", RecipeGenerateRequest, RecipeDetailsRequest, RecipeDetailsBatchRequest
+)
+
+
+def _ai_unavailable(error: AIServiceUnavailableError) -> HTTPException:
+    """Build the 503 response for an overloaded AI provider"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(int(settings.AI_RETRY_MAX_DELAY_SECONDS))},
+    )
+
+
+def _merge_terms(requested: list[str] | None, stored: list[str] | None) -> list[str] | None:
+    """Union of two term lists in order, skipping case-insensitive duplicates"""
+    merged: dict[str, str] = {}
+    for term in [*(requested or []), *(stored or [])]:
+        if term.strip():
+            merged.setdefault(term.strip().lower(), term.strip())
+    return list(merged.values()) or None
+
+
+async def _with_user_preferences(request: GenerationRequest, user: User) -> GenerationRequest:
+    """
+    Add the user's stored restrictions and allergies to a generation request
+
+    Preferences come from the per-user cache, so the client does not need to
+    fetch and resend them. The merged request drives the prompt and every
+    cache and lookup key.
+
+    Args:
+        request: Generation request as sent by the client
+        user: Current authenticated user
+
+    Returns:
+        Copy of the request with merged dietary_restrictions and allergies
+    """
+    preferences = await get_cached_user_preferences(cast(int, user.id))
+    if not preferences.dietary_restrictions and not preferences.allergies:
+        return request
+    merged = request.model_copy(
+        update={
+            "dietary_restrictions": _merge_terms(
+                request.dietary_restrictions, preferences.dietary_restrictions
+            ),
+            "allergies": _merge_terms(request.allergies, preferences.allergies),
+        }
+    )
+    return cast(GenerationRequest, merged)
+
+
+def _details_requests_for(
+    request: RecipeGenerateRequest, recipes: list[RecipeListItem]
+) -> list[RecipeDetailsRequest]:
+    """Build the details requests a client would send for generated suggestions"""
+    return [
+        RecipeDetailsRequest(
+            recipe_name=recipe.name,
+            servings=request.servings,
+            dietary_restrictions=request.dietary_restrictions,
+            allergies=request.allergies,
+        )
+        for recipe in recipes
+        # Names too long for a details request could never be stored either
+        if recipe.name and len(recipe.name) <= RECIPE_NAME_MAX_LENGTH
+    ]
+
 
 @router.post("/generate", response_model=RecipeListResponse)  # type: ignore[misc]
 async def generate_recipes(
@@ -37,6 +139,9 @@ async def generate_recipes(
     Generate recipe suggestions from available ingredients using AI
 
     Requires authentication.
+    Stored dietary restrictions and allergies of the user are added to the request.
+    While the AI circuit breaker is open, stored recipes sharing ingredients
+    with the request are returned instead, with "degraded": true.
 
     Args:
         request: Recipe generation request with ingredients and preferences
@@ -65,11 +170,13 @@ async def generate_recipes(
                     "cooking_time": 25,
                     "difficulty": 4
                 }
-            ]
+            ],
+            "degraded": false
         }
     """
     try:
-        recipes = ai_service.generate_recipe_list(request)
+        request = await _with_user_preferences(request, user)
+        recipes = await ai_service.generate_recipe_list(request)
 
         if not recipes:
             raise HTTPException(
@@ -77,9 +184,19 @@ async def generate_recipes(
                 detail="No recipes found for the given ingredients",
             )
 
+        # Warm up details for the suggestions the user is likely to open next
+        recipe_prefetcher.schedule(_details_requests_for(request, recipes))
+
         return RecipeListResponse(recipes=recipes)
     except HTTPException:
         raise
+    except AICircuitOpenError as e:
+        stored = await suggest_stored_recipes(request)
+        if not stored:
+            raise _ai_unavailable(e) from e
+        return RecipeListResponse(recipes=stored, degraded=True)
+    except AIServiceUnavailableError as e:
+        raise _ai_unavailable(e) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -87,22 +204,88 @@ async def generate_recipes(
         ) from e
 
 
+@router.post("/generate/stream")  # type: ignore[misc]
+async def generate_recipes_stream(
+    request: RecipeGenerateRequest,
+    user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Stream recipe suggestions as Server-Sent Events
+
+    Requires authentication.
+    Stored dietary restrictions and allergies of the user are added to the request.
+    Each recipe is sent as soon as the AI has finished writing it, instead of
+    waiting for the whole list.
+
+    Args:
+        request: Recipe generation request with ingredients and preferences
+        user: Current authenticated user
+
+    Returns:
+        text/event-stream response
+
+    Example:
+        POST /api/v1/recipes/generate/stream
+        Headers: Authorization: Bearer <token>
+        {
+            "ingredients": ["chicken", "tomatoes", "pasta"],
+            "servings": 2
+        }
+
+        Response:
+        event: recipe
+        data: {"name": "Chicken Pasta with Tomatoes", "description": "...", ...}
+
+        event: done
+        data: {"count": 6, "degraded": false}
+    """
+
+    async def event_stream() -> AsyncIterator[str]:
+        count = 0
+        degraded = False
+        merged = request
+        try:
+            merged = await _with_user_preferences(request, user)
+            async for recipe in ai_service.stream_recipe_list(merged):
+                count += 1
+                recipe_prefetcher.schedule(_details_requests_for(merged, [recipe]))
+                yield format_sse("recipe", recipe.model_dump())
+        except AICircuitOpenError:
+            # Raised before the first recipe: fall back to stored recipes
+            degraded = True
+            for recipe in await suggest_stored_recipes(merged):
+                count += 1
+                yield format_sse("recipe", recipe.model_dump())
+        except Exception as e:
+            yield format_sse("error", {"detail": f"Failed to generate recipes: {str(e)}"})
+            return
+
+        if count == 0:
+            yield format_sse("error", {"detail": "No recipes found for the given ingredients"})
+            return
+
+        yield format_sse("done", {"count": count, "degraded": degraded})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.post("/details", response_model=RecipeResponse)  # type: ignore[misc]
 async def get_recipe_details(
     request: RecipeDetailsRequest,
     user: CurrentUser,
-    db: DBSession,
 ) -> RecipeResponse:
     """
     Get detailed recipe instructions for a specific recipe using AI
 
     Requires authentication.
+    Stored dietary restrictions and allergies of the user are added to the request.
     If the recipe doesn't exist in database, it will be created.
+    Concurrent requests for the same recipe share one generation.
+    No database connection is held while the AI generates the recipe.
 
     Args:
         request: Recipe details request with recipe name
         user: Current authenticated user
-        db: Database session
 
     Returns:
         Detailed recipe with ingredients and instructions
@@ -134,28 +317,29 @@ async def get_recipe_details(
         }
     """
     try:
+        request = await _with_user_preferences(request, user)
         # Check if recipe already exists in database
-        existing_recipe = get_recipe_by_name(db, request.recipe_name)
+        existing_recipe = await get_stored_recipe(
+            request.recipe_name, request.dietary_restrictions, request.allergies
+        )
 
         if existing_recipe:
-            return cast(RecipeResponse, RecipeResponse.model_validate(existing_recipe))
+            return existing_recipe
 
-        # Generate recipe details with AI
-        recipe_data = ai_service.generate_recipe_details(request)
+        # Generate and store recipe details with AI (shared by concurrent callers)
+        recipe = await generate_recipe_details_once(request)
 
-        if not recipe_data:
+        if recipe is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Failed to generate recipe details",
             )
 
-        # Create recipe in database
-        recipe_create = RecipeCreate(**recipe_data)
-        recipe = create_recipe(db, recipe_create)
-
-        return cast(RecipeResponse, RecipeResponse.model_validate(recipe))
+        return recipe
     except HTTPException:
         raise
+    except AIServiceUnavailableError as e:
+        raise _ai_unavailable(e) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -163,45 +347,190 @@ async def get_recipe_details(
         ) from e
 
 
-@router.get("/saved", response_model=list[SavedRecipeResponse])  # type: ignore[misc]
+@router.post("/details/batch", response_model=RecipeDetailsBatchResponse)  # type: ignore[misc]
+async def get_recipe_details_batch(
+    request: RecipeDetailsBatchRequest,
+    user: CurrentUser,
+) -> RecipeDetailsBatchResponse:
+    """
+    Get detailed recipes for several recipe names in one request
+
+    Requires authentication.
+    Stored dietary restrictions and allergies of the user are added to the request.
+    Recipes already in database are returned as is; the others are generated
+    concurrently and stored together.
+
+    Args:
+        request: Batch request with recipe names, servings and restrictions
+        user: Current authenticated user
+
+    Returns:
+        Detailed recipes in request order and the names that failed
+
+    Example:
+        POST /api/v1/recipes/details/batch
+        Headers: Authorization: Bearer <token>
+        {
+            "recipe_names": ["Chicken Pasta", "Tomato Soup"],
+            "servings": 2
+        }
+
+        Response:
+        {
+            "recipes": [{"id": 1, "name": "Chicken Pasta", ...}, ...],
+            "failed": []
+        }
+    """
+    try:
+        request = await _with_user_preferences(request, user)
+        recipes, failed = await generate_recipe_details_batch(request)
+        return RecipeDetailsBatchResponse(recipes=recipes, failed=failed)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get recipe details: {str(e)}",
+        ) from e
+
+
+@router.post("/details/stream")  # type: ignore[misc]
+async def get_recipe_details_stream(
+    request: RecipeDetailsRequest,
+    user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Stream detailed recipe instructions as Server-Sent Events
+
+    Requires authentication.
+    Stored dietary restrictions and allergies of the user are added to the request.
+    Summary fields are sent first, then each ingredient, then each
+    instruction step. The final "recipe" event carries the stored recipe
+    with its id, exactly like POST /recipes/details.
+
+    Args:
+        request: Recipe details request with recipe name
+        user: Current authenticated user
+
+    Returns:
+        text/event-stream response
+
+    Example:
+        POST /api/v1/recipes/details/stream
+        Headers: Authorization: Bearer <token>
+        {
+            "recipe_name": "Chicken Pasta with Tomatoes",
+            "servings": 2
+        }
+
+        Response:
+        event: field
+        data: {"name": "Chicken Pasta with Tomatoes"}
+
+        event: ingredient
+        data: {"name": "chicken breast", "quantity": "200g"}
+
+        event: step
+        data: {"index": 0, "text": "Cook pasta..."}
+
+        event: recipe
+        data: {"id": 1, "name": "Chicken Pasta with Tomatoes", ...}
+    """
+
+    async def event_stream() -> AsyncIterator[str]:
+        completed = False
+        try:
+            merged = await _with_user_preferences(request, user)
+            async for event, payload in stream_recipe_details(merged):
+                completed = completed or event == "recipe"
+                yield format_sse(event, payload)
+        except Exception as e:
+            yield format_sse("error", {"detail": f"Failed to get recipe details: {str(e)}"})
+            return
+
+        if not completed:
+            yield format_sse("error", {"detail": "Failed to generate recipe details"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.get(
+    "/saved", response_model=SavedRecipePage | SavedRecipeSummaryPage
+)  # type: ignore[misc]
 async def get_saved_recipes(
     user: CurrentUser,
     db: DBSession,
-) -> list[SavedRecipeResponse]:
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
+    view: Literal["full", "summary"] = "full",
+) -> SavedRecipePage | SavedRecipeSummaryPage:
     """
-    Get all saved recipes for current user
+    Get saved recipes for current user, most recently saved first
 
-    Requires authentication.
+    Requires authentication. Results are paginated: pass the returned
+    next_cursor as ?cursor= to get the following page. next_cursor is null
+    on the last page.
+
+    With view=summary each recipe only has id, name, description,
+    cooking_time and difficulty; full details can be fetched per recipe
+    from /recipes/saved/{recipe_id}.
 
     Args:
         user: Current authenticated user
         db: Database session
+        limit: Maximum number of saved recipes per page (1-100)
+        cursor: Opaque cursor from a previous page
+        view: "full" for complete recipes, "summary" for list fields only
 
     Returns:
-        List of saved recipes with details
+        Page of saved recipes with details
+
+    Raises:
+        HTTPException: If the cursor is invalid
 
     Example:
-        GET /api/v1/recipes/saved
+        GET /api/v1/recipes/saved?limit=20
         Headers: Authorization: Bearer <token>
 
         Response:
-        [
-            {
-                "id": 1,
-                "user_id": 1,
-                "recipe": {
+        {
+            "items": [
+                {
                     "id": 1,
-                    "name": "Chicken Pasta",
-                    "description": "...",
-                    ...
-                },
-                "saved_at": "2025-10-01T12:00:00"
-            }
-        ]
+                    "user_id": 1,
+                    "recipe": {
+                        "id": 1,
+                        "name": "Chicken Pasta",
+                        "description": "...",
+                        ...
+                    },
+                    "saved_at": "2025-10-01T12:00:00"
+                }
+            ],
+            "next_cursor": "eyJ0IjoiMjAyNS0xMC0wMVQxMjowMDowMCIsImlkIjoxfQ"
+        }
     """
     try:
-        saved_recipes = get_saved_recipes_for_user(db, user)
-        return [SavedRecipeResponse.model_validate(sr) for sr in saved_recipes]
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    try:
+        if view == "summary":
+            return await _get_saved_recipe_summaries(db, user, limit, after)
+
+        # Read one extra row to know whether another page follows
+        saved_recipes = await get_saved_recipes_for_user(db, user, limit=limit + 1, after=after)
+        page = saved_recipes[:limit]
+        next_cursor = (
+            encode_cursor(page[-1].saved_at, page[-1].id)
+            if len(saved_recipes) > limit
+            else None
+        )
+        return SavedRecipePage(
+            items=[
+                cast(SavedRecipeResponse, SavedRecipeResponse.model_validate(sr)) for sr in page
+            ],
+            next_cursor=next_cursor,
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,6 +538,102 @@ async def get_saved_recipes(
         ) from e
 
 
+async def _get_saved_recipe_summaries(
+    db: DBSession, user: CurrentUser, limit: int, after: tuple[datetime, int] | None
+) -> SavedRecipeSummaryPage:
+    """Build a page of saved recipe summaries"""
+    rows = await get_saved_recipe_summaries_for_user(db, user, limit=limit + 1, after=after)
+    page = rows[:limit]
+    return SavedRecipeSummaryPage(
+        items=[
+            SavedRecipeSummary(
+                id=row.id,
+                user_id=row.user_id,
+                saved_at=row.saved_at,
+                recipe=RecipeSummary(
+                    id=row.recipe_id,
+                    name=row.name,
+                    description=row.description,
+                    cooking_time=row.cooking_time,
+                    difficulty=row.difficulty,
+                ),
+            )
+            for row in page
+        ],
+        next_cursor=encode_cursor(page[-1].saved_at, page[-1].id) if len(rows) > limit else None,
+    )
+
+
+def _saved_recipe_response(
+    saved_recipe: SavedRecipe, recipe: RecipeResponse
+) -> SavedRecipeResponse:
+    """Pair a saved recipe row with its (cached) recipe"""
+    return SavedRecipeResponse(
+        id=saved_recipe.id,
+        user_id=saved_recipe.user_id,
+        recipe=recipe,
+        saved_at=saved_recipe.saved_at,
+    )
+
+
+# Declared before /saved/{recipe_id} so "bulk" is not read as a recipe ID
+@router.post("/saved/bulk", response_model=SavedRecipeBulkResponse)  # type: ignore[misc]
+async def bulk_update_saved(
+    request: SavedRecipeBulkRequest,
+    user: CurrentUser,
+    db: DBSession,
+) -> SavedRecipeBulkResponse:
+    """
+    Save and unsave several recipes in one request
+
+    Requires authentication. All changes are applied in one transaction;
+    unknown recipe IDs are reported as not_found and do not fail the request.
+
+    Args:
+        request: Recipe IDs to save and to unsave (up to 100 each)
+        user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Outcome for each recipe ID
+
+    Example:
+        POST /api/v1/recipes/saved/bulk
+        Headers: Authorization: Bearer <token>
+        {
+            "save": [1, 2],
+            "unsave": [3]
+        }
+
+        Response:
+        {
+            "results": [
+                {"recipe_id": 1, "action": "save", "status": "saved"},
+                {"recipe_id": 2, "action": "save", "status": "already_saved"},
+                {"recipe_id": 3, "action": "unsave", "status": "unsaved"}
+            ]
+        }
+    """
+    try:
+        save_outcomes, unsave_outcomes = await bulk_update_saved_recipes(
+            db, user, request.save, request.unsave
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to update saved recipes: {str(e)}",
+        ) from e
+
+    results = [
+        SavedRecipeBulkResult(recipe_id=recipe_id, action="save", status=outcome)
+        for recipe_id, outcome in save_outcomes.items()
+    ] + [
+        SavedRecipeBulkResult(recipe_id=recipe_id, action="unsave", status=outcome)
+        for recipe_id, outcome in unsave_outcomes.items()
+    ]
+    return SavedRecipeBulkResponse(results=results)
+
+
 @router.post("/saved/{recipe_id}", response_model=SavedRecipeResponse)  # type: ignore[misc]
 async def save_recipe(
     recipe_id: int,
@@ -245,9 +670,7 @@ async def save_recipe(
     """
     try:
         # Get recipe from database
-        from app.services.recipe_service import get_recipe_by_id
-
-        recipe = get_recipe_by_id(db, recipe_id)
+        recipe = await get_cached_recipe(db, recipe_id)
 
         if not recipe:
             raise HTTPException(
@@ -256,9 +679,9 @@ async def save_recipe(
             )
 
         # Save recipe for user
-        saved_recipe = save_recipe_for_user(db, user, recipe)
+        saved_recipe = await save_recipe_for_user(db, user, recipe_id)
 
-        return cast(SavedRecipeResponse, SavedRecipeResponse.model_validate(saved_recipe))
+        return _saved_recipe_response(saved_recipe, recipe)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -273,6 +696,124 @@ async def save_recipe(
         ) from e
 
 
+@router.put("/saved/{recipe_id}", response_model=SavedRecipeResponse)  # type: ignore[misc]
+async def put_saved_recipe(
+    recipe_id: int,
+    user: CurrentUser,
+    db: DBSession,
+    response: Response,
+) -> SavedRecipeResponse:
+    """
+    Save a recipe for current user, succeeding if it is already saved
+
+    Idempotent variant of POST /saved/{recipe_id}: repeating the request
+    (e.g. a double-click) returns the existing saved recipe. Responds with
+    201 when the recipe was saved by this request and 200 otherwise.
+
+    Requires authentication.
+
+    Args:
+        recipe_id: Recipe ID to save
+        user: Current authenticated user
+        db: Database session
+        response: Response, used to set the status code
+
+    Returns:
+        Saved recipe info
+
+    Raises:
+        HTTPException: If recipe not found
+
+    Example:
+        PUT /api/v1/recipes/saved/1
+        Headers: Authorization: Bearer <token>
+
+        Response:
+        {
+            "id": 1,
+            "user_id": 1,
+            "recipe": {...},
+            "saved_at": "2025-10-01T12:00:00"
+        }
+    """
+    try:
+        recipe = await get_cached_recipe(db, recipe_id)
+
+        if not recipe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Recipe not found",
+            )
+
+        saved_recipe, created = await ensure_recipe_saved_for_user(db, user, recipe_id)
+        response.status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+
+        return _saved_recipe_response(saved_recipe, recipe)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save recipe: {str(e)}",
+        ) from e
+
+
+@router.get("/saved/{recipe_id}", response_model=SavedRecipeResponse)  # type: ignore[misc]
+async def get_saved_recipe(
+    recipe_id: int,
+    user: CurrentUser,
+    db: DBSession,
+) -> SavedRecipeResponse:
+    """
+    Get one saved recipe of current user with full details
+
+    Requires authentication. Unlike /recipes/details this reads the saved
+    recipe by ID, so it does not depend on the user's current dietary
+    restrictions and never generates a new recipe.
+
+    Args:
+        recipe_id: Recipe ID of the saved recipe
+        user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Saved recipe info
+
+    Raises:
+        HTTPException: If the recipe is not saved by the user
+
+    Example:
+        GET /api/v1/recipes/saved/1
+        Headers: Authorization: Bearer <token>
+
+        Response:
+        {
+            "id": 1,
+            "user_id": 1,
+            "recipe": {...},
+            "saved_at": "2025-10-01T12:00:00"
+        }
+    """
+    try:
+        saved_recipe = await get_saved_recipe_for_user(db, user, recipe_id)
+        recipe = await get_cached_recipe(db, recipe_id) if saved_recipe else None
+
+        if saved_recipe is None or recipe is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Recipe not found in saved recipes",
+            )
+
+        return _saved_recipe_response(saved_recipe, recipe)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get saved recipe: {str(e)}",
+        ) from e
+
+
 @router.delete("/saved/{recipe_id}")  # type: ignore[misc]
 async def unsave_recipe(
     recipe_id: int,
@@ -305,7 +846,7 @@ async def unsave_recipe(
         }
     """
     try:
-        success = unsave_recipe_for_user(db, user, recipe_id)
+        success = await unsave_recipe_for_user(db, user, recipe_id)
 
         if not success:
             raise HTTPException(
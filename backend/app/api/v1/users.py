@@ -1,14 +1,10 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter
 
-from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.user import User
+from app.api.deps import CurrentUser, DBSession
 from app.schemas.user import (
-    UserPreferencesBase,
     UserPreferencesResponse,
     UserPreferencesUpdate,
 )
@@ -16,8 +12,8 @@ from app.services.user_service import UserService
 
 router = APIRouter()
 
-def _get_current_user_profile(
-    current_user: User = Depends(get_current_user)
+async def _get_current_user_profile(
+    current_user: CurrentUser
 ) -> dict[str, Any]:
     """Get current user profile"""
     return {
@@ -26,13 +22,13 @@ def _get_current_user_profile(
         "created_at": current_user.created_at
     }
 
-def _get_user_preferences(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def _get_user_preferences(
+    current_user: CurrentUser,
+    db: DBSession
 ) -> dict[str, Any] | UserPreferencesResponse:
     """Get user preferences"""
     user_service = UserService(db)
-    preferences = user_service.get_user_preferences(current_user.id)
+    preferences = await user_service.get_user_preferences(current_user.id)
 
     if not preferences:
         # Return default preferences if none exist
@@ -49,33 +45,19 @@ def _get_user_preferences(
         updated_at=preferences.updated_at
     )
 
-def _update_user_preferences(
+async def _update_user_preferences(
     preferences_update: UserPreferencesUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser,
+    db: DBSession
 ) -> UserPreferencesResponse:
     """Update user preferences"""
     user_service = UserService(db)
 
-    # Check if preferences exist
-    existing_preferences = user_service.get_user_preferences(current_user.id)
-
-    if existing_preferences:
-        # Update existing preferences
-        updated_preferences = user_service.update_user_preferences(
-            current_user.id,
-            preferences_update.model_dump(exclude_unset=True)
-        )
-    else:
-        # Create new preferences
-        preferences_data = UserPreferencesBase(**preferences_update.model_dump())
-        updated_preferences = user_service.create_user_preferences(
-            current_user.id,
-            preferences_data
-        )
-
-    if not updated_preferences:
-        raise HTTPException(status_code=500, detail="Failed to update preferences")
+    # One INSERT ... ON CONFLICT (user_id) DO UPDATE ... RETURNING
+    updated_preferences = await user_service.upsert_user_preferences(
+        current_user.id,
+        preferences_update.model_dump(exclude_unset=True)
+    )
 
     return UserPreferencesResponse(
         id=updated_preferences.id,
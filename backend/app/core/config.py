@@ -20,9 +20,69 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5  # Connections kept open in the pool
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed beyond DB_POOL_SIZE
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Max wait for a free connection
 
     # Mistral AI
     MISTRAL_API_KEY: str
+    MISTRAL_SERVER_URL: str | None = None  # e.g. the fake LLM server for load tests
+
+    # LLM backend: "mistral" or "fake" (deterministic, offline)
+    LLM_BACKEND: str = "mistral"
+    LLM_MODEL: str = "mistral-large-latest"
+    FAKE_LLM_LATENCY_MS: float = 500.0
+    FAKE_LLM_LATENCY_DISTRIBUTION: str = "lognormal"
+    FAKE_LLM_ERROR_RATE: float = 0.0
+    FAKE_LLM_TOKENS_PER_SECOND: float = 50.0
+    FAKE_LLM_SEED: int | None = None
+    AI_MAX_CONNECTIONS: int = 256  # Concurrent HTTP connections to Mistral
+    AI_TIMEOUT_SECONDS: float = 120.0
+
+    # Adaptive concurrency limit and retries for Mistral calls
+    AI_CONCURRENCY_INITIAL: int = 16
+    AI_CONCURRENCY_MIN: int = 1
+    AI_CONCURRENCY_MAX: int = 256
+    AI_QUEUE_MAX_SIZE: int = 500
+    AI_QUEUE_TIMEOUT_SECONDS: float = 30.0
+    AI_MAX_RETRIES: int = 3
+    AI_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    AI_RETRY_MAX_DELAY_SECONDS: float = 8.0
+
+    # Circuit breaker around Mistral calls (degraded mode while open)
+    AI_BREAKER_WINDOW_SIZE: int = 20
+    AI_BREAKER_MIN_CALLS: int = 10
+    AI_BREAKER_FAILURE_RATE: float = 0.5
+    AI_BREAKER_SLOW_CALL_SECONDS: float = 20.0
+    AI_BREAKER_SLOW_CALL_RATE: float = 0.5
+    AI_BREAKER_OPEN_SECONDS: float = 30.0
+    AI_BREAKER_HALF_OPEN_CALLS: int = 1
+    AI_BREAKER_PROBE_TIMEOUT_SECONDS: float = 150.0  # Probe slot freed if it never reports back
+
+    # Recipe generation cache
+    RECIPE_CACHE_MAX_ENTRIES: int = 1024
+    RECIPE_CACHE_TTL_SECONDS: int = 3600
+
+    # Authenticated user cache (users are never modified after creation)
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 600
+
+    # Stored user preferences cache (replaced on every preferences update)
+    PREFERENCES_CACHE_MAX_ENTRIES: int = 10000
+    PREFERENCES_CACHE_TTL_SECONDS: int = 600
+
+    # Stored recipe cache (recipes are immutable once created)
+    RECIPE_ROW_CACHE_MAX_ENTRIES: int = 10000
+    RECIPE_ROW_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RECIPE_ROW_CACHE_TTL_SECONDS: int = 86400
+
+    # Background prefetch of details for generated suggestions (opt-in)
+    RECIPE_PREFETCH_ENABLED: bool = False
+    RECIPE_PREFETCH_WORKERS: int = 4
+    RECIPE_PREFETCH_QUEUE_SIZE: int = 100
+
+    # Max concurrent AI calls per batch details request
+    RECIPE_BATCH_CONCURRENCY: int = 4
 
     # CORS
     BACKEND_CORS_ORIGINS: str = "http://localhost:3000"
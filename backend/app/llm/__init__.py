@@ -0,0 +1,20 @@
+"""
+LLM backends
+Mistral AI and a deterministic fake for offline load testing
+
+Kept outside app.services and free of app settings, so the fake LLM server
+(python -m app.llm.fake) starts without the API's configuration.
+"""
+
+from app.llm.base import LLMBackend, LLMBackendError
+from app.llm.fake import FakeLLMBackend, FakeLLMConfig, create_fake_llm_app
+from app.llm.mistral import MistralBackend
+
+__all__ = [
+    "LLMBackend",
+    "LLMBackendError",
+    "MistralBackend",
+    "FakeLLMBackend",
+    "FakeLLMConfig",
+    "create_fake_llm_app",
+]
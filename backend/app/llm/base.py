@@ -0,0 +1,48 @@
+"""
+LLM backend interface
+Chat completion providers used by the AI service
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+
+class LLMBackendError(Exception):
+    """Error returned by an LLM backend, with the HTTP-like status code"""
+
+    def __init__(self, message: str, status_code: int) -> None:
+        super().__init__(f"{message}: Status {status_code}")
+        self.status_code = status_code
+
+
+class LLMBackend(ABC):
+    """Chat completion provider in JSON mode"""
+
+    name: str
+
+    @abstractmethod
+    async def complete(self, messages: list[dict[str, str]]) -> str | None:
+        """
+        Run a chat completion
+
+        Args:
+            messages: Chat messages ({"role", "content"} dicts)
+
+        Returns:
+            Response content or None if the provider returned nothing
+        """
+
+    @abstractmethod
+    def stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Run a streaming chat completion
+
+        Args:
+            messages: Chat messages ({"role", "content"} dicts)
+
+        Returns:
+            Async iterator of content deltas
+        """
+
+    async def aclose(self) -> None:  # noqa: B027
+        """Release network resources held by the backend"""
@@ -0,0 +1,240 @@
+"""
+Deterministic fake LLM for offline development and load testing
+
+Produces recipe JSON derived from the prompt, with configurable latency,
+error rate and token streaming speed. Can be used in-process
+(LLM_BACKEND=fake) or started as a Mistral-compatible HTTP stand-in:
+
+    python -m app.llm.fake_server --port 8090 --latency-ms 800 --error-rate 0.02
+
+and then selected with LLM_BACKEND=mistral and MISTRAL_SERVER_URL=http://localhost:8090
+"""
+
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.llm.base import LLMBackend, LLMBackendError
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+_DISH_STYLES = ("Skillet", "Stir-Fry", "Bake", "Salad", "Soup", "Curry", "Tacos", "Risotto")
+
+
+@dataclass
+class FakeLLMConfig:
+    """Behaviour of the fake LLM"""
+
+    latency_ms: float = 500.0  # Mean time before the first token
+    latency_distribution: str = "lognormal"  # fixed, uniform, exponential or lognormal
+    latency_sigma: float = 0.5  # Spread of the lognormal distribution
+    error_rate: float = 0.0  # Probability that a call fails
+    error_status: int = 429  # Status code of injected failures
+    tokens_per_second: float = 50.0  # Streaming speed (0 = no pacing)
+    seed: int | None = None  # Seed for latency and error sampling
+
+
+class FakeLLMBackend(LLMBackend):
+    """In-process fake LLM returning deterministic recipe JSON"""
+
+    name = "fake"
+
+    # Approximate characters per token when pacing the stream
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, config: FakeLLMConfig | None = None) -> None:
+        self.config = config or FakeLLMConfig()
+        if self.config.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.config.latency_distribution}")
+        self._rng = random.Random(self.config.seed)
+
+    def sample_latency(self) -> float:
+        """Draw a time-to-first-token delay in seconds"""
+        mean = max(self.config.latency_ms, 0.0) / 1000
+        distribution = self.config.latency_distribution
+        if mean == 0 or distribution == "fixed":
+            return mean
+        if distribution == "uniform":
+            return self._rng.uniform(0, 2 * mean)
+        if distribution == "exponential":
+            return self._rng.expovariate(1 / mean)
+        # Lognormal with the configured mean
+        sigma = self.config.latency_sigma
+        return self._rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+
+    async def complete(self, messages: list[dict[str, str]]) -> str | None:
+        """Return the full response after the sampled latency"""
+        await self._wait_and_maybe_fail()
+        return render_response(messages)
+
+    async def stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """Yield the response in token-sized chunks at the configured speed"""
+        await self._wait_and_maybe_fail()
+        content = render_response(messages)
+        delay = 1 / self.config.tokens_per_second if self.config.tokens_per_second > 0 else 0
+        for start in range(0, len(content), self.CHARS_PER_TOKEN):
+            if delay:
+                await asyncio.sleep(delay)
+            yield content[start:start + self.CHARS_PER_TOKEN]
+
+    async def _wait_and_maybe_fail(self) -> None:
+        await asyncio.sleep(self.sample_latency())
+        if self._rng.random() < self.config.error_rate:
+            raise LLMBackendError("Injected fake LLM error", self.config.error_status)
+
+
+def render_response(messages: list[dict[str, str]]) -> str:
+    """
+    Build a deterministic JSON answer for a recipe prompt
+
+    Args:
+        messages: Chat messages; the last user message is the prompt
+
+    Returns:
+        Recipe list or recipe details JSON, depending on the prompt
+    """
+    prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+    rng = random.Random(zlib.crc32(prompt.encode()))
+
+    if '"recipes"' in prompt:
+        return json.dumps(_fake_recipe_list(prompt, rng))
+    return json.dumps(_fake_recipe_details(prompt, rng))
+
+
+def _fake_recipe_list(prompt: str, rng: random.Random) -> dict[str, Any]:
+    match = re.search(r"using these ingredients: (.+)", prompt)
+    ingredients = [item.strip() for item in match.group(1).split(",")] if match else ["pantry"]
+    main = ingredients[0].title() or "Pantry"
+    return {
+        "recipes": [
+            {
+                "name": f"{main} {style}",
+                "description": f"A {style.lower()} built around {', '.join(ingredients)}.",
+                "cooking_time": rng.choice((10, 15, 20, 30, 45, 60)),
+                "difficulty": rng.randint(1, 10),
+            }
+            for style in rng.sample(_DISH_STYLES, 6)
+        ]
+    }
+
+
+def _fake_recipe_details(prompt: str, rng: random.Random) -> dict[str, Any]:
+    name_match = re.search(r"detailed recipe for: (.+)", prompt)
+    servings_match = re.search(r"- Servings: (\d+)", prompt)
+    name = name_match.group(1).strip() if name_match else "House Special"
+    words = [word.lower() for word in re.findall(r"[A-Za-z]+", name)] or ["pantry"]
+    return {
+        "name": name,
+        "description": f"A reliable {name.lower()} for weeknights.",
+        "servings": int(servings_match.group(1)) if servings_match else 2,
+        "cooking_time": rng.choice((15, 20, 30, 45)),
+        "prep_time": rng.choice((5, 10, 15)),
+        "difficulty": rng.randint(1, 10),
+        "ingredients": [
+            {"name": word, "quantity": f"{rng.randint(1, 4) * 50}g"} for word in words
+        ]
+        + [{"name": "olive oil", "quantity": "2 tbsp"}, {"name": "salt", "quantity": "to taste"}],
+        "instructions": [
+            f"Prepare the {', '.join(words)}.",
+            "Heat the olive oil in a large pan.",
+            f"Cook everything for {rng.choice((10, 15, 20))} minutes, stirring often.",
+            "Season with salt and serve.",
+        ],
+    }
+
+
+def create_fake_llm_app(config: FakeLLMConfig | None = None) -> FastAPI:
+    """
+    Build a Mistral-compatible HTTP app serving POST /v1/chat/completions
+
+    Args:
+        config: Fake LLM behaviour
+
+    Returns:
+        FastAPI application
+    """
+    backend = FakeLLMBackend(config)
+    app = FastAPI(title="Fake LLM")
+
+    @app.post("/v1/chat/completions")  # type: ignore[misc]
+    async def chat_completions(request: Request) -> Any:
+        body = await request.json()
+        messages = body.get("messages", [])
+        model = body.get("model") or "fake"
+        completion_id = uuid.uuid4().hex
+        created = int(time.time())
+
+        if not body.get("stream"):
+            try:
+                content = await backend.complete(messages)
+            except LLMBackendError as e:
+                return JSONResponse(status_code=e.status_code, content={"message": str(e)})
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "model": model,
+                "created": created,
+                "usage": _usage(messages, content or ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+
+        # Fail before the stream starts, like a real rate-limited request
+        try:
+            chunks = backend.stream(messages)
+            first = await anext(chunks)
+        except LLMBackendError as e:
+            return JSONResponse(status_code=e.status_code, content={"message": str(e)})
+
+        async def events() -> AsyncIterator[str]:
+            chunk: str | None = first
+            while chunk is not None:
+                event = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "model": model,
+                    "created": created,
+                    "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(event)}\n\n"
+                chunk = await anext(chunks, None)
+            done = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "model": model,
+                "created": created,
+                "choices": [{"index": 0, "delta": {"content": ""}, "finish_reason": "stop"}],
+            }
+            yield f"data: {json.dumps(done)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def _usage(messages: list[dict[str, str]], content: str) -> dict[str, int]:
+    """Rough token counts so clients relying on usage fields keep working"""
+    prompt_tokens = sum(len(m.get("content", "")) for m in messages) // FakeLLMBackend.CHARS_PER_TOKEN
+    completion_tokens = len(content) // FakeLLMBackend.CHARS_PER_TOKEN
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
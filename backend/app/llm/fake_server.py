@@ -0,0 +1,44 @@
+"""
+Fake LLM HTTP server
+Runs the Mistral-compatible stand-in from app.llm.fake:
+
+    python -m app.llm.fake_server --port 8090 --latency-ms 800 --error-rate 0.02
+
+Only imports app.llm, so it needs none of the API's settings.
+"""
+
+import argparse
+
+from app.llm.fake import LATENCY_DISTRIBUTIONS, FakeLLMConfig, create_fake_llm_app
+
+
+def main() -> None:
+    """Run the fake LLM HTTP server"""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mistral-compatible fake LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=500.0)
+    parser.add_argument("--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        latency_ms=args.latency_ms,
+        latency_distribution=args.distribution,
+        latency_sigma=args.sigma,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        tokens_per_second=args.tokens_per_second,
+        seed=args.seed,
+    )
+    uvicorn.run(create_fake_llm_app(config), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
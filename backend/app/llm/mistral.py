@@ -0,0 +1,74 @@
+"""
+Mistral AI backend
+"""
+
+from collections.abc import AsyncIterator
+
+import httpx
+from mistralai import Mistral
+
+from app.llm.base import LLMBackend
+
+
+class MistralBackend(LLMBackend):
+    """Chat completions through the Mistral SDK"""
+
+    name = "mistral"
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        server_url: str | None = None,
+        async_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """
+        Initialize Mistral client
+
+        Args:
+            api_key: Mistral API key
+            model: Model name
+            server_url: Alternative API base URL (e.g. the fake LLM server)
+            async_client: HTTP client to use instead of the SDK default
+        """
+        self.model = model
+        self._http_client = async_client or httpx.AsyncClient()
+        self.client = Mistral(
+            api_key=api_key,
+            server_url=server_url,
+            async_client=self._http_client,
+        )
+
+    async def complete(self, messages: list[dict[str, str]]) -> str | None:
+        """Run a JSON mode chat completion"""
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+        )
+        if response is None or not response.choices:
+            return None
+
+        content = response.choices[0].message.content
+        return content if isinstance(content, str) else None
+
+    async def stream(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """Run a streaming JSON mode chat completion and yield content deltas"""
+        stream = await self.client.chat.stream_async(
+            model=self.model,
+            messages=messages,
+            response_format={"type": "json_object"},
+        )
+        if stream is None:
+            return
+
+        async for event in stream:
+            if not event.data.choices:
+                continue
+            content = event.data.choices[0].delta.content
+            if isinstance(content, str) and content:
+                yield content
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool"""
+        await self._http_client.aclose()
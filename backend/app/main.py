@@ -12,19 +12,26 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api import health
 from app.api.v1 import auth, recipes, users
 from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.database import Base, async_engine, engine
+from app.services.ai_service import ai_service
+from app.services.prefetch_service import recipe_prefetcher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> Any:
     """
     Application lifespan manager
-    Creates database tables on startup
+    Creates database tables and starts background workers on startup
     """
     # Startup: Create database tables
     Base.metadata.create_all(bind=engine)
+    if settings.RECIPE_PREFETCH_ENABLED:
+        recipe_prefetcher.start()
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: stop background workers, then close connection pools
+    await recipe_prefetcher.stop()
+    await ai_service.backend.aclose()
+    await async_engine.dispose()
 
 
 # Create FastAPI application
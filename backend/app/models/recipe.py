@@ -3,12 +3,82 @@ Recipe model for DishDash
 Stores recipe information from AI generation and user saves
 """
 
+import hashlib
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.utils.text import normalize_name, normalize_terms
+
+
+def recipe_lookup_key(name: str, dietary_restrictions: list[str] | None = None) -> str:
+    """
+    Build the key used to find a stored recipe by name and restrictions
+
+    Names differing only in casing or whitespace share a key. Restrictions
+    are reduced to a short fingerprint that ignores order, casing and
+    duplicates; no restrictions gives an empty fingerprint.
+
+    Args:
+        name: Recipe name
+        dietary_restrictions: Restrictions the recipe was made for (see
+            recipe_restriction_terms)
+
+    Returns:
+        Key of the form "<canonical name>|<fingerprint>"
+
+    Example:
+        recipe_lookup_key("  Chicken  Pasta ")  # "chicken pasta|"
+    """
+    return f"{normalize_name(name)}|{restriction_fingerprint(dietary_restrictions)}"
+
+
+def restriction_fingerprint(dietary_restrictions: list[str] | None) -> str:
+    """
+    Fingerprint of restriction terms, the part of a lookup key after "|"
+
+    Args:
+        dietary_restrictions: Restriction terms (see recipe_restriction_terms)
+
+    Returns:
+        16 hex characters, or "" when there are no terms
+    """
+    terms = normalize_terms(dietary_restrictions)
+    return hashlib.sha1(",".join(terms).encode()).hexdigest()[:16] if terms else ""
+
+
+def recipe_restriction_terms(
+    dietary_restrictions: list[str] | None, allergies: list[str] | None
+) -> list[str] | None:
+    """
+    Combine the restrictions and allergies a recipe is generated under
+
+    Allergies become "allergy:<name>" terms, so they are kept apart from a
+    restriction of the same name in lookup keys.
+
+    Args:
+        dietary_restrictions: Dietary restrictions
+        allergies: Allergies
+
+    Returns:
+        Terms for recipe_lookup_key, or None if there are none
+
+    Example:
+        recipe_restriction_terms(["vegan"], ["nuts"])  # ["vegan", "allergy:nuts"]
+    """
+    terms = [
+        *(dietary_restrictions or []),
+        *(f"allergy:{allergy.strip()}" for allergy in allergies or [] if allergy.strip()),
+    ]
+    return terms or None
+
+
+def _default_lookup_key(context: Any) -> str:
+    """Lookup key for recipes inserted without one (no restrictions)"""
+    return recipe_lookup_key(context.get_current_parameters()["name"])
 
 
 class Recipe(Base):
@@ -26,6 +96,8 @@ class Recipe(Base):
     prep_time = Column(Integer, nullable=True)  # in minutes
     difficulty = Column(Integer, nullable=True)  # 1=easy, 10=expert
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Normalized name + restrictions fingerprint, see recipe_lookup_key
+    lookup_key = Column(String(220), nullable=True, index=True, default=_default_lookup_key)
 
     # Relationships
     saved_by = relationship("SavedRecipe", back_populates="recipe", cascade="all, delete-orphan")
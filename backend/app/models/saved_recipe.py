@@ -5,7 +5,7 @@ Many-to-many relationship between users and recipes
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -25,8 +25,12 @@ class SavedRecipe(Base):
     user = relationship("User", back_populates="saved_recipes")
     recipe = relationship("Recipe", back_populates="saved_by")
 
-    # Unique constraint: a user can save a recipe only once
-    __table_args__ = (UniqueConstraint("user_id", "recipe_id", name="uix_user_recipe"),)
+    __table_args__ = (
+        # Unique constraint: a user can save a recipe only once
+        UniqueConstraint("user_id", "recipe_id", name="uix_user_recipe"),
+        # Serves the paginated saved list: WHERE user_id ORDER BY saved_at DESC, id
+        Index("ix_saved_recipes_user_saved_at", "user_id", saved_at.desc(), "id"),
+    )
 
     def __repr__(self) -> str:
         return f"<SavedRecipe(user_id={self.user_id}, recipe_id={self.recipe_id})>"
@@ -6,12 +6,21 @@ Exports all Pydantic schemas for easy import
 from app.schemas.auth import LoginRequest, TokenData, TokenResponse
 from app.schemas.recipe import (
     RecipeCreate,
+    RecipeDetailsBatchRequest,
+    RecipeDetailsBatchResponse,
     RecipeDetailsRequest,
     RecipeGenerateRequest,
     RecipeListItem,
     RecipeListResponse,
     RecipeResponse,
+    RecipeSummary,
+    SavedRecipeBulkRequest,
+    SavedRecipeBulkResponse,
+    SavedRecipeBulkResult,
+    SavedRecipePage,
     SavedRecipeResponse,
+    SavedRecipeSummary,
+    SavedRecipeSummaryPage,
 )
 from app.schemas.user import (
     UserCreate,
@@ -37,7 +46,16 @@ __all__ = [
     "RecipeResponse",
     "RecipeGenerateRequest",
     "RecipeDetailsRequest",
+    "RecipeDetailsBatchRequest",
+    "RecipeDetailsBatchResponse",
     "RecipeListItem",
     "RecipeListResponse",
     "SavedRecipeResponse",
+    "SavedRecipePage",
+    "RecipeSummary",
+    "SavedRecipeSummary",
+    "SavedRecipeSummaryPage",
+    "SavedRecipeBulkRequest",
+    "SavedRecipeBulkResult",
+    "SavedRecipeBulkResponse",
 ]
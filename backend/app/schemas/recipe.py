@@ -3,8 +3,14 @@ Recipe schemas for request/response validation
 """
 
 from datetime import datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Same as the recipes.name column; the lookup key column leaves room for the fingerprint
+RECIPE_NAME_MAX_LENGTH = 200
+
+RequestedRecipeName = Annotated[str, Field(max_length=RECIPE_NAME_MAX_LENGTH)]
 
 
 class RecipeIngredient(BaseModel):
@@ -22,20 +28,35 @@ class RecipeGenerateRequest(BaseModel):
     difficulty: int | None = Field(default=None, ge=1, le=10, description="Difficulty level (1-10)")
     servings: int = Field(default=2, ge=1, description="Number of servings")
     dietary_restrictions: list[str] | None = Field(default=None, description="Dietary restrictions")
+    allergies: list[str] | None = Field(default=None, description="Allergies")
 
 
 class RecipeDetailsRequest(BaseModel):
     """Request to get detailed recipe from recipe name using AI"""
 
-    recipe_name: str = Field(..., description="Recipe name to get details for")
+    recipe_name: str = Field(
+        ..., max_length=RECIPE_NAME_MAX_LENGTH, description="Recipe name to get details for"
+    )
+    servings: int = Field(default=2, ge=1, description="Number of servings")
+    dietary_restrictions: list[str] | None = Field(default=None, description="Dietary restrictions")
+    allergies: list[str] | None = Field(default=None, description="Allergies")
+
+
+class RecipeDetailsBatchRequest(BaseModel):
+    """Request to get detailed recipes for several recipe names at once"""
+
+    recipe_names: list[RequestedRecipeName] = Field(
+        ..., min_length=1, max_length=20, description="Recipe names to get details for"
+    )
     servings: int = Field(default=2, ge=1, description="Number of servings")
     dietary_restrictions: list[str] | None = Field(default=None, description="Dietary restrictions")
+    allergies: list[str] | None = Field(default=None, description="Allergies")
 
 
 class RecipeBase(BaseModel):
     """Base recipe schema"""
 
-    name: str = Field(..., max_length=200, description="Recipe name")
+    name: str = Field(..., max_length=RECIPE_NAME_MAX_LENGTH, description="Recipe name")
     description: str | None = Field(default=None, description="Recipe description")
     servings: int = Field(default=1, ge=1, description="Number of servings")
     ingredients: list[RecipeIngredient] = Field(..., description="List of ingredients")
@@ -60,6 +81,13 @@ class RecipeResponse(RecipeBase):
     model_config = {"from_attributes": True}
 
 
+class RecipeDetailsBatchResponse(BaseModel):
+    """Response with detailed recipes for a batch of names"""
+
+    recipes: list[RecipeResponse] = Field(..., description="Detailed recipes, in request order")
+    failed: list[str] = Field(default_factory=list, description="Names that could not be generated")
+
+
 class RecipeListItem(BaseModel):
     """Schema for recipe list item (simplified)"""
 
@@ -73,6 +101,10 @@ class RecipeListResponse(BaseModel):
     """Response with list of recipe suggestions"""
 
     recipes: list[RecipeListItem] = Field(..., description="List of recipe suggestions")
+    degraded: bool = Field(
+        default=False,
+        description="True when the AI is unavailable and suggestions come from stored recipes",
+    )
 
 
 class SavedRecipeResponse(BaseModel):
@@ -85,3 +117,65 @@ class SavedRecipeResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+
+class RecipeSummary(RecipeListItem):
+    """Schema for the recipe fields shown in saved recipe lists"""
+
+    id: int
+
+    model_config = {"from_attributes": True}
+
+
+class SavedRecipeSummary(BaseModel):
+    """Schema for saved recipe in summary view (no ingredients or instructions)"""
+
+    id: int
+    user_id: int
+    recipe: RecipeSummary
+    saved_at: datetime
+
+
+class SavedRecipePage(BaseModel):
+    """Schema for one page of saved recipes"""
+
+    items: list[SavedRecipeResponse]
+    next_cursor: str | None = None  # Pass back as ?cursor= to get the next page
+
+
+
+class SavedRecipeSummaryPage(BaseModel):
+    """Schema for one page of saved recipes in summary view"""
+
+    items: list[SavedRecipeSummary]
+    next_cursor: str | None = None  # Pass back as ?cursor= to get the next page
+
+
+class SavedRecipeBulkRequest(BaseModel):
+    """Request to save and unsave several recipes at once"""
+
+    save: list[int] = Field(default_factory=list, max_length=100, description="Recipe IDs to save")
+    unsave: list[int] = Field(
+        default_factory=list, max_length=100, description="Recipe IDs to unsave"
+    )
+
+    @model_validator(mode="after")  # type: ignore[misc]
+    def check_disjoint(self) -> "SavedRecipeBulkRequest":
+        """Reject recipe IDs that are both saved and unsaved"""
+        both = set(self.save) & set(self.unsave)
+        if both:
+            raise ValueError(f"Recipe IDs in both save and unsave: {sorted(both)}")
+        return self
+
+
+class SavedRecipeBulkResult(BaseModel):
+    """Outcome of one recipe ID in a bulk request"""
+
+    recipe_id: int
+    action: Literal["save", "unsave"]
+    status: Literal["saved", "already_saved", "unsaved", "not_saved", "not_found"]
+
+
+class SavedRecipeBulkResponse(BaseModel):
+    """Response with the outcome of each recipe ID, in request order"""
+
+    results: list[SavedRecipeBulkResult]
@@ -3,16 +3,34 @@ Services module
 Exports all business logic services
 """
 
-from app.services.ai_service import AIService, ai_service
+from app.services.ai_service import (
+    AICircuitOpenError,
+    AIService,
+    AIServiceUnavailableError,
+    ai_service,
+)
 from app.services.auth_service import (
+    UserIdentity,
     authenticate_user,
     get_or_create_user,
     get_user_by_username,
+    get_user_identity,
+)
+from app.services.recipe_generation_service import (
+    generate_recipe_details_once,
+    suggest_stored_recipes,
 )
 from app.services.recipe_service import (
+    bulk_update_saved_recipes,
     create_recipe,
+    create_recipes,
+    ensure_recipe_saved_for_user,
+    find_recipes_by_ingredients,
     get_recipe_by_id,
+    get_recipe_by_lookup_key,
     get_recipe_by_name,
+    get_recipes_by_lookup_keys,
+    get_saved_recipe_summaries_for_user,
     get_saved_recipes_for_user,
     save_recipe_for_user,
     unsave_recipe_for_user,
@@ -20,17 +38,31 @@ from app.services.recipe_service import (
 
 __all__ = [
     # AI Service
+    "AICircuitOpenError",
     "AIService",
+    "AIServiceUnavailableError",
     "ai_service",
     # Auth Service
     "authenticate_user",
     "get_or_create_user",
     "get_user_by_username",
+    "get_user_identity",
+    "UserIdentity",
+    # Recipe Generation Service
+    "generate_recipe_details_once",
+    "suggest_stored_recipes",
     # Recipe Service
     "create_recipe",
+    "create_recipes",
+    "find_recipes_by_ingredients",
     "get_recipe_by_id",
     "get_recipe_by_name",
+    "get_recipe_by_lookup_key",
+    "get_recipes_by_lookup_keys",
     "save_recipe_for_user",
+    "bulk_update_saved_recipes",
+    "ensure_recipe_saved_for_user",
     "unsave_recipe_for_user",
     "get_saved_recipes_for_user",
+    "get_saved_recipe_summaries_for_user",
 ]
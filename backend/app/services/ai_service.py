@@ -1,57 +1,274 @@
 """
 AI service for recipe generation using Mistral AI
+The LLM provider is pluggable (see app.llm)
 """
 
 import json
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
 
-from mistralai import Mistral
+import httpx
+from mistralai.models import SDKError
 
 from app.core.config import settings
+from app.llm import (
+    FakeLLMBackend,
+    FakeLLMConfig,
+    LLMBackend,
+    LLMBackendError,
+    MistralBackend,
+)
 from app.schemas.recipe import (
     RecipeDetailsRequest,
     RecipeGenerateRequest,
     RecipeListItem,
 )
+from app.utils.cache import TTLCache
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.json_stream import IncrementalJSONParser
+from app.utils.limiter import AdaptiveConcurrencyLimiter, LimiterRejectedError
+from app.utils.singleflight import SingleFlight
+from app.utils.text import normalize_name, normalize_terms
+
+T = TypeVar("T")
+
+
+class AIServiceUnavailableError(Exception):
+    """Raised when the AI provider is overloaded or no call slot is available"""
+
+
+class AICircuitOpenError(AIServiceUnavailableError):
+    """Raised without calling the AI provider while its circuit breaker is open"""
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an error means the AI provider is rate limiting or overloaded"""
+    if isinstance(error, SDKError | LLMBackendError):
+        status_code: int = error.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, httpx.TimeoutException)
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """
+    Whether an error counts against the AI provider's circuit breaker
+
+    Overload errors, plus transport errors such as a refused connection:
+    those are not retried, but mean the provider cannot be reached.
+    """
+    return is_overload_error(error) or isinstance(error, httpx.TransportError)
+
+
+def recipe_list_cache_key(request: RecipeGenerateRequest) -> str:
+    """
+    Build a canonical cache key for a recipe generation request
+
+    Requests that only differ in ingredient casing, spacing, order or
+    duplicates map to the same key.
+
+    Args:
+        request: Recipe generation request
+
+    Returns:
+        Stable string key
+    """
+    return json.dumps(
+        {
+            "ingredients": normalize_terms(request.ingredients),
+            "servings": request.servings,
+            "cooking_time": request.cooking_time,
+            "difficulty": request.difficulty,
+            "dietary_restrictions": normalize_terms(request.dietary_restrictions),
+            "allergies": normalize_terms(request.allergies),
+        },
+        sort_keys=True,
+    )
+
+
+def recipe_details_key(request: RecipeDetailsRequest) -> str:
+    """
+    Build a canonical key for a recipe details request
+
+    Args:
+        request: Recipe details request
+
+    Returns:
+        Stable string key
+    """
+    return json.dumps(
+        {
+            "recipe_name": normalize_name(request.recipe_name),
+            "servings": request.servings,
+            "dietary_restrictions": normalize_terms(request.dietary_restrictions),
+            "allergies": normalize_terms(request.allergies),
+        },
+        sort_keys=True,
+    )
+
+
+def normalize_ingredient(ingredient: Any) -> dict[str, Any]:
+    """Convert a raw ingredient to a {"name", "quantity"} dict"""
+    if isinstance(ingredient, dict):
+        return ingredient
+    # If ingredient is just a string, assume it's the name
+    return {"name": str(ingredient), "quantity": "as needed"}
+
+
+def normalize_recipe_details(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a raw recipe details payload from the AI
+
+    Args:
+        data: Parsed AI response
+
+    Returns:
+        Same payload with instructions as text and ingredients as dicts
+    """
+    # Convert instructions list to string if needed
+    if 'instructions' in data and isinstance(data['instructions'], list):
+        data['instructions'] = '\n'.join(str(step) for step in data['instructions'])
+
+    # Convert ingredients list to RecipeIngredient objects if needed
+    if 'ingredients' in data and isinstance(data['ingredients'], list):
+        data['ingredients'] = [
+            normalize_ingredient(ingredient)
+            for ingredient in data['ingredients']
+            if isinstance(ingredient, dict | str)
+        ]
+
+    return data
+
+
+def create_llm_backend() -> LLMBackend:
+    """
+    Build the LLM backend selected by the LLM_BACKEND setting
+
+    Returns:
+        Mistral backend ("mistral", the default) or in-process fake ("fake")
+
+    Raises:
+        ValueError: If LLM_BACKEND is unknown
+    """
+    if settings.LLM_BACKEND == "mistral":
+        # Dedicated async HTTP pool so many generations can be in flight at once
+        # without blocking the event loop
+        return MistralBackend(
+            api_key=settings.MISTRAL_API_KEY,
+            model=settings.LLM_MODEL,
+            server_url=settings.MISTRAL_SERVER_URL,
+            async_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.AI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_MAX_CONNECTIONS,
+                ),
+                timeout=settings.AI_TIMEOUT_SECONDS,
+            ),
+        )
+
+    if settings.LLM_BACKEND == "fake":
+        return FakeLLMBackend(
+            FakeLLMConfig(
+                latency_ms=settings.FAKE_LLM_LATENCY_MS,
+                latency_distribution=settings.FAKE_LLM_LATENCY_DISTRIBUTION,
+                error_rate=settings.FAKE_LLM_ERROR_RATE,
+                tokens_per_second=settings.FAKE_LLM_TOKENS_PER_SECOND,
+                seed=settings.FAKE_LLM_SEED,
+            )
+        )
+
+    raise ValueError(f"Unknown LLM_BACKEND: {settings.LLM_BACKEND}")
 
 
 class AIService:
-    """Service for interacting with Mistral AI"""
+    """Service for recipe generation through an LLM backend (Mistral AI by default)"""
+
+    def __init__(self, backend: LLMBackend | None = None) -> None:
+        """
+        Initialize the LLM backend
+
+        Args:
+            backend: Backend to use (default: selected by the LLM_BACKEND setting)
+        """
+        self.backend = backend or create_llm_backend()
+
+        # Identical generation requests are served from memory
+        self.recipe_list_cache: TTLCache[str, tuple[RecipeListItem, ...]] = TTLCache(
+            max_size=settings.RECIPE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RECIPE_CACHE_TTL_SECONDS,
+        )
 
-    def __init__(self) -> None:
-        """Initialize Mistral client"""
-        self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
-        self.model = "mistral-large-latest"
+        # Shared AIMD window, wait queue and retry policy for all LLM calls
+        self.limiter = AdaptiveConcurrencyLimiter(
+            is_overload=is_overload_error,
+            initial_limit=settings.AI_CONCURRENCY_INITIAL,
+            min_limit=settings.AI_CONCURRENCY_MIN,
+            max_limit=settings.AI_CONCURRENCY_MAX,
+            max_queue=settings.AI_QUEUE_MAX_SIZE,
+            queue_timeout=settings.AI_QUEUE_TIMEOUT_SECONDS,
+            max_retries=settings.AI_MAX_RETRIES,
+            retry_base_delay=settings.AI_RETRY_BASE_DELAY_SECONDS,
+            retry_max_delay=settings.AI_RETRY_MAX_DELAY_SECONDS,
+        )
+
+        # Fail fast while the provider keeps failing or answering too slowly
+        self.breaker = CircuitBreaker(
+            window_size=settings.AI_BREAKER_WINDOW_SIZE,
+            min_calls=settings.AI_BREAKER_MIN_CALLS,
+            failure_rate_threshold=settings.AI_BREAKER_FAILURE_RATE,
+            slow_call_seconds=settings.AI_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate_threshold=settings.AI_BREAKER_SLOW_CALL_RATE,
+            open_seconds=settings.AI_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=settings.AI_BREAKER_HALF_OPEN_CALLS,
+            probe_timeout_seconds=settings.AI_BREAKER_PROBE_TIMEOUT_SECONDS,
+        )
 
-    def generate_recipe_list(self, request: RecipeGenerateRequest) -> list[RecipeListItem]:
+        # Concurrent identical requests share one in-flight LLM call
+        self.recipe_list_flight: SingleFlight[list[RecipeListItem]] = SingleFlight()
+        self.recipe_details_flight: SingleFlight[dict[str, Any]] = SingleFlight()
+
+    async def generate_recipe_list(self, request: RecipeGenerateRequest) -> list[RecipeListItem]:
         """
         Generate a list of recipe suggestions based on available ingredients
 
+        Results are cached under the normalized request (see recipe_list_cache_key).
+
         Args:
             request: Recipe generation request with ingredients and preferences
 
         Returns:
             List of recipe suggestions
         """
-        # Build prompt
-        prompt = self._build_recipe_list_prompt(request)
-
-        # Call Mistral AI
-        response = self.client.chat.complete(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional chef assistant. Generate recipe suggestions in JSON format.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
+        cache_key = recipe_list_cache_key(request)
+        cached = self.recipe_list_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        recipes = await self.recipe_list_flight.do(
+            cache_key, lambda: self._generate_and_cache_recipe_list(cache_key, request)
         )
+        return list(recipes)
+
+    async def _generate_and_cache_recipe_list(
+        self, cache_key: str, request: RecipeGenerateRequest
+    ) -> list[RecipeListItem]:
+        """Generate recipe suggestions and store non-empty results in the cache"""
+        recipes = await self._request_recipe_list(request)
+
+        # Empty results are not cached so a transient bad answer is retried
+        if recipes:
+            self.recipe_list_cache.set(cache_key, tuple(recipes))
+
+        return recipes
+
+    async def _request_recipe_list(self, request: RecipeGenerateRequest) -> list[RecipeListItem]:
+        """Call the LLM for recipe suggestions and parse the response"""
+        # Call the LLM
+        messages = self._build_recipe_list_messages(request)
+        content = await self._call(lambda: self.backend.complete(messages))
 
         # Parse response
         try:
-            content = response.choices[0].message.content
             if content is None:
                 return []
 
@@ -59,73 +276,224 @@ class AIService:
             recipes_data = data.get("recipes", [])
 
             # Convert to RecipeListItem objects
-            recipes: list[RecipeListItem] = []
-            for recipe_data in recipes_data:
-                recipes.append(
-                    RecipeListItem(
-                        name=recipe_data.get("name", ""),
-                        description=recipe_data.get("description"),
-                        cooking_time=recipe_data.get("cooking_time"),
-                        difficulty=recipe_data.get("difficulty"),
-                    )
-                )
-            return recipes
+            return [self._to_recipe_list_item(recipe_data) for recipe_data in recipes_data]
         except (json.JSONDecodeError, KeyError, IndexError):
             return []
 
-    def generate_recipe_details(self, request: RecipeDetailsRequest) -> dict[str, Any]:
+    async def stream_recipe_list(
+        self, request: RecipeGenerateRequest
+    ) -> AsyncIterator[RecipeListItem]:
+        """
+        Stream recipe suggestions one by one as the LLM produces them
+
+        Each recipe is yielded as soon as its JSON object is complete in the
+        token stream. Cached results are replayed, and a complete stream is
+        stored in the same cache as generate_recipe_list.
+
+        Args:
+            request: Recipe generation request with ingredients and preferences
+
+        Yields:
+            Recipe suggestions in generation order
+        """
+        cache_key = recipe_list_cache_key(request)
+        cached = self.recipe_list_cache.get(cache_key)
+        if cached is not None:
+            for recipe in cached:
+                yield recipe
+            return
+
+        parser = IncrementalJSONParser()
+        recipes: list[RecipeListItem] = []
+        async for chunk in self._stream_completion(self._build_recipe_list_messages(request)):
+            for key, value in parser.feed(chunk):
+                if key == "recipes" and isinstance(value, dict):
+                    recipe = self._to_recipe_list_item(value)
+                    recipes.append(recipe)
+                    yield recipe
+
+        if recipes:
+            self.recipe_list_cache.set(cache_key, tuple(recipes))
+
+    def _before_call(self) -> None:
+        """Ask the circuit breaker for permission to call the provider"""
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as e:
+            raise AICircuitOpenError(str(e)) from e
+
+    async def _call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an LLM call through the circuit breaker and concurrency limiter
+
+        Rate limit (429), server (5xx) and timeout errors shrink the window
+        and are retried with jittered exponential backoff. Calls that still
+        fail, fail to reach the provider, or whose provider attempt takes
+        longer than AI_BREAKER_SLOW_CALL_SECONDS count against the circuit
+        breaker. Time spent in the limiter queue and retry backoff does not.
+
+        Raises:
+            AICircuitOpenError: If the circuit breaker is open
+            AIServiceUnavailableError: If no slot is available or the provider
+                stays overloaded after all retries
+        """
+        self._before_call()
+        attempt_seconds = 0.0
+
+        async def timed_attempt() -> T:
+            # Runs once a limiter slot is held, so queueing is not timed
+            nonlocal attempt_seconds
+            started = time.monotonic()
+            try:
+                return await fn()
+            finally:
+                attempt_seconds = time.monotonic() - started
+
+        try:
+            result = await self.limiter.call(timed_attempt)
+        except LimiterRejectedError as e:
+            # Our own queue is full: says nothing about the provider's health
+            self.breaker.record_ignored()
+            raise AIServiceUnavailableError(str(e)) from e
+        except Exception as e:
+            if is_overload_error(e):
+                self.breaker.record_failure()
+                raise AIServiceUnavailableError("AI provider is overloaded, please retry later") from e
+            if is_provider_failure(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_ignored()
+            raise
+        except BaseException:
+            self.breaker.record_ignored()
+            raise
+
+        self.breaker.record_success(attempt_seconds)
+        return result
+
+    async def _stream_completion(self, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        """
+        Call the LLM in streaming JSON mode and yield content deltas
+
+        The stream holds one limiter slot until it ends. Streams are not
+        retried, since content may already have been sent to the client.
+        The circuit breaker judges the stream by its time to first chunk.
+        """
+        self._before_call()
+        try:
+            epoch = await self.limiter.acquire()
+        except LimiterRejectedError as e:
+            # Our own queue is full: says nothing about the provider's health
+            self.breaker.record_ignored()
+            raise AIServiceUnavailableError(str(e)) from e
+        except BaseException:
+            # Cancelled while queued (e.g. the client disconnected): free the probe slot
+            self.breaker.record_ignored()
+            raise
+
+        started = time.monotonic()
+        overloaded = False
+        failed = False
+        succeeded = False
+        first_chunk_after: float | None = None
+        try:
+            async for content in self.backend.stream(messages):
+                if first_chunk_after is None:
+                    first_chunk_after = time.monotonic() - started
+                yield content
+            succeeded = True
+        except Exception as e:
+            overloaded = is_overload_error(e)
+            failed = is_provider_failure(e)
+            raise
+        finally:
+            self.limiter.release(overloaded=overloaded, succeeded=succeeded, epoch=epoch)
+            if failed:
+                self.breaker.record_failure()
+            elif succeeded or first_chunk_after is not None:
+                elapsed = time.monotonic() - started
+                self.breaker.record_success(
+                    first_chunk_after if first_chunk_after is not None else elapsed
+                )
+            else:
+                self.breaker.record_ignored()
+
+    @staticmethod
+    def _to_recipe_list_item(recipe_data: dict[str, Any]) -> RecipeListItem:
+        """Convert a raw recipe suggestion to a RecipeListItem"""
+        return RecipeListItem(
+            name=recipe_data.get("name", ""),
+            description=recipe_data.get("description"),
+            cooking_time=recipe_data.get("cooking_time"),
+            difficulty=recipe_data.get("difficulty"),
+        )
+
+    async def generate_recipe_details(self, request: RecipeDetailsRequest) -> dict[str, Any]:
         """
         Generate detailed recipe instructions for a specific recipe
 
+        Concurrent identical requests (see recipe_details_key) share one call.
+
         Args:
             request: Recipe details request with recipe name and preferences
 
         Returns:
             Detailed recipe with ingredients and instructions
         """
-        # Build prompt
-        prompt = self._build_recipe_details_prompt(request)
-
-        # Call Mistral AI
-        response = self.client.chat.complete(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional chef. Provide detailed recipes in JSON format.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            response_format={"type": "json_object"},
+        data = await self.recipe_details_flight.do(
+            recipe_details_key(request), lambda: self._request_recipe_details(request)
         )
+        return dict(data)
+
+    async def _request_recipe_details(self, request: RecipeDetailsRequest) -> dict[str, Any]:
+        """Call the LLM for a detailed recipe and parse the response"""
+        # Call the LLM
+        messages = self._build_recipe_details_messages(request)
+        content = await self._call(lambda: self.backend.complete(messages))
 
         # Parse response
         try:
-            content = response.choices[0].message.content
             if content is None:
                 return {}
 
             data: dict[str, Any] = json.loads(content)
-
-            # Convert instructions list to string if needed
-            if 'instructions' in data and isinstance(data['instructions'], list):
-                data['instructions'] = '\n'.join(data['instructions'])
-
-            # Convert ingredients list to RecipeIngredient objects if needed
-            if 'ingredients' in data and isinstance(data['ingredients'], list):
-                formatted_ingredients = []
-                for ingredient in data['ingredients']:
-                    if isinstance(ingredient, dict):
-                        formatted_ingredients.append(ingredient)
-                    elif isinstance(ingredient, str):
-                        # If ingredient is just a string, assume it's the name
-                        formatted_ingredients.append({"name": ingredient, "quantity": "as needed"})
-                data['ingredients'] = formatted_ingredients
-
-            return data
+            return normalize_recipe_details(data)
         except (json.JSONDecodeError, KeyError, IndexError):
             return {}
 
+    async def stream_recipe_details(
+        self, request: RecipeDetailsRequest
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Stream a detailed recipe field by field as the LLM produces it
+
+        The prompt asks for summary fields first, then ingredients, then
+        instruction steps, so callers can render them progressively.
+
+        Args:
+            request: Recipe details request with recipe name and preferences
+
+        Yields:
+            (field, value) pairs; "ingredients" and "instructions" are
+            yielded once per ingredient and per step
+        """
+        parser = IncrementalJSONParser()
+        async for chunk in self._stream_completion(self._build_recipe_details_messages(request)):
+            for key, value in parser.feed(chunk):
+                if key == "ingredients":
+                    value = normalize_ingredient(value)
+                yield key, value
+
+    def _build_recipe_list_messages(self, request: RecipeGenerateRequest) -> list[dict[str, str]]:
+        """Build chat messages for recipe list generation"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional chef assistant. Generate recipe suggestions in JSON format.",
+            },
+            {"role": "user", "content": self._build_recipe_list_prompt(request)},
+        ]
+
     def _build_recipe_list_prompt(self, request: RecipeGenerateRequest) -> str:
         """Build prompt for recipe list generation"""
         ingredients_str = ", ".join(request.ingredients)
@@ -145,6 +513,10 @@ Requirements:
             restrictions = ", ".join(request.dietary_restrictions)
             prompt += f"\n- Dietary restrictions: {restrictions}"
 
+        if request.allergies:
+            allergies = ", ".join(request.allergies)
+            prompt += f"\n- Allergies (must not contain): {allergies}"
+
 
         prompt += """
 
@@ -162,6 +534,16 @@ Return a JSON object with this structure (exactly 6 recipes):
 
         return prompt
 
+    def _build_recipe_details_messages(self, request: RecipeDetailsRequest) -> list[dict[str, str]]:
+        """Build chat messages for recipe details generation"""
+        return [
+            {
+                "role": "system",
+                "content": "You are a professional chef. Provide detailed recipes in JSON format.",
+            },
+            {"role": "user", "content": self._build_recipe_details_prompt(request)},
+        ]
+
     def _build_recipe_details_prompt(self, request: RecipeDetailsRequest) -> str:
         """Build prompt for recipe details generation"""
         prompt = f"""Provide a detailed recipe for: {request.recipe_name}
@@ -173,20 +555,24 @@ Requirements:
             restrictions = ", ".join(request.dietary_restrictions)
             prompt += f"\n- Dietary restrictions: {restrictions}"
 
+        if request.allergies:
+            allergies = ", ".join(request.allergies)
+            prompt += f"\n- Allergies (must not contain): {allergies}"
+
         prompt += """
 
-Return a JSON object with this structure:
+Return a JSON object with this structure and key order:
 {
   "name": "Recipe Name",
   "description": "Detailed description",
   "servings": 2,
+  "cooking_time": 30,
+  "prep_time": 15,
+  "difficulty": 5,
   "ingredients": [
     {"name": "Ingredient name", "quantity": "Amount with unit"}
   ],
-  "instructions": "Step by step cooking instructions",
-  "cooking_time": 30,
-  "prep_time": 15,
-  "difficulty": 5
+  "instructions": ["First step", "Second step"]
 }"""
 
         return prompt
@@ -3,20 +3,83 @@ Authentication service
 Handles user login with simple username authentication
 """
 
-from datetime import timedelta
-from typing import cast
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Delete, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dialect_insert
 from app.core.security import create_access_token
 from app.models.user import User
+from app.utils.cache import TTLCache
 
 
-def get_or_create_user(db: Session, username: str) -> User:
+@dataclass(frozen=True)
+class UserIdentity:
+    """Columns of a user, cheap to cache and to share between requests"""
+
+    id: int
+    username: str
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserIdentity":
+        """Copy the columns of a loaded user"""
+        return cls(
+            id=cast(int, user.id),
+            username=cast(str, user.username),
+            created_at=cast(datetime, user.created_at),
+        )
+
+    def to_user(self) -> User:
+        """Build a transient User, attached to no session, for one request"""
+        return User(id=self.id, username=self.username, created_at=self.created_at)
+
+
+# Username -> identity of users known to exist
+user_identity_cache: TTLCache[str, UserIdentity] = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+
+def _forget_user(mapper: Any, connection: Any, target: User) -> None:
+    """Drop a deleted user from the identity cache"""
+    user_identity_cache.delete(cast(str, target.username))
+
+
+event.listen(User, "after_delete", _forget_user)
+
+
+def _forget_users_after_statement(
+    conn: Any, clauseelement: Any, multiparams: Any, params: Any, execution_options: Any, result: Any
+) -> None:
+    """
+    Empty the identity cache after any DELETE statement on users
+
+    Core and bulk ORM deletes (delete(User)) do not fire the mapper event
+    above and do not say which users they removed.
+    """
+    if isinstance(clauseelement, Delete) and clauseelement.table.name == User.__tablename__:
+        user_identity_cache.clear()
+
+
+# On the Engine class, so the sync engine and the async engine's sync_engine both report
+event.listen(Engine, "after_execute", _forget_users_after_statement)
+
+
+async def get_or_create_user(db: AsyncSession, username: str) -> User:
     """
     Get user by username or create if doesn't exist
 
+    Runs a single INSERT ... ON CONFLICT (username) DO UPDATE ... RETURNING,
+    so concurrent first logins for the same username both succeed and get
+    the same row.
+
     Args:
         db: Database session
         username: Username to find or create
@@ -24,21 +87,17 @@ def get_or_create_user(db: Session, username: str) -> User:
     Returns:
         User object
     """
-    # Try to find existing user
-    existing_user = db.query(User).filter(User.username == username).first()
+    # The no-op update makes RETURNING yield the existing row on conflict
+    statement = dialect_insert(db, User).values(username=username)
+    statement = statement.on_conflict_do_update(
+        index_elements=["username"], set_={"username": statement.excluded.username}
+    ).returning(User)
+    user = await db.scalar(statement, execution_options={"populate_existing": True})
+    await db.commit()
+    return cast(User, user)
 
-    # Create new user if doesn't exist
-    if not existing_user:
-        new_user = User(username=username)
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-        return new_user
 
-    return cast(User, existing_user)
-
-
-def authenticate_user(db: Session, username: str) -> tuple[User, str]:
+async def authenticate_user(db: AsyncSession, username: str) -> tuple[User, str]:
     """
     Authenticate user with username (no password required)
 
@@ -50,7 +109,9 @@ def authenticate_user(db: Session, username: str) -> tuple[User, str]:
         Tuple of (User object, JWT token)
     """
     # Get or create user
-    user = get_or_create_user(db, username)
+    user = await get_or_create_user(db, username)
+    # The client's next requests authenticate without a user query
+    user_identity_cache.set(cast(str, user.username), UserIdentity.from_user(user))
 
     # Create JWT token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -61,7 +122,7 @@ def authenticate_user(db: Session, username: str) -> tuple[User, str]:
     return user, access_token
 
 
-def get_user_by_username(db: Session, username: str) -> User | None:
+async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     """
     Get user by username
 
@@ -72,5 +133,32 @@ def get_user_by_username(db: Session, username: str) -> User | None:
     Returns:
         User object or None if not found
     """
-    result = db.query(User).filter(User.username == username).first()
+    result = await db.scalar(select(User).where(User.username == username).limit(1))
     return cast(User | None, result)
+
+
+async def get_user_identity(username: str) -> UserIdentity | None:
+    """
+    Get the identity of a user, from the cache or else the database
+
+    Unknown usernames are not cached, so a user created afterwards is
+    found on the next call. The database lookup uses a short-lived session.
+
+    Args:
+        username: Username from a verified token
+
+    Returns:
+        User identity or None if the user does not exist
+    """
+    cached = user_identity_cache.get(username)
+    if cached is not None:
+        return cached
+
+    async with AsyncSessionLocal() as db:
+        user = await get_user_by_username(db, username)
+    if user is None:
+        return None
+
+    identity = UserIdentity.from_user(user)
+    user_identity_cache.set(username, identity)
+    return identity
@@ -0,0 +1,131 @@
+"""
+Speculative prefetch of recipe details
+Generates and stores details for suggested recipes in the background
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from app.core.config import settings
+from app.schemas.recipe import RecipeDetailsRequest
+from app.services.ai_service import recipe_details_key
+from app.services.recipe_generation_service import (
+    details_flight,
+    generate_recipe_details_once,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RecipePrefetcher:
+    """
+    Bounded background worker pool for recipe details prefetching
+
+    Requests go through generate_recipe_details_once, so a prefetch skips
+    recipes already stored and shares its generation with a user clicking
+    the same suggestion meanwhile. Requests already queued or in flight are
+    not queued again, and requests beyond the queue size are dropped.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._queue: asyncio.Queue[RecipeDetailsRequest] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._pending: set[str] = set()
+        self.scheduled = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def start(self) -> None:
+        """Start the worker tasks (must be called from the running event loop)"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.max_workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers and discard queued prefetches"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._pending.clear()
+
+    async def join(self) -> None:
+        """Wait until every queued prefetch has been processed"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def schedule(self, requests: list[RecipeDetailsRequest]) -> int:
+        """
+        Queue details prefetches without waiting for them
+
+        Args:
+            requests: Details requests for suggested recipes
+
+        Returns:
+            Number of requests actually queued
+        """
+        if self._queue is None:
+            return 0
+
+        queued = 0
+        for request in requests:
+            key = recipe_details_key(request)
+            if key in self._pending or details_flight.in_flight(key):
+                self.deduplicated += 1
+                continue
+            try:
+                self._queue.put_nowait(request)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                continue
+            self._pending.add(key)
+            self.scheduled += 1
+            queued += 1
+        return queued
+
+    async def _work(self) -> None:
+        """Worker loop: generate and store one queued recipe at a time"""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            request = await queue.get()
+            try:
+                await generate_recipe_details_once(request)
+                self.completed += 1
+            except Exception:
+                self.failed += 1
+                logger.warning("Prefetch failed for %r", request.recipe_name, exc_info=True)
+            finally:
+                self._pending.discard(recipe_details_key(request))
+                queue.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and prefetch counters"""
+        return {
+            "enabled": self.running,
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "scheduled": self.scheduled,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+# Global prefetcher instance (started by the app lifespan when enabled)
+recipe_prefetcher = RecipePrefetcher(
+    max_workers=settings.RECIPE_PREFETCH_WORKERS,
+    max_queue=settings.RECIPE_PREFETCH_QUEUE_SIZE,
+)
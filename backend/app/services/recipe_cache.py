@@ -0,0 +1,191 @@
+"""
+Read-through cache of stored recipes
+Serves recipe reads by id or lookup key without a database round trip
+"""
+
+from typing import Any, cast
+
+from sqlalchemy import Delete, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.recipe import Recipe
+from app.schemas.recipe import RecipeResponse
+from app.services.recipe_service import (
+    get_recipe_by_lookup_key,
+    get_recipes_by_lookup_keys,
+)
+from app.utils.cache import TTLCache
+
+
+def _recipe_size(recipe: RecipeResponse) -> int:
+    """Approximate memory cost of a cached recipe (its JSON size in bytes)"""
+    return len(recipe.model_dump_json())
+
+
+class RecipeCache:
+    """
+    Size-bounded LRU cache of serialized recipes by id and by lookup key
+
+    Recipes are not modified after creation, so entries only leave the
+    cache on eviction, expiry or when an ORM update or delete of the
+    recipe invalidates them.
+
+    Example:
+        recipe_cache.put(recipe, lookup_key)
+        recipe_cache.get(recipe.id)  # RecipeResponse
+        recipe_cache.get_by_key(lookup_key)  # RecipeResponse
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float) -> None:
+        self.recipes: TTLCache[int, RecipeResponse] = TTLCache(
+            max_size=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_weight=max_bytes,
+            weigher=_recipe_size,
+        )
+        # Lookup key -> recipe id; the recipe itself is stored once above
+        self.ids_by_key: TTLCache[str, int] = TTLCache(
+            max_size=max_entries, ttl_seconds=ttl_seconds
+        )
+
+    def get(self, recipe_id: int) -> RecipeResponse | None:
+        """Get a cached recipe by id"""
+        return self.recipes.get(recipe_id)
+
+    def get_by_key(self, lookup_key: str) -> RecipeResponse | None:
+        """Get a cached recipe by lookup key"""
+        recipe_id = self.ids_by_key.get(lookup_key)
+        return self.recipes.get(recipe_id) if recipe_id is not None else None
+
+    def put(self, recipe: RecipeResponse, lookup_key: str | None = None) -> None:
+        """
+        Cache a recipe
+
+        Args:
+            recipe: Serialized recipe
+            lookup_key: Key the recipe is found by (see recipe_lookup_key)
+        """
+        self.recipes.set(recipe.id, recipe)
+        if lookup_key is not None:
+            self.ids_by_key.set(lookup_key, recipe.id)
+
+    def invalidate(self, recipe_id: int, lookup_key: str | None = None) -> None:
+        """Drop a recipe after it was modified or deleted"""
+        self.recipes.delete(recipe_id)
+        if lookup_key is not None:
+            self.ids_by_key.delete(lookup_key)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        self.recipes.clear()
+        self.ids_by_key.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, bytes and hit rate of the recipe and lookup key caches"""
+        return {"recipes": self.recipes.stats(), "lookup_keys": self.ids_by_key.stats()}
+
+
+recipe_cache = RecipeCache(
+    max_entries=settings.RECIPE_ROW_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RECIPE_ROW_CACHE_MAX_BYTES,
+    ttl_seconds=settings.RECIPE_ROW_CACHE_TTL_SECONDS,
+)
+
+
+def _invalidate_recipe(mapper: Any, connection: Any, target: Recipe) -> None:
+    """Keep the cache consistent with ORM writes to recipes"""
+    recipe_cache.invalidate(cast(int, target.id), cast(str | None, target.lookup_key))
+
+
+event.listen(Recipe, "after_update", _invalidate_recipe)
+event.listen(Recipe, "after_delete", _invalidate_recipe)
+
+
+def _invalidate_after_statement(
+    conn: Any, clauseelement: Any, multiparams: Any, params: Any, execution_options: Any, result: Any
+) -> None:
+    """
+    Empty the cache after any UPDATE or DELETE statement on recipes
+
+    Core and bulk ORM statements (update(Recipe), delete(Recipe)) do not fire
+    the mapper events above and do not say which rows they changed.
+    """
+    if isinstance(clauseelement, Update | Delete) and clauseelement.table.name == Recipe.__tablename__:
+        recipe_cache.clear()
+
+
+# On the Engine class, so the sync engine and the async engine's sync_engine both report
+event.listen(Engine, "after_execute", _invalidate_after_statement)
+
+
+def cache_recipe(recipe: Recipe) -> RecipeResponse:
+    """Serialize a stored recipe and add it to the cache"""
+    response = cast(RecipeResponse, RecipeResponse.model_validate(recipe))
+    recipe_cache.put(response, cast(str | None, recipe.lookup_key))
+    return response
+
+
+async def get_cached_recipe(db: AsyncSession, recipe_id: int) -> RecipeResponse | None:
+    """
+    Get a recipe by id, from the cache or else the database
+
+    Args:
+        db: Database session
+        recipe_id: Recipe ID
+
+    Returns:
+        Serialized recipe or None if not found
+    """
+    cached = recipe_cache.get(recipe_id)
+    if cached is not None:
+        return cached
+    recipe = await db.get(Recipe, recipe_id)
+    return cache_recipe(recipe) if recipe is not None else None
+
+
+async def get_cached_recipe_by_lookup_key(
+    db: AsyncSession, lookup_key: str
+) -> RecipeResponse | None:
+    """
+    Get a recipe by lookup key, from the cache or else the database
+
+    Args:
+        db: Database session
+        lookup_key: Key built with recipe_lookup_key
+
+    Returns:
+        Serialized recipe or None if not found
+    """
+    cached = recipe_cache.get_by_key(lookup_key)
+    if cached is not None:
+        return cached
+    recipe = await get_recipe_by_lookup_key(db, lookup_key)
+    return cache_recipe(recipe) if recipe is not None else None
+
+
+async def get_cached_recipes_by_lookup_keys(
+    db: AsyncSession, lookup_keys: list[str]
+) -> dict[str, RecipeResponse]:
+    """
+    Get recipes for several lookup keys, querying the database only for misses
+
+    Args:
+        db: Database session
+        lookup_keys: Keys built with recipe_lookup_key
+
+    Returns:
+        Serialized recipes by lookup key (missing keys are absent)
+    """
+    found: dict[str, RecipeResponse] = {}
+    for key in lookup_keys:
+        cached = recipe_cache.get_by_key(key)
+        if cached is not None:
+            found[key] = cached
+
+    missing = [key for key in lookup_keys if key not in found]
+    if missing:
+        for key, recipe in (await get_recipes_by_lookup_keys(db, missing)).items():
+            found[key] = cache_recipe(recipe)
+    return found
@@ -0,0 +1,343 @@
+"""
+Recipe generation service
+Coordinates AI generation with recipe persistence
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.recipe import recipe_lookup_key, recipe_restriction_terms
+from app.schemas.recipe import (
+    RecipeCreate,
+    RecipeDetailsBatchRequest,
+    RecipeDetailsRequest,
+    RecipeGenerateRequest,
+    RecipeListItem,
+    RecipeResponse,
+)
+from app.services.ai_service import (
+    ai_service,
+    normalize_recipe_details,
+    recipe_details_key,
+)
+from app.services.recipe_cache import (
+    cache_recipe,
+    get_cached_recipe_by_lookup_key,
+    get_cached_recipes_by_lookup_keys,
+    recipe_cache,
+)
+from app.services.recipe_service import (
+    create_recipe,
+    create_recipes,
+    find_recipes_by_ingredients,
+)
+from app.utils.singleflight import SingleFlight
+
+# Concurrent identical details requests share one generation and one insert
+details_flight: SingleFlight[RecipeResponse | None] = SingleFlight()
+
+
+async def suggest_stored_recipes(request: RecipeGenerateRequest) -> list[RecipeListItem]:
+    """
+    Build suggestions from stored recipes sharing ingredients with the request
+
+    Used as the degraded answer while the AI circuit breaker is open. Only
+    recipes generated under the request's restrictions and allergies are
+    suggested.
+
+    Args:
+        request: Recipe generation request
+
+    Returns:
+        Up to 6 suggestions, best ingredient overlap first
+    """
+    async with AsyncSessionLocal() as db:
+        recipes = await find_recipes_by_ingredients(
+            db,
+            request.ingredients,
+            max_cooking_time=request.cooking_time,
+            restriction_terms=recipe_restriction_terms(
+                request.dietary_restrictions, request.allergies
+            ),
+        )
+        return [
+            RecipeListItem(
+                name=recipe.name,
+                description=recipe.description,
+                cooking_time=recipe.cooking_time,
+                difficulty=recipe.difficulty,
+            )
+            for recipe in recipes
+        ]
+
+
+def _lookup_key(
+    recipe_name: str, dietary_restrictions: list[str] | None, allergies: list[str] | None
+) -> str:
+    """
+    Lookup key of a details request
+
+    Generated recipes are stored under the key of the request that asked
+    for them, not under the name the AI gave them, so the next request for
+    the same name finds them.
+    """
+    return recipe_lookup_key(recipe_name, recipe_restriction_terms(dietary_restrictions, allergies))
+
+
+async def get_stored_recipe(
+    recipe_name: str,
+    dietary_restrictions: list[str] | None = None,
+    allergies: list[str] | None = None,
+) -> RecipeResponse | None:
+    """
+    Look up a stored recipe by name, restrictions and allergies in a short-lived session
+
+    Matching goes through the recipe lookup key, so names differing only in
+    casing or whitespace find the same recipe. Recipes in the recipe cache
+    are returned without touching the database. Otherwise the connection
+    goes back to the pool before the caller starts any AI call, instead of
+    staying checked out for the whole request.
+
+    Args:
+        recipe_name: Recipe name
+        dietary_restrictions: Dietary restrictions of the request
+        allergies: Allergies of the request
+
+    Returns:
+        Stored recipe or None if not found
+    """
+    lookup_key = _lookup_key(recipe_name, dietary_restrictions, allergies)
+    # Popular recipes are served from memory without taking a connection
+    cached = recipe_cache.get_by_key(lookup_key)
+    if cached is not None:
+        return cached
+    async with AsyncSessionLocal() as db:
+        return await get_cached_recipe_by_lookup_key(db, lookup_key)
+
+
+async def generate_recipe_details_once(request: RecipeDetailsRequest) -> RecipeResponse | None:
+    """
+    Generate and store a recipe, coalescing identical concurrent requests
+
+    Callers arriving while the same recipe is being generated wait for that
+    generation instead of calling Mistral and inserting a row themselves.
+
+    Args:
+        request: Recipe details request
+
+    Returns:
+        Stored recipe or None if the AI returned nothing
+    """
+    return await details_flight.do(
+        recipe_details_key(request), lambda: _generate_and_store_recipe(request)
+    )
+
+
+async def _generate_and_store_recipe(request: RecipeDetailsRequest) -> RecipeResponse | None:
+    """Generate recipe details with AI and persist them in a dedicated session"""
+    # Another flight may have stored it since the caller's lookup
+    existing = await get_stored_recipe(
+        request.recipe_name, request.dietary_restrictions, request.allergies
+    )
+    if existing is not None:
+        return existing
+
+    recipe_data = await ai_service.generate_recipe_details(request)
+    if not recipe_data:
+        return None
+
+    return await _store_recipe(
+        recipe_data,
+        _lookup_key(request.recipe_name, request.dietary_restrictions, request.allergies),
+    )
+
+
+async def _store_recipe(recipe_data: dict[str, Any], lookup_key: str) -> RecipeResponse:
+    """Persist generated recipe details under the request's lookup key"""
+    async with AsyncSessionLocal() as db:
+        recipe = await create_recipe(db, RecipeCreate(**recipe_data), lookup_key)
+        return cache_recipe(recipe)
+
+
+async def _load_stored_recipes(lookup_keys: list[str]) -> dict[str, RecipeResponse]:
+    """Load stored recipes by lookup key, with one IN query for cache misses"""
+    async with AsyncSessionLocal() as db:
+        return await get_cached_recipes_by_lookup_keys(db, lookup_keys)
+
+
+async def _store_recipes(
+    recipes_data: list[RecipeCreate], lookup_keys: list[str]
+) -> list[RecipeResponse]:
+    """Persist several generated recipes under their request keys with a single commit"""
+    async with AsyncSessionLocal() as db:
+        return [
+            cache_recipe(recipe)
+            for recipe in await create_recipes(db, recipes_data, lookup_keys)
+        ]
+
+
+async def generate_recipe_details_batch(
+    request: RecipeDetailsBatchRequest,
+) -> tuple[list[RecipeResponse], list[str]]:
+    """
+    Resolve details for several recipe names at once
+
+    Names with the same lookup key are resolved once, under their first
+    spelling. Stored recipes are loaded with one IN query. Missing ones are
+    generated concurrently (at most RECIPE_BATCH_CONCURRENCY calls at a
+    time) and then inserted with a single commit, each under the key of
+    the requested name.
+
+    Args:
+        request: Batch details request
+
+    Returns:
+        Tuple of (recipes in request order, names that could not be generated)
+    """
+    names_by_key: dict[str, str] = {}
+    for name in request.recipe_names:
+        if name.strip():
+            key = _lookup_key(name, request.dietary_restrictions, request.allergies)
+            names_by_key.setdefault(key, name.strip())
+
+    stored = await _load_stored_recipes(list(names_by_key))
+    missing = [key for key in names_by_key if key not in stored]
+
+    semaphore = asyncio.Semaphore(settings.RECIPE_BATCH_CONCURRENCY)
+
+    async def generate(name: str) -> RecipeCreate | None:
+        async with semaphore:
+            recipe_data = await ai_service.generate_recipe_details(
+                RecipeDetailsRequest(
+                    recipe_name=name,
+                    servings=request.servings,
+                    dietary_restrictions=request.dietary_restrictions,
+                    allergies=request.allergies,
+                )
+            )
+        return RecipeCreate(**recipe_data) if recipe_data else None
+
+    results = await asyncio.gather(
+        *(generate(names_by_key[key]) for key in missing), return_exceptions=True
+    )
+
+    generated: dict[str, RecipeCreate] = {}
+    failed: list[str] = []
+    for key, result in zip(missing, results, strict=True):
+        if isinstance(result, RecipeCreate):
+            generated[key] = result
+        else:
+            failed.append(names_by_key[key])
+
+    if generated:
+        created = await _store_recipes(list(generated.values()), list(generated))
+        stored.update(zip(generated, created, strict=True))
+
+    return [stored[key] for key in names_by_key if key in stored], failed
+
+
+async def stream_recipe_details(request: RecipeDetailsRequest) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Stream a recipe progressively, storing it once generation completes
+
+    Yields ("field", {name: value}) for summary fields, ("ingredient", {...})
+    per ingredient and ("step", {"index", "text"}) per instruction step, then
+    ("recipe", {...}) with the stored recipe including its id. An existing
+    recipe is replayed from the database in the same shape. If the AI gives
+    no usable recipe, the stream ends without a "recipe" event.
+
+    Generation runs in details_flight like generate_recipe_details_once: a
+    stream arriving while the recipe is already being generated (by a
+    details request, a prefetch or another stream) waits for it and replays
+    the result, and the generation outlives a disconnecting client.
+
+    Args:
+        request: Recipe details request
+
+    Yields:
+        (event, payload) pairs
+    """
+    existing = await get_stored_recipe(
+        request.recipe_name, request.dietary_restrictions, request.allergies
+    )
+    if existing is not None:
+        for event in _replay_recipe_events(existing):
+            yield event
+        return
+
+    # Events of the generation this stream starts; None once the flight is done
+    events: asyncio.Queue[tuple[str, Any] | None] = asyncio.Queue()
+    flight = asyncio.ensure_future(
+        details_flight.do(
+            recipe_details_key(request),
+            lambda: _stream_and_store_recipe(request, events.put_nowait),
+        )
+    )
+    flight.add_done_callback(lambda _: events.put_nowait(None))
+    streamed = False
+    try:
+        while (generated := await events.get()) is not None:
+            streamed = True
+            yield generated
+        recipe = await flight
+    finally:
+        if not flight.done():
+            flight.cancel()
+
+    if recipe is None:
+        return
+    if streamed:
+        yield "recipe", recipe.model_dump(mode="json")
+    else:
+        # Joined a generation started elsewhere, or found the recipe stored
+        for event in _replay_recipe_events(recipe):
+            yield event
+
+
+async def _stream_and_store_recipe(
+    request: RecipeDetailsRequest, emit: Callable[[tuple[str, Any]], None]
+) -> RecipeResponse | None:
+    """Stream recipe details from the AI to emit, then persist the recipe"""
+    # Another flight may have stored it since the caller's lookup
+    existing = await get_stored_recipe(
+        request.recipe_name, request.dietary_restrictions, request.allergies
+    )
+    if existing is not None:
+        return existing
+
+    recipe_data: dict[str, Any] = {"ingredients": [], "instructions": []}
+    async for key, value in ai_service.stream_recipe_details(request):
+        if key == "ingredients":
+            recipe_data["ingredients"].append(value)
+            emit(("ingredient", value))
+        elif key == "instructions":
+            # A plain-text answer arrives as a single step
+            recipe_data["instructions"].append(str(value))
+            emit(("step", {"index": len(recipe_data["instructions"]) - 1, "text": str(value)}))
+        else:
+            recipe_data[key] = value
+            emit(("field", {key: value}))
+
+    # Nothing usable was generated: no final event, nothing stored
+    if not recipe_data.get("name") or not recipe_data["ingredients"]:
+        return None
+
+    return await _store_recipe(
+        normalize_recipe_details(recipe_data),
+        _lookup_key(request.recipe_name, request.dietary_restrictions, request.allergies),
+    )
+
+
+def _replay_recipe_events(recipe: RecipeResponse) -> Iterator[tuple[str, Any]]:
+    """Produce the streaming event sequence for an already stored recipe"""
+    for field in ("name", "description", "servings", "cooking_time", "prep_time", "difficulty"):
+        yield "field", {field: getattr(recipe, field)}
+    for ingredient in recipe.ingredients:
+        yield "ingredient", ingredient.model_dump()
+    steps = [line for line in recipe.instructions.splitlines() if line.strip()]
+    for index, step in enumerate(steps):
+        yield "step", {"index": index, "text": step}
+    yield "recipe", recipe.model_dump(mode="json")
@@ -2,48 +2,102 @@
 Recipe service for CRUD operations and saved recipes management
 """
 
-from typing import cast
+from datetime import datetime
+from typing import Any, cast
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, String, and_, delete, insert, or_, select
+from sqlalchemy import cast as sql_cast
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from app.models.recipe import Recipe
+from app.core.database import dialect_insert
+from app.models.recipe import Recipe, recipe_lookup_key, restriction_fingerprint
 from app.models.saved_recipe import SavedRecipe
 from app.models.user import User
 from app.schemas.recipe import RecipeCreate
-
-
-def create_recipe(db: Session, recipe_data: RecipeCreate) -> Recipe:
+from app.utils.text import normalize_terms
+
+# Attempts of ensure_recipe_saved_for_user against concurrent unsaves
+ENSURE_SAVED_ATTEMPTS = 3
+
+
+def _recipe_values(recipe_data: RecipeCreate, lookup_key: str | None) -> dict[str, Any]:
+    """Column values for inserting a recipe"""
+    return {
+        "name": recipe_data.name,
+        "description": recipe_data.description,
+        "servings": recipe_data.servings,
+        # Convert ingredients to dict format for JSONB
+        "ingredients": [ing.model_dump() for ing in recipe_data.ingredients],
+        "instructions": recipe_data.instructions,
+        "cooking_time": recipe_data.cooking_time,
+        "prep_time": recipe_data.prep_time,
+        "difficulty": recipe_data.difficulty,
+        "lookup_key": lookup_key or recipe_lookup_key(recipe_data.name),
+    }
+
+
+async def create_recipe(
+    db: AsyncSession, recipe_data: RecipeCreate, lookup_key: str | None = None
+) -> Recipe:
     """
     Create a new recipe in the database
 
+    The id and created_at come back from the INSERT itself (RETURNING),
+    so no SELECT follows the commit.
+
     Args:
         db: Database session
         recipe_data: Recipe data to create
+        lookup_key: Key the recipe is found by (see recipe_lookup_key). Generated
+            recipes pass the key of the request, since the AI may rename them.
+            Defaults to the recipe's own name without restrictions.
 
     Returns:
         Created recipe object
     """
-    # Convert ingredients to dict format for JSONB
-    ingredients_dict = [ing.model_dump() for ing in recipe_data.ingredients]
-
-    recipe = Recipe(
-        name=recipe_data.name,
-        description=recipe_data.description,
-        servings=recipe_data.servings,
-        ingredients=ingredients_dict,
-        instructions=recipe_data.instructions,
-        cooking_time=recipe_data.cooking_time,
-        prep_time=recipe_data.prep_time,
-        difficulty=recipe_data.difficulty,
+    recipe = await db.scalar(
+        insert(Recipe).values(**_recipe_values(recipe_data, lookup_key)).returning(Recipe)
     )
+    await db.commit()
+    return cast(Recipe, recipe)
+
+
+async def create_recipes(
+    db: AsyncSession,
+    recipes_data: list[RecipeCreate],
+    lookup_keys: list[str] | None = None,
+) -> list[Recipe]:
+    """
+    Create several recipes with a single commit
+
+    All rows are inserted by one INSERT ... RETURNING (batched by the driver
+    for large inputs), so no SELECT follows the commit.
 
-    db.add(recipe)
-    db.commit()
-    db.refresh(recipe)
-    return recipe
+    Args:
+        db: Database session
+        recipes_data: Recipe data to create
+        lookup_keys: Lookup key of each recipe, in input order (see create_recipe)
+
+    Returns:
+        Created recipe objects, in input order
+    """
+    if not recipes_data:
+        return []
+
+    result = await db.scalars(
+        insert(Recipe).returning(Recipe, sort_by_parameter_order=True),
+        [
+            _recipe_values(recipe_data, lookup_keys[index] if lookup_keys else None)
+            for index, recipe_data in enumerate(recipes_data)
+        ],
+    )
+    recipes = list(result)
+    await db.commit()
+    return recipes
 
 
-def get_recipe_by_id(db: Session, recipe_id: int) -> Recipe | None:
+async def get_recipe_by_id(db: AsyncSession, recipe_id: int) -> Recipe | None:
     """
     Get recipe by ID
 
@@ -54,11 +108,11 @@ def get_recipe_by_id(db: Session, recipe_id: int) -> Recipe | None:
     Returns:
         Recipe object or None if not found
     """
-    result = db.query(Recipe).filter(Recipe.id == recipe_id).first()
+    result = await db.get(Recipe, recipe_id)
     return cast(Recipe | None, result)
 
 
-def get_recipe_by_name(db: Session, recipe_name: str) -> Recipe | None:
+async def get_recipe_by_name(db: AsyncSession, recipe_name: str) -> Recipe | None:
     """
     Get recipe by name
 
@@ -69,18 +123,142 @@ def get_recipe_by_name(db: Session, recipe_name: str) -> Recipe | None:
     Returns:
         Recipe object or None if not found
     """
-    result = db.query(Recipe).filter(Recipe.name == recipe_name).first()
+    result = await db.scalar(select(Recipe).where(Recipe.name == recipe_name).limit(1))
     return cast(Recipe | None, result)
 
 
-def save_recipe_for_user(db: Session, user: User, recipe: Recipe) -> SavedRecipe:
+async def get_recipe_by_lookup_key(db: AsyncSession, lookup_key: str) -> Recipe | None:
+    """
+    Get the oldest recipe with a lookup key
+
+    Args:
+        db: Database session
+        lookup_key: Key built with recipe_lookup_key
+
+    Returns:
+        Recipe object or None if not found
+    """
+    result = await db.scalar(
+        select(Recipe).where(Recipe.lookup_key == lookup_key).order_by(Recipe.id).limit(1)
+    )
+    return cast(Recipe | None, result)
+
+
+async def get_recipes_by_lookup_keys(
+    db: AsyncSession, lookup_keys: list[str]
+) -> dict[str, Recipe]:
+    """
+    Get the oldest recipe for each lookup key in one query
+
+    Args:
+        db: Database session
+        lookup_keys: Keys built with recipe_lookup_key
+
+    Returns:
+        Recipe objects by lookup key (missing keys are absent)
+    """
+    if not lookup_keys:
+        return {}
+    result = await db.scalars(
+        select(Recipe).where(Recipe.lookup_key.in_(lookup_keys)).order_by(Recipe.id.desc())
+    )
+    # Newest first, so the oldest recipe of each key is written last
+    return {cast(str, recipe.lookup_key): recipe for recipe in result.all()}
+
+
+async def find_recipes_by_ingredients(
+    db: AsyncSession,
+    ingredients: list[str],
+    max_cooking_time: int | None = None,
+    restriction_terms: list[str] | None = None,
+    limit: int = 6,
+    candidate_limit: int = 200,
+) -> list[Recipe]:
+    """
+    Find stored recipes sharing the most ingredients with a request
+
+    Candidates are the most recent recipes whose ingredient JSON mentions
+    any requested ingredient; they are then ranked by how many requested
+    ingredients match an ingredient name. With restriction terms, only
+    recipes generated under exactly those restrictions and allergies are
+    candidates.
+
+    Args:
+        db: Database session
+        ingredients: Requested ingredient names
+        max_cooking_time: Optional max cooking time in minutes
+        restriction_terms: Restrictions and allergies of the request (see
+            recipe_restriction_terms)
+        limit: Max number of recipes to return
+        candidate_limit: Max number of rows loaded for ranking
+
+    Returns:
+        Recipes ordered by ingredient overlap, best first
+    """
+    terms = normalize_terms(ingredients)
+    if not terms:
+        return []
+
+    ingredients_text = sql_cast(Recipe.ingredients, String)
+    # autoescape: "%" and "_" in user input match literally
+    query = select(Recipe).where(
+        or_(*(ingredients_text.icontains(term, autoescape=True) for term in terms))
+    )
+    fingerprint = restriction_fingerprint(restriction_terms)
+    if fingerprint:
+        query = query.where(Recipe.lookup_key.endswith(f"|{fingerprint}"))
+    if max_cooking_time is not None:
+        query = query.where(
+            or_(Recipe.cooking_time.is_(None), Recipe.cooking_time <= max_cooking_time)
+        )
+    result = await db.scalars(query.order_by(Recipe.created_at.desc()).limit(candidate_limit))
+    candidates = cast(list[Recipe], result.all())
+
+    def overlap(recipe: Recipe) -> int:
+        names = [
+            str(ingredient.get("name", "")).lower()
+            for ingredient in recipe.ingredients or []
+            if isinstance(ingredient, dict)
+        ]
+        return sum(1 for term in terms if any(term in name for name in names))
+
+    scored = [(overlap(recipe), recipe) for recipe in candidates]
+    ranked = sorted((item for item in scored if item[0] > 0), key=lambda item: -item[0])
+    return [recipe for _, recipe in ranked[:limit]]
+
+
+async def _insert_saved_recipe(
+    db: AsyncSession, user: User, recipe_id: int
+) -> SavedRecipe | None:
+    """
+    Insert a saved recipe in one statement, skipping it if it already exists
+
+    Returns:
+        The new SavedRecipe, or None if the user had already saved the recipe
+    """
+    # ON CONFLICT on the uix_user_recipe constraint: no check-then-insert race
+    statement = (
+        dialect_insert(db, SavedRecipe)
+        .values(user_id=user.id, recipe_id=recipe_id)
+        .on_conflict_do_nothing(index_elements=["user_id", "recipe_id"])
+        .returning(SavedRecipe)
+    )
+    saved_recipe = cast(SavedRecipe | None, await db.scalar(statement))
+    await db.commit()
+    return saved_recipe
+
+
+async def save_recipe_for_user(db: AsyncSession, user: User, recipe_id: int) -> SavedRecipe:
     """
     Save a recipe for a user
 
+    The recipe relationship is not loaded: callers already hold the recipe
+    (see recipe_cache) and pair it with the returned row.
+
     Args:
         db: Database session
         user: User object
-        recipe: Recipe object
+        recipe_id: ID of an existing recipe
 
     Returns:
         SavedRecipe object
@@ -88,25 +266,74 @@ def save_recipe_for_user(db: Session, user: User, recipe: Recipe) -> SavedRecipe
     Raises:
         ValueError: If recipe is already saved by user
     """
-    # Check if already saved
-    existing = (
-        db.query(SavedRecipe)
-        .filter(SavedRecipe.user_id == user.id, SavedRecipe.recipe_id == recipe.id)
-        .first()
-    )
-
-    if existing:
+    saved_recipe = await _insert_saved_recipe(db, user, recipe_id)
+    if saved_recipe is None:
         raise ValueError("Recipe already saved by user")
-
-    # Create saved recipe
-    saved_recipe = SavedRecipe(user_id=user.id, recipe_id=recipe.id)
-    db.add(saved_recipe)
-    db.commit()
-    db.refresh(saved_recipe)
     return saved_recipe
 
 
-def unsave_recipe_for_user(db: Session, user: User, recipe_id: int) -> bool:
+async def ensure_recipe_saved_for_user(
+    db: AsyncSession, user: User, recipe_id: int
+) -> tuple[SavedRecipe, bool]:
+    """
+    Save a recipe for a user unless it is already saved (idempotent)
+
+    Like save_recipe_for_user, the recipe relationship is not loaded.
+
+    Args:
+        db: Database session
+        user: User object
+        recipe_id: ID of an existing recipe
+
+    Returns:
+        Tuple of (SavedRecipe object, True if it was created by this call)
+
+    Raises:
+        RuntimeError: If the row keeps being removed between the INSERT and
+            the SELECT for ENSURE_SAVED_ATTEMPTS attempts
+    """
+    for _ in range(ENSURE_SAVED_ATTEMPTS):
+        saved_recipe = await _insert_saved_recipe(db, user, recipe_id)
+        if saved_recipe is not None:
+            return saved_recipe, True
+
+        existing = await db.scalar(
+            select(SavedRecipe).where(
+                SavedRecipe.user_id == user.id, SavedRecipe.recipe_id == recipe_id
+            )
+        )
+        if existing is not None:
+            return cast(SavedRecipe, existing), False
+        # Unsaved concurrently between the two statements: save it again
+
+    raise RuntimeError("Saved recipe kept changing concurrently, please retry")
+
+
+async def get_saved_recipe_for_user(
+    db: AsyncSession, user: User, recipe_id: int
+) -> SavedRecipe | None:
+    """
+    Get a user's saved recipe row by recipe ID
+
+    Like save_recipe_for_user, the recipe relationship is not loaded.
+
+    Args:
+        db: Database session
+        user: User object
+        recipe_id: Recipe ID
+
+    Returns:
+        SavedRecipe object or None if the user has not saved the recipe
+    """
+    saved_recipe = await db.scalar(
+        select(SavedRecipe).where(
+            SavedRecipe.user_id == user.id, SavedRecipe.recipe_id == recipe_id
+        )
+    )
+    return cast(SavedRecipe | None, saved_recipe)
+
+
+async def unsave_recipe_for_user(db: AsyncSession, user: User, recipe_id: int) -> bool:
     """
     Remove a saved recipe for a user
 
@@ -118,35 +345,186 @@ def unsave_recipe_for_user(db: Session, user: User, recipe_id: int) -> bool:
     Returns:
         True if recipe was unsaved, False if not found
     """
-    saved_recipe = (
-        db.query(SavedRecipe)
-        .filter(SavedRecipe.user_id == user.id, SavedRecipe.recipe_id == recipe_id)
-        .first()
+    # Single DELETE ... RETURNING instead of SELECT then DELETE
+    deleted_id = await db.scalar(
+        delete(SavedRecipe)
+        .where(SavedRecipe.user_id == user.id, SavedRecipe.recipe_id == recipe_id)
+        .returning(SavedRecipe.id)
     )
+    await db.commit()
+    return deleted_id is not None
 
-    if not saved_recipe:
-        return False
 
-    db.delete(saved_recipe)
-    db.commit()
-    return True
+async def bulk_update_saved_recipes(
+    db: AsyncSession, user: User, save_ids: list[int], unsave_ids: list[int]
+) -> tuple[dict[int, str], dict[int, str]]:
+    """
+    Save and unsave several recipes for a user in one transaction
+
+    Recipe ids are checked with one SELECT, then all saves go in one
+    multi-row INSERT ... ON CONFLICT DO NOTHING and all unsaves in one
+    DELETE, with a single commit.
 
+    Args:
+        db: Database session
+        user: User object
+        save_ids: Recipe IDs to save
+        unsave_ids: Recipe IDs to unsave
 
-def get_saved_recipes_for_user(db: Session, user: User) -> list[SavedRecipe]:
+    Returns:
+        Tuple of (save outcomes, unsave outcomes) mapping each recipe ID to
+        "saved", "already_saved", "unsaved", "not_saved" or "not_found"
+
+    Raises:
+        ValueError: If a recipe ID is in both save_ids and unsave_ids
+
+    Example:
+        saves, unsaves = await bulk_update_saved_recipes(db, user, [1, 2], [3])
+        # ({1: "saved", 2: "already_saved"}, {3: "unsaved"})
+    """
+    overlap = set(save_ids) & set(unsave_ids)
+    if overlap:
+        # Both outcomes would depend on statement order
+        raise ValueError(f"Recipe IDs in both save and unsave: {sorted(overlap)}")
+
+    save_ids = list(dict.fromkeys(save_ids))
+    unsave_ids = list(dict.fromkeys(unsave_ids))
+    requested = set(save_ids) | set(unsave_ids)
+    if not requested:
+        return {}, {}
+
+    result = await db.scalars(select(Recipe.id).where(Recipe.id.in_(requested)))
+    known = set(result.all())
+
+    to_save = [recipe_id for recipe_id in save_ids if recipe_id in known]
+    saved: set[int] = set()
+    if to_save:
+        statement = (
+            dialect_insert(db, SavedRecipe)
+            .values([{"user_id": user.id, "recipe_id": recipe_id} for recipe_id in to_save])
+            .on_conflict_do_nothing(index_elements=["user_id", "recipe_id"])
+            .returning(SavedRecipe.recipe_id)
+        )
+        saved = set((await db.scalars(statement)).all())
+
+    to_unsave = [recipe_id for recipe_id in unsave_ids if recipe_id in known]
+    unsaved: set[int] = set()
+    if to_unsave:
+        statement = (
+            delete(SavedRecipe)
+            .where(SavedRecipe.user_id == user.id, SavedRecipe.recipe_id.in_(to_unsave))
+            .returning(SavedRecipe.recipe_id)
+        )
+        unsaved = set((await db.scalars(statement)).all())
+
+    await db.commit()
+
+    save_outcomes = {
+        recipe_id: (
+            "not_found"
+            if recipe_id not in known
+            else "saved" if recipe_id in saved else "already_saved"
+        )
+        for recipe_id in save_ids
+    }
+    unsave_outcomes = {
+        recipe_id: (
+            "not_found"
+            if recipe_id not in known
+            else "unsaved" if recipe_id in unsaved else "not_saved"
+        )
+        for recipe_id in unsave_ids
+    }
+    return save_outcomes, unsave_outcomes
+
+
+async def get_saved_recipes_for_user(
+    db: AsyncSession,
+    user: User,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> list[SavedRecipe]:
     """
-    Get all saved recipes for a user
+    Get saved recipes for a user, most recently saved first
+
+    Pages are read by keyset rather than OFFSET: the next page starts right
+    after the (saved_at, id) of the previous page's last row, so the cost of
+    a page does not grow with how deep into the list it is.
 
     Args:
         db: Database session
         user: User object
+        limit: Maximum number of rows to return (None = all)
+        after: (saved_at, id) of the last row of the previous page
 
     Returns:
         List of SavedRecipe objects with recipe details
     """
-    result = (
-        db.query(SavedRecipe)
-        .filter(SavedRecipe.user_id == user.id)
-        .order_by(SavedRecipe.saved_at.desc())
-        .all()
+    # Join the recipes into the same query instead of one SELECT per saved recipe
+    query = (
+        select(SavedRecipe)
+        .where(SavedRecipe.user_id == user.id)
+        .options(joinedload(SavedRecipe.recipe, innerjoin=True))
+    )
+    result = await db.scalars(_saved_recipes_page(query, limit, after))
+    return cast(list[SavedRecipe], result.all())
+
+
+async def get_saved_recipe_summaries_for_user(
+    db: AsyncSession,
+    user: User,
+    limit: int | None = None,
+    after: tuple[datetime, int] | None = None,
+) -> list[Row[Any]]:
+    """
+    Get a summary of saved recipes for a user, most recently saved first
+
+    Only the columns shown in saved-recipe lists are selected, so the
+    ingredients and instructions of each recipe are never read or sent.
+    Paginated like get_saved_recipes_for_user.
+
+    Args:
+        db: Database session
+        user: User object
+        limit: Maximum number of rows to return (None = all)
+        after: (saved_at, id) of the last row of the previous page
+
+    Returns:
+        Rows with id, user_id, saved_at, recipe_id, name, description,
+        cooking_time and difficulty
+    """
+    query = (
+        select(
+            SavedRecipe.id,
+            SavedRecipe.user_id,
+            SavedRecipe.saved_at,
+            Recipe.id.label("recipe_id"),
+            Recipe.name,
+            Recipe.description,
+            Recipe.cooking_time,
+            Recipe.difficulty,
+        )
+        .join(Recipe, SavedRecipe.recipe_id == Recipe.id)
+        .where(SavedRecipe.user_id == user.id)
     )
-    return cast(list[SavedRecipe], result)
+    result = await db.execute(_saved_recipes_page(query, limit, after))
+    return list(result.all())
+
+
+def _saved_recipes_page(
+    query: Select[Any], limit: int | None, after: tuple[datetime, int] | None
+) -> Select[Any]:
+    """Apply keyset ordering and paging to a saved recipes query"""
+    # Order matches the saved_recipes (user_id, saved_at DESC, id) index
+    query = query.order_by(SavedRecipe.saved_at.desc(), SavedRecipe.id)
+    if after is not None:
+        saved_at, saved_id = after
+        query = query.where(
+            or_(
+                SavedRecipe.saved_at < saved_at,
+                and_(SavedRecipe.saved_at == saved_at, SavedRecipe.id > saved_id),
+            )
+        )
+    if limit is not None:
+        query = query.limit(limit)
+    return query
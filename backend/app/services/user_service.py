@@ -3,14 +3,81 @@ User service functions
 Handle user preferences operations
 """
 
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, cast
 
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dialect_insert
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
 from app.schemas.user import UserPreferencesBase, UserPreferencesUpdate
+from app.utils.cache import TTLCache
+
+# User id -> stored restrictions and allergies (empty for users without any)
+user_preferences_cache: TTLCache[int, UserPreferencesBase] = TTLCache(
+    max_size=settings.PREFERENCES_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PREFERENCES_CACHE_TTL_SECONDS,
+)
+
+
+def _forget_preferences(mapper: Any, connection: Any, target: UserPreferences) -> None:
+    """Drop preferences changed through the ORM from the cache"""
+    user_preferences_cache.delete(cast(int, target.user_id))
+
+
+event.listen(UserPreferences, "after_insert", _forget_preferences)
+event.listen(UserPreferences, "after_update", _forget_preferences)
+event.listen(UserPreferences, "after_delete", _forget_preferences)
+
+
+def cache_user_preferences(preferences: UserPreferences) -> UserPreferencesBase:
+    """
+    Store the restrictions and allergies of a preferences row in the cache
+
+    Args:
+        preferences: Freshly written UserPreferences row
+
+    Returns:
+        Cached preferences
+    """
+    cached = UserPreferencesBase(
+        dietary_restrictions=preferences.dietary_restrictions,
+        allergies=preferences.allergies,
+    )
+    user_preferences_cache.set(cast(int, preferences.user_id), cached)
+    return cached
 
 
-def get_user_preferences(db: Session, user: User) -> UserPreferences | None:
+async def get_cached_user_preferences(user_id: int) -> UserPreferencesBase:
+    """
+    Get a user's restrictions and allergies, from the cache or else the database
+
+    Users without stored preferences are cached too, with empty values.
+    The database lookup uses a short-lived session.
+
+    Args:
+        user_id: User id
+
+    Returns:
+        Stored preferences (fields are None when nothing is stored)
+    """
+    cached = user_preferences_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    async with AsyncSessionLocal() as db:
+        preferences = await UserService(db).get_user_preferences(user_id)
+    if preferences is None:
+        empty = UserPreferencesBase()
+        user_preferences_cache.set(user_id, empty)
+        return empty
+    return cache_user_preferences(preferences)
+
+
+async def get_user_preferences(db: AsyncSession, user: User) -> UserPreferences | None:
     """
     Get user preferences from database
 
@@ -21,12 +88,56 @@ def get_user_preferences(db: Session, user: User) -> UserPreferences | None:
     Returns:
         UserPreferences object or None if not found
     """
-    result = db.query(UserPreferences).filter(UserPreferences.user_id == user.id).first()
+    result = await db.scalar(
+        select(UserPreferences).where(UserPreferences.user_id == user.id).limit(1)
+    )
     return result if isinstance(result, UserPreferences) else None
 
 
-def create_user_preferences(
-    db: Session,
+async def _insert_preferences(
+    db: AsyncSession, user_id: int, preferences_data: UserPreferencesBase
+) -> UserPreferences:
+    """INSERT ... RETURNING a preferences row, commit and cache it"""
+    preferences = await db.scalar(
+        insert(UserPreferences)
+        .values(
+            user_id=user_id,
+            dietary_restrictions=preferences_data.dietary_restrictions,
+            allergies=preferences_data.allergies,
+        )
+        .returning(UserPreferences)
+    )
+    await db.commit()
+    cache_user_preferences(cast(UserPreferences, preferences))
+    return cast(UserPreferences, preferences)
+
+
+async def _update_preferences(
+    db: AsyncSession, user_id: int, preferences_data: dict[str, Any]
+) -> UserPreferences:
+    """UPDATE ... RETURNING the fields with a value, commit and cache the row"""
+    fields = {
+        field: value
+        for field, value in preferences_data.items()
+        if value is not None and field in UserPreferences.__table__.columns
+    }
+    preferences = await db.scalar(
+        update(UserPreferences)
+        .where(UserPreferences.user_id == user_id)
+        .values(**fields, updated_at=datetime.utcnow())
+        .returning(UserPreferences),
+        execution_options={"populate_existing": True},
+    )
+    if preferences is None:
+        raise ValueError("User preferences not found")
+
+    await db.commit()
+    cache_user_preferences(preferences)
+    return cast(UserPreferences, preferences)
+
+
+async def create_user_preferences(
+    db: AsyncSession,
     user: User,
     preferences_data: UserPreferencesUpdate
 ) -> UserPreferences:
@@ -41,27 +152,19 @@ def create_user_preferences(
     Returns:
         Created UserPreferences object
     """
-    preferences = UserPreferences(
-        user_id=user.id,
-        dietary_restrictions=preferences_data.dietary_restrictions,
-        allergies=preferences_data.allergies,
-    )
-
-    db.add(preferences)
-    db.commit()
-    db.refresh(preferences)
-
-    return preferences
+    return await _insert_preferences(db, cast(int, user.id), preferences_data)
 
 
-def update_user_preferences(
-    db: Session,
+async def update_user_preferences(
+    db: AsyncSession,
     user: User,
     preferences_data: UserPreferencesUpdate
 ) -> UserPreferences:
     """
     Update existing user preferences
 
+    Fields left to None keep their stored value.
+
     Args:
         db: Database session
         user: User object
@@ -69,62 +172,60 @@ def update_user_preferences(
 
     Returns:
         Updated UserPreferences object
-    """
-    preferences = get_user_preferences(db, user)
-
-    if not preferences:
-        raise ValueError("User preferences not found")
-
-    # Update fields that are provided
-    if preferences_data.dietary_restrictions is not None:
-        preferences.dietary_restrictions = preferences_data.dietary_restrictions
-    if preferences_data.allergies is not None:
-        preferences.allergies = preferences_data.allergies
 
-    db.commit()
-    db.refresh(preferences)
-
-    return preferences
+    Raises:
+        ValueError: If the user has no preferences yet
+    """
+    return await _update_preferences(db, cast(int, user.id), preferences_data.model_dump())
 
 
 class UserService:
     """Service class for user-related operations"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_preferences(self, user_id: int) -> UserPreferences | None:
+    async def get_user_preferences(self, user_id: int) -> UserPreferences | None:
         """Get user preferences by user ID"""
-        result = self.db.query(UserPreferences).filter(UserPreferences.user_id == user_id).first()
+        result = await self.db.scalar(
+            select(UserPreferences).where(UserPreferences.user_id == user_id).limit(1)
+        )
         return result if isinstance(result, UserPreferences) else None
 
-    def create_user_preferences(self, user_id: int, preferences_data: UserPreferencesBase) -> UserPreferences:
+    async def create_user_preferences(self, user_id: int, preferences_data: UserPreferencesBase) -> UserPreferences:
         """Create new user preferences"""
-        preferences = UserPreferences(
-            user_id=user_id,
-            dietary_restrictions=preferences_data.dietary_restrictions,
-            allergies=preferences_data.allergies,
-        )
-
-        self.db.add(preferences)
-        self.db.commit()
-        self.db.refresh(preferences)
+        return await _insert_preferences(self.db, user_id, preferences_data)
 
-        return preferences
-
-    def update_user_preferences(self, user_id: int, preferences_data: dict) -> UserPreferences:
+    async def update_user_preferences(self, user_id: int, preferences_data: dict) -> UserPreferences:
         """Update existing user preferences"""
-        preferences = self.get_user_preferences(user_id)
-
-        if not preferences:
-            raise ValueError("User preferences not found")
-
-        # Update fields that are provided
-        for field, value in preferences_data.items():
-            if hasattr(preferences, field) and value is not None:
-                setattr(preferences, field, value)
-
-        self.db.commit()
-        self.db.refresh(preferences)
-
-        return preferences
+        return await _update_preferences(self.db, user_id, preferences_data)
+
+    async def upsert_user_preferences(self, user_id: int, preferences_data: dict[str, Any]) -> UserPreferences:
+        """
+        Create or update user preferences in a single statement
+
+        Only fields with a value are written: on update, omitted or null
+        fields keep their stored value, as with update_user_preferences.
+
+        Args:
+            user_id: Owner of the preferences
+            preferences_data: Fields to write, e.g. model_dump(exclude_unset=True)
+
+        Returns:
+            Stored UserPreferences row
+        """
+        fields = {
+            field: value
+            for field, value in preferences_data.items()
+            if value is not None and field in UserPreferences.__table__.columns
+        }
+        statement = dialect_insert(self.db, UserPreferences).values(user_id=user_id, **fields)
+        # Python-side onupdate does not fire for ON CONFLICT, so set it here
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id"], set_={**fields, "updated_at": datetime.utcnow()}
+        ).returning(UserPreferences)
+        preferences = await self.db.scalar(statement, execution_options={"populate_existing": True})
+        await self.db.commit()
+        # Generation requests pick up the new values without a query
+        cache_user_preferences(cast(UserPreferences, preferences))
+        return cast(UserPreferences, preferences)
@@ -0,0 +1,145 @@
+"""
+In-process caching utilities
+LRU cache with per-entry TTL, optional size budget and hit/miss counters
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live
+
+    Thread-safe, so it can be shared between the event loop and worker threads.
+    With a weigher, the cache also keeps the total weight of its entries
+    (e.g. their size in bytes) under max_weight, evicting least recently
+    used entries first.
+
+    Example:
+        cache: TTLCache[str, int] = TTLCache(max_size=100, ttl_seconds=60)
+        cache.set("answer", 42)
+        cache.get("answer")  # 42
+
+        sized: TTLCache[str, bytes] = TTLCache(
+            max_size=1000, ttl_seconds=60, max_weight=1_000_000, weigher=len
+        )
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        max_weight: int | None = None,
+        weigher: Callable[[V], int] | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.max_weight = max_weight
+        self._weigher = weigher
+        self._clock = clock
+        # key -> (expires_at, value, weight)
+        self._data: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self._lock = Lock()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a cached value and mark it as most recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value, weight = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.weight -= weight
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting least recently used entries if full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+
+        weight = self._weigher(value) if self._weigher else 0
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.weight -= previous[2]
+            # An entry larger than the whole budget is never cached
+            if self.max_weight is not None and weight > self.max_weight:
+                return
+
+            self._data[key] = (self._clock() + self.ttl_seconds, value, weight)
+            self.weight += weight
+            while len(self._data) > self.max_size or (
+                self.max_weight is not None and self.weight > self.max_weight
+            ):
+                _, (_, _, evicted_weight) = self._data.popitem(last=False)
+                self.weight -= evicted_weight
+                self.evictions += 1
+
+    def delete(self, key: K) -> None:
+        """Remove a key from the cache if present"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self.weight -= entry[2]
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._data.clear()
+            self.weight = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss counters"""
+        lookups = self.hits + self.misses
+        stats: dict[str, Any] = {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+        if self.max_weight is not None:
+            stats["weight"] = self.weight
+            stats["max_weight"] = self.max_weight
+        return stats
@@ -0,0 +1,184 @@
+"""
+Circuit breaker for calls to an unreliable provider
+Trips on failure rate or slow-call rate and probes for recovery
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Count-based circuit breaker
+
+    Outcomes of the last window_size calls are kept. Once at least min_calls
+    are recorded, the circuit opens when the share of failed calls reaches
+    failure_rate_threshold or the share of calls slower than
+    slow_call_seconds reaches slow_call_rate_threshold. An open circuit
+    refuses calls for open_seconds, then lets up to half_open_max_calls
+    probes through: it closes when they all succeed quickly and opens again
+    on the first bad probe. Probes that never report back (e.g. a cancelled
+    caller) free their slots after probe_timeout_seconds.
+
+    Example:
+        breaker = CircuitBreaker()
+        breaker.before_call()  # raises CircuitOpenError while open
+        started = time.monotonic()
+        try:
+            result = await fetch()
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success(time.monotonic() - started)
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 20.0,
+        slow_call_rate_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        probe_timeout_seconds: float = 150.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self._clock = clock
+        # (failed, slow) per recorded call, oldest first
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+        self._last_probe_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the open period is over"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probes_succeeded = 0
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently refused outright"""
+        return self.state == OPEN
+
+    def before_call(self) -> None:
+        """
+        Ask permission to make a call
+
+        Every permitted call must be followed by record_success,
+        record_failure or record_ignored.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all probe slots are taken
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN:
+            now = self._clock()
+            if now - self._last_probe_at >= self.probe_timeout_seconds:
+                # The probes in flight never reported back: stop waiting for them
+                self._probes_in_flight = 0
+            if self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                self._last_probe_at = now
+                return
+        self.rejected += 1
+        raise CircuitOpenError("AI provider is temporarily unavailable")
+
+    def record_success(self, duration: float) -> None:
+        """
+        Record a completed call
+
+        Args:
+            duration: Call duration in seconds (slow calls count against the circuit)
+        """
+        slow = duration >= self.slow_call_seconds
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if slow:
+                self._open()
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self.half_open_max_calls:
+                self._close()
+            return
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        """Record a call that failed because of the provider"""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._open()
+            return
+        self._record(failed=True, slow=False)
+
+    def record_ignored(self) -> None:
+        """Release a permitted call whose outcome says nothing about provider health"""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        self._outcomes.append((failed, slow))
+        if self._state != CLOSED or len(self._outcomes) < self.min_calls:
+            return
+        total = len(self._outcomes)
+        failures = sum(1 for failed_call, _ in self._outcomes if failed_call)
+        slow_calls = sum(1 for _, slow_call in self._outcomes if slow_call)
+        if (
+            failures / total >= self.failure_rate_threshold
+            or slow_calls / total >= self.slow_call_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._probes_in_flight = 0
+        self._probes_succeeded = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return state, recent failure and slow-call rates and counters"""
+        state = self.state
+        total = len(self._outcomes)
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow_calls = sum(1 for _, slow in self._outcomes if slow)
+        return {
+            "state": state,
+            "window_calls": total,
+            "failure_rate": failures / total if total else 0.0,
+            "slow_call_rate": slow_calls / total if total else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,142 @@
+"""
+Incremental JSON parsing for streamed LLM output
+Emits values of a top-level JSON object as soon as they are complete
+"""
+
+import json
+from typing import Any
+
+
+class IncrementalJSONParser:
+    """
+    Parse a JSON object that arrives in arbitrary text chunks
+
+    feed() returns (key, value) events for the top-level object:
+    - a scalar or object field is emitted once its value is complete
+    - an array field is emitted element by element, as each one completes
+
+    Example:
+        parser = IncrementalJSONParser()
+        parser.feed('{"name": "Soup", "recipes": [{"a": 1}, ')
+        # [("name", "Soup"), ("recipes", {"a": 1})]
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key: str | None = None
+        self._key_start: int | None = None
+        # Value currently being captured: start offset, kind and nesting depth
+        self._value_start: int | None = None
+        self._value_kind = ""
+        self._value_depth = 0
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume a chunk of text
+
+        Args:
+            chunk: Next piece of the JSON document
+
+        Returns:
+            Events completed by this chunk, in document order
+
+        Raises:
+            json.JSONDecodeError: If a completed value is malformed
+        """
+        self._buffer += chunk
+        events: list[tuple[str, Any]] = []
+        while self._pos < len(self._buffer):
+            self._step(self._buffer[self._pos], events)
+            self._pos += 1
+        return events
+
+    def _at_value_slot(self) -> bool:
+        """Whether the cursor is where a top-level value or array element starts"""
+        depth = len(self._stack)
+        if depth == 1:
+            return self._stack[0] == "{" and not self._expect_key
+        return depth == 2 and self._stack[0] == "{" and self._stack[1] == "["
+
+    def _start_value(self, kind: str) -> None:
+        self._value_start = self._pos
+        self._value_kind = kind
+        self._value_depth = len(self._stack)
+
+    def _emit(self, end: int, events: list[tuple[str, Any]]) -> None:
+        """Decode the captured value ending at end (exclusive) and record it"""
+        if self._value_start is None:
+            raise json.JSONDecodeError("Value ended before it started", self._buffer, end)
+        text = self._buffer[self._value_start:end].strip()
+        self._value_start = None
+        if self._key is not None:
+            events.append((self._key, json.loads(text)))
+
+    def _step(self, char: str, events: list[tuple[str, Any]]) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._key_start is not None:
+                    self._key = json.loads(self._buffer[self._key_start:self._pos + 1])
+                    self._key_start = None
+                elif (
+                    self._value_start is not None
+                    and self._value_kind == "string"
+                    and self._value_depth == len(self._stack)
+                ):
+                    self._emit(self._pos + 1, events)
+            return
+
+        if char.isspace():
+            return
+
+        depth = len(self._stack)
+        if char == '"':
+            self._in_string = True
+            if depth == 1 and self._expect_key:
+                self._key_start = self._pos
+            elif self._value_start is None and self._at_value_slot():
+                self._start_value("string")
+        elif char in "{[":
+            # Top-level arrays are split into elements rather than captured whole
+            if self._value_start is None and self._at_value_slot() and not (depth == 1 and char == "["):
+                self._start_value("container")
+            self._stack.append(char)
+            if depth == 0:
+                self._expect_key = True
+        elif char in "}]":
+            self._finish_scalar(events)
+            if self._stack:
+                self._stack.pop()
+            if (
+                self._value_start is not None
+                and self._value_kind == "container"
+                and self._value_depth == len(self._stack)
+            ):
+                self._emit(self._pos + 1, events)
+        elif char == ",":
+            self._finish_scalar(events)
+            if depth == 1:
+                self._expect_key = True
+        elif char == ":":
+            if depth == 1:
+                self._expect_key = False
+        elif self._value_start is None and self._at_value_slot():
+            self._start_value("scalar")
+
+    def _finish_scalar(self, events: list[tuple[str, Any]]) -> None:
+        """Emit a number, boolean or null ending at the current delimiter"""
+        if (
+            self._value_start is not None
+            and self._value_kind == "scalar"
+            and self._value_depth == len(self._stack)
+        ):
+            self._emit(self._pos, events)
@@ -0,0 +1,204 @@
+"""
+Adaptive concurrency limiting for calls to rate-limited providers
+AIMD concurrency window, bounded wait queue and jittered retry backoff
+"""
+
+import asyncio
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class LimiterRejectedError(Exception):
+    """Raised when a call cannot get a concurrency slot (queue full or wait timed out)"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit concurrent calls with an AIMD-adjusted window
+
+    The window grows by about one slot per window of successful calls
+    (additive increase) and is multiplied by decrease_factor when the
+    provider signals overload (multiplicative decrease). The window shrinks
+    at most once per round trip: overloads from calls that started before
+    the last decrease are counted but do not shrink it again. Callers beyond the
+    window wait in a FIFO queue of at most max_queue entries for at most
+    queue_timeout seconds. Overload errors are retried with jittered
+    exponential backoff.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(is_overload=lambda e: isinstance(e, TimeoutError))
+        result = await limiter.call(lambda: fetch())
+    """
+
+    def __init__(
+        self,
+        is_overload: Callable[[BaseException], bool],
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        max_queue: int = 500,
+        queue_timeout: float = 30.0,
+        decrease_factor: float = 0.5,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 8.0,
+    ) -> None:
+        self.is_overload = is_overload
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.decrease_factor = decrease_factor
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        # Incremented on every decrease; calls remember the value they started under
+        self._decrease_epoch = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.successes = 0
+        self.overloads = 0
+        self.retries = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency window"""
+        return max(self.min_limit, int(self._limit))
+
+    async def acquire(self) -> int:
+        """
+        Wait for a concurrency slot
+
+        Returns:
+            Decrease epoch the call starts under, to pass back to release()
+
+        Raises:
+            LimiterRejectedError: If the queue is full or the wait times out
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return self._decrease_epoch
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise LimiterRejectedError("Too many requests waiting for the AI provider")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+        except TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as the timeout fired
+                return self._decrease_epoch
+            waiter.cancel()
+            self._remove_waiter(waiter)
+            self.timeouts += 1
+            raise LimiterRejectedError("Timed out waiting for the AI provider") from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                waiter.cancel()
+                self._remove_waiter(waiter)
+            raise
+        return self._decrease_epoch
+
+    def release(
+        self, overloaded: bool = False, succeeded: bool = True, epoch: int | None = None
+    ) -> None:
+        """
+        Return a slot and adapt the window to the call outcome
+
+        Args:
+            overloaded: The provider signalled overload (429, 5xx, timeout)
+            succeeded: The call succeeded (ignored when overloaded)
+            epoch: Value returned by acquire(); an overloaded call that started
+                before the last decrease does not shrink the window again
+        """
+        if overloaded:
+            self.overloads += 1
+            if epoch is None or epoch == self._decrease_epoch:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                self._decrease_epoch += 1
+        elif succeeded:
+            self.successes += 1
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+        self._release_slot()
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn inside a slot, retrying overload errors with backoff
+
+        Args:
+            fn: Factory returning the awaitable to run (called once per attempt)
+
+        Returns:
+            Result of fn
+
+        Raises:
+            LimiterRejectedError: If no slot could be obtained
+            Exception: The last error from fn when it is not retryable or
+                retries are exhausted
+        """
+        attempt = 0
+        while True:
+            epoch = await self.acquire()
+            try:
+                result = await fn()
+            except Exception as e:
+                overloaded = self.is_overload(e)
+                self.release(overloaded=overloaded, succeeded=False, epoch=epoch)
+                if not overloaded or attempt >= self.max_retries:
+                    raise
+                self.retries += 1
+                await asyncio.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                self.release(succeeded=False)
+                raise
+
+            self.release()
+            return result
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt"""
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def _release_slot(self) -> None:
+        """Free a slot and hand free slots to queued waiters in order"""
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _remove_waiter(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        """Return window size, queue depth and outcome counters"""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
@@ -0,0 +1,44 @@
+"""
+Keyset pagination cursors
+Opaque tokens encoding the sort key of the last row of a page
+"""
+
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """
+    Build an opaque cursor pointing just after a row
+
+    Args:
+        sort_value: Timestamp the rows are sorted by
+        row_id: Row id, used to break ties between equal timestamps
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"t": sort_value.isoformat(), "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Read the position encoded by encode_cursor
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (timestamp, row id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), int(data["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid pagination cursor") from e
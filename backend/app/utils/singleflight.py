@@ -0,0 +1,71 @@
+"""
+Single-flight request coalescing
+Concurrent callers with the same key share one in-flight coroutine
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Deduplicate concurrent async calls by key
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task instead of starting their own. The
+    task is shielded, so one caller being cancelled does not cancel the
+    shared work for the others.
+
+    Example:
+        flight: SingleFlight[dict] = SingleFlight()
+        data = await flight.do("pasta", lambda: fetch_recipe("pasta"))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for all concurrent callers with the same key
+
+        Args:
+            key: Deduplication key
+            fn: Factory returning the awaitable to run
+
+        Returns:
+            Result of the shared call (exceptions are shared too)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call for key is currently running"""
+        return key in self._calls
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Drop a finished task and mark its exception as retrieved"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """Return in-flight and coalescing counters"""
+        return {
+            "in_flight": len(self._calls),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
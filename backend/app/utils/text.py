@@ -0,0 +1,24 @@
+"""
+Text normalization
+Canonical forms of free-text names and terms used in cache and lookup keys
+"""
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lowercase a name and collapse surrounding and repeated whitespace
+
+    Example:
+        normalize_name("  Chicken  Pasta ")  # "chicken pasta"
+    """
+    return " ".join(name.split()).lower()
+
+
+def normalize_terms(terms: list[str] | None) -> list[str]:
+    """
+    Lowercase, trim, deduplicate and sort a list of free-text terms
+
+    Example:
+        normalize_terms([" Vegan", "nuts", "vegan", ""])  # ["nuts", "vegan"]
+    """
+    return sorted({term.strip().lower() for term in terms or [] if term.strip()})
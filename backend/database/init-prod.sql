@@ -18,9 +18,17 @@ CREATE TABLE IF NOT EXISTS recipes (
     cooking_time INTEGER, -- in minutes
     prep_time INTEGER, -- in minutes
     difficulty INTEGER CHECK (difficulty >= 1 AND difficulty <= 10), -- 1=easy, 10=expert
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    lookup_key VARCHAR(220) -- "<lowercased name>|<restrictions fingerprint>"
 );
 
+-- Existing databases: add and backfill the lookup key (recipes without restrictions)
+ALTER TABLE recipes ADD COLUMN IF NOT EXISTS lookup_key VARCHAR(220);
+UPDATE recipes
+    SET lookup_key = lower(regexp_replace(btrim(name), '\s+', ' ', 'g')) || '|'
+    WHERE lookup_key IS NULL;
+CREATE INDEX IF NOT EXISTS ix_recipes_lookup_key ON recipes (lookup_key);
+
 CREATE TABLE IF NOT EXISTS saved_recipes (
     id SERIAL PRIMARY KEY,
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE,
@@ -29,6 +37,10 @@ CREATE TABLE IF NOT EXISTS saved_recipes (
     UNIQUE(user_id, recipe_id)
 );
 
+-- Keyset pagination of a user's saved recipes (newest first)
+CREATE INDEX IF NOT EXISTS ix_saved_recipes_user_saved_at
+    ON saved_recipes (user_id, saved_at DESC, id);
+
 CREATE TABLE IF NOT EXISTS user_preferences (
     id SERIAL PRIMARY KEY,
     user_id INTEGER REFERENCES users(id) ON DELETE CASCADE UNIQUE,
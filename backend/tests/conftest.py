@@ -3,8 +3,10 @@ Test fixtures and configuration
 Provides database and client fixtures for testing
 """
 
+import asyncio
 import os
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
+from typing import Any
 
 # Set environment variables before importing app
 os.environ["ENVIRONMENT"] = "test"
@@ -16,14 +18,18 @@ os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"] = "30"
 
 from fastapi.testclient import TestClient
 from pytest import fixture
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.database import Base, get_db
+from app.core.database import AsyncSessionLocal, Base, async_engine, get_db
 from app.main import app
 from app.models.recipe import Recipe
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
+from app.services.auth_service import user_identity_cache
+from app.services.recipe_cache import recipe_cache
+from app.services.user_service import user_preferences_cache
 
 # Test database URL (in-memory SQLite for tests)
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -36,6 +42,28 @@ engine = create_engine(
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Runs an async service call, e.g. run_db(lambda s: get_recipe_by_id(s, 1))
+RunDB = Callable[[Callable[[AsyncSession], Awaitable[Any]]], Any]
+
+
+class QueryCounter:
+    """Count SQL statements executed through the async engine"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.statements: list[str] = []
+
+    def _count(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", self._count)
+
 
 @fixture(scope="function")  # type: ignore[misc]
 def db() -> Generator[Session, None, None]:
@@ -44,6 +72,10 @@ def db() -> Generator[Session, None, None]:
     """
     # Create tables
     Base.metadata.create_all(bind=engine)
+    # Ids restart with every database: forget cached recipes and users
+    recipe_cache.clear()
+    user_identity_cache.clear()
+    user_preferences_cache.clear()
 
     # Create session
     db = TestingSessionLocal()
@@ -56,6 +88,22 @@ def db() -> Generator[Session, None, None]:
     Base.metadata.drop_all(bind=engine)
 
 
+@fixture(scope="function")  # type: ignore[misc]
+def run_db(db: Session) -> RunDB:
+    """
+    Run async service calls with a fresh AsyncSession on the test database
+    """
+
+    def run(call: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async def main() -> Any:
+            async with AsyncSessionLocal() as session:
+                return await call(session)
+
+        return asyncio.run(main())
+
+    return run
+
+
 @fixture(scope="function")  # type: ignore[misc]
 def client(db: Session) -> Generator[TestClient, None, None]:
     """
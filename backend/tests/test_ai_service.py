@@ -0,0 +1,349 @@
+"""
+Tests for the AI service (Mistral client is mocked)
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from mistralai.models import SDKError
+
+from app.llm import MistralBackend
+from app.schemas.recipe import RecipeDetailsRequest, RecipeGenerateRequest
+from app.services.ai_service import (
+    AICircuitOpenError,
+    AIService,
+    AIServiceUnavailableError,
+    is_overload_error,
+    recipe_list_cache_key,
+)
+from app.utils.circuit_breaker import HALF_OPEN
+from app.utils.limiter import AdaptiveConcurrencyLimiter, LimiterRejectedError
+
+
+def _mistral_service() -> tuple[AIService, MistralBackend]:
+    """AI service on a Mistral backend, whose SDK client the tests patch"""
+    backend = MistralBackend(api_key="test_key", model="mistral-small-latest")
+    return AIService(backend=backend), backend
+
+
+def _mock_response(payload: dict[str, Any]) -> MagicMock:
+    """Build a fake Mistral chat completion response"""
+    response = MagicMock()
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+def test_generate_recipe_list_uses_async_client() -> None:
+    """Test recipe list generation awaits the async completion API"""
+    service, backend = _mistral_service()
+    payload = {
+        "recipes": [
+            {"name": "Fried Rice", "description": "Quick", "cooking_time": 15, "difficulty": 2},
+        ]
+    }
+
+    with patch.object(
+        backend.client.chat, "complete_async", new=AsyncMock(return_value=_mock_response(payload))
+    ) as mock_complete:
+        recipes = asyncio.run(
+            service.generate_recipe_list(RecipeGenerateRequest(ingredients=["rice"]))
+        )
+
+    mock_complete.assert_awaited_once()
+    assert len(recipes) == 1
+    assert recipes[0].name == "Fried Rice"
+
+
+def test_generate_recipe_details_formats_lists() -> None:
+    """Test recipe details normalizes instructions and string ingredients"""
+    service, backend = _mistral_service()
+    payload = {
+        "name": "Fried Rice",
+        "servings": 2,
+        "ingredients": ["rice", {"name": "egg", "quantity": "2"}],
+        "instructions": ["Cook rice", "Fry"],
+    }
+
+    with patch.object(
+        backend.client.chat, "complete_async", new=AsyncMock(return_value=_mock_response(payload))
+    ):
+        data = asyncio.run(
+            service.generate_recipe_details(RecipeDetailsRequest(recipe_name="Fried Rice"))
+        )
+
+    assert data["instructions"] == "Cook rice\nFry"
+    assert data["ingredients"][0] == {"name": "rice", "quantity": "as needed"}
+
+
+def test_generate_recipe_list_calls_run_concurrently() -> None:
+    """Test slow completions do not serialize concurrent generations"""
+    service, backend = _mistral_service()
+    payload = {"recipes": [{"name": "Soup"}]}
+
+    async def slow_complete(**_: Any) -> MagicMock:
+        await asyncio.sleep(0.2)
+        return _mock_response(payload)
+
+    async def run_many() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                service.generate_recipe_list(RecipeGenerateRequest(ingredients=[f"item{i}"]))
+                for i in range(20)
+            )
+        )
+
+    with patch.object(backend.client.chat, "complete_async", new=slow_complete):
+        start = time.perf_counter()
+        results = asyncio.run(run_many())
+        elapsed = time.perf_counter() - start
+
+    assert len(results) == 20
+    assert elapsed < 1.0
+
+
+def test_recipe_list_cache_key_is_normalized() -> None:
+    """Test equivalent requests share a cache key"""
+    first = RecipeGenerateRequest(
+        ingredients=["Chicken", " rice", "onion", "rice"],
+        dietary_restrictions=["Gluten-Free"],
+    )
+    second = RecipeGenerateRequest(
+        ingredients=["onion", "chicken ", "RICE"],
+        dietary_restrictions=["gluten-free"],
+    )
+    different = RecipeGenerateRequest(ingredients=["chicken", "rice", "onion"], servings=4)
+    allergic = first.model_copy(update={"allergies": ["Peanuts"]})
+
+    assert recipe_list_cache_key(first) == recipe_list_cache_key(second)
+    assert recipe_list_cache_key(first) != recipe_list_cache_key(different)
+    assert recipe_list_cache_key(first) != recipe_list_cache_key(allergic)
+
+
+def test_generate_recipe_list_served_from_cache() -> None:
+    """Test a repeated request does not call Mistral again"""
+    service, backend = _mistral_service()
+    payload = {"recipes": [{"name": "Chicken Rice"}]}
+
+    with patch.object(
+        backend.client.chat, "complete_async", new=AsyncMock(return_value=_mock_response(payload))
+    ) as mock_complete:
+        first = asyncio.run(
+            service.generate_recipe_list(RecipeGenerateRequest(ingredients=["chicken", "rice"]))
+        )
+        second = asyncio.run(
+            service.generate_recipe_list(RecipeGenerateRequest(ingredients=["Rice", "Chicken"]))
+        )
+
+    assert mock_complete.await_count == 1
+    assert first == second
+    assert service.recipe_list_cache.stats()["hits"] == 1
+
+
+def _mock_stream(text: str, chunk_size: int = 4) -> Any:
+    """Build a fake Mistral completion event stream yielding text in chunks"""
+
+    async def events() -> Any:
+        for start in range(0, len(text), chunk_size):
+            event = MagicMock()
+            event.data.choices[0].delta.content = text[start:start + chunk_size]
+            yield event
+
+    return events()
+
+
+def test_stream_recipe_list_yields_each_recipe() -> None:
+    """Test streamed recipes are parsed incrementally and then cached"""
+    service, backend = _mistral_service()
+    payload = {"recipes": [{"name": "Omelette", "difficulty": 2}, {"name": "Frittata"}]}
+    request = RecipeGenerateRequest(ingredients=["eggs"])
+
+    async def collect() -> list[Any]:
+        return [recipe async for recipe in service.stream_recipe_list(request)]
+
+    with patch.object(
+        backend.client.chat,
+        "stream_async",
+        new=AsyncMock(return_value=_mock_stream(json.dumps(payload))),
+    ):
+        recipes = asyncio.run(collect())
+
+    assert [recipe.name for recipe in recipes] == ["Omelette", "Frittata"]
+    assert service.recipe_list_cache.get(recipe_list_cache_key(request)) == tuple(recipes)
+
+
+def test_rate_limited_call_is_retried() -> None:
+    """Test a 429 from Mistral is retried through the limiter"""
+    service, backend = _mistral_service()
+    service.limiter.retry_base_delay = 0.001
+    payload = {"recipes": [{"name": "Pancakes"}]}
+    complete = AsyncMock(side_effect=[SDKError("rate limited", 429), _mock_response(payload)])
+
+    with patch.object(backend.client.chat, "complete_async", new=complete):
+        recipes = asyncio.run(
+            service.generate_recipe_list(RecipeGenerateRequest(ingredients=["flour"]))
+        )
+
+    assert [recipe.name for recipe in recipes] == ["Pancakes"]
+    assert service.limiter.stats()["retries"] == 1
+
+
+def test_exhausted_retries_raise_unavailable() -> None:
+    """Test persistent overload surfaces as AIServiceUnavailableError"""
+    service, backend = _mistral_service()
+    service.limiter.retry_base_delay = 0.001
+    service.limiter.max_retries = 1
+
+    with patch.object(
+        backend.client.chat, "complete_async", new=AsyncMock(side_effect=SDKError("down", 503))
+    ), pytest.raises(AIServiceUnavailableError):
+        asyncio.run(service.generate_recipe_list(RecipeGenerateRequest(ingredients=["flour"])))
+
+
+def test_limiter_rejections_do_not_open_circuit() -> None:
+    """Test our own full queue is reported as unavailable without tripping the breaker"""
+    service, _ = _mistral_service()
+    service.breaker.min_calls = 2
+    request = RecipeGenerateRequest(ingredients=["flour"])
+
+    with patch.object(
+        service.limiter, "call", new=AsyncMock(side_effect=LimiterRejectedError("queue full"))
+    ):
+        for _ in range(3):
+            with pytest.raises(AIServiceUnavailableError):
+                asyncio.run(service.generate_recipe_list(request))
+
+    assert not service.breaker.is_open
+
+
+def test_open_circuit_fails_fast() -> None:
+    """Test repeated overload opens the breaker and later calls skip Mistral"""
+    service, backend = _mistral_service()
+    service.limiter.max_retries = 0
+    service.breaker.min_calls = 2
+    complete = AsyncMock(side_effect=SDKError("down", 503))
+    request = RecipeGenerateRequest(ingredients=["flour"])
+
+    with patch.object(backend.client.chat, "complete_async", new=complete):
+        for _ in range(2):
+            with pytest.raises(AIServiceUnavailableError):
+                asyncio.run(service.generate_recipe_list(request))
+        assert service.breaker.is_open
+
+        with pytest.raises(AICircuitOpenError):
+            asyncio.run(service.generate_recipe_list(request))
+
+    assert complete.await_count == 2
+
+
+def test_slow_calls_open_circuit() -> None:
+    """Test calls slower than the threshold count against the breaker"""
+    service, backend = _mistral_service()
+    service.breaker.min_calls = 1
+    service.breaker.slow_call_seconds = 0.0
+    payload = {"recipes": [{"name": "Pancakes"}]}
+
+    with patch.object(
+        backend.client.chat, "complete_async", new=AsyncMock(return_value=_mock_response(payload))
+    ):
+        asyncio.run(service.generate_recipe_list(RecipeGenerateRequest(ingredients=["flour"])))
+
+    assert service.breaker.is_open
+
+
+def test_unreachable_provider_opens_circuit() -> None:
+    """Test connection errors count against the breaker so degraded mode starts"""
+    service, backend = _mistral_service()
+    service.breaker.min_calls = 2
+    complete = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
+    request = RecipeGenerateRequest(ingredients=["flour"])
+
+    with patch.object(backend.client.chat, "complete_async", new=complete):
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                asyncio.run(service.generate_recipe_list(request))
+        assert service.breaker.is_open
+
+        with pytest.raises(AICircuitOpenError):
+            asyncio.run(service.generate_recipe_list(request))
+
+    assert complete.await_count == 2
+
+
+def test_unreachable_provider_stream_opens_circuit() -> None:
+    """Test a stream that cannot connect counts against the breaker"""
+    service, backend = _mistral_service()
+    service.breaker.min_calls = 1
+    request = RecipeGenerateRequest(ingredients=["flour"])
+
+    async def collect() -> list[Any]:
+        return [recipe async for recipe in service.stream_recipe_list(request)]
+
+    with patch.object(
+        backend.client.chat,
+        "stream_async",
+        new=AsyncMock(side_effect=httpx.ConnectError("connection refused")),
+    ), pytest.raises(httpx.ConnectError):
+        asyncio.run(collect())
+
+    assert service.breaker.is_open
+
+
+def test_limiter_queue_time_is_not_a_slow_call() -> None:
+    """Test waiting for a limiter slot does not count as a slow provider call"""
+    service, backend = _mistral_service()
+    service.limiter = AdaptiveConcurrencyLimiter(
+        is_overload=is_overload_error, initial_limit=1, min_limit=1, max_limit=1
+    )
+    service.breaker.min_calls = 1
+    service.breaker.slow_call_seconds = 0.5
+    payload = {"recipes": [{"name": "Pancakes"}]}
+
+    async def complete(**kwargs: Any) -> MagicMock:
+        await asyncio.sleep(0.1)
+        return _mock_response(payload)
+
+    async def run_all() -> None:
+        await asyncio.gather(
+            *(
+                service.generate_recipe_list(RecipeGenerateRequest(ingredients=[f"flour {i}"]))
+                for i in range(8)
+            )
+        )
+
+    with patch.object(backend.client.chat, "complete_async", new=complete):
+        asyncio.run(run_all())
+
+    assert not service.breaker.is_open
+    assert service.breaker.stats()["slow_call_rate"] == 0.0
+
+
+def test_cancelled_queued_stream_frees_probe_slot() -> None:
+    """Test a half-open probe cancelled in the limiter queue gives its slot back"""
+    service, _ = _mistral_service()
+    service.breaker.min_calls = 1
+    service.breaker.open_seconds = 0.0
+    service.breaker.record_failure()
+    request = RecipeDetailsRequest(recipe_name="Pancakes")
+
+    async def cancel_while_queued() -> None:
+        async def consume() -> None:
+            async for _ in service.stream_recipe_details(request):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    never_acquired = asyncio.Event()
+    with patch.object(service.limiter, "acquire", new=AsyncMock(side_effect=never_acquired.wait)):
+        asyncio.run(cancel_while_queued())
+
+    assert service.breaker.state == HALF_OPEN
+    service.breaker.before_call()
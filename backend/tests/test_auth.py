@@ -3,9 +3,12 @@ Tests for authentication endpoints
 """
 
 from fastapi.testclient import TestClient
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
 from app.models.user import User
+from app.services.auth_service import get_or_create_user, user_identity_cache
+from tests.conftest import QueryCounter, RunDB
 
 
 def test_login_new_user(client: TestClient, db: Session) -> None:
@@ -89,3 +92,65 @@ def test_login_multiple_times_same_user(client: TestClient, db: Session) -> None
     users = db.query(User).filter(User.username == username).all()
     assert len(users) == 1
 
+
+
+def test_authenticated_requests_use_identity_cache(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test requests after login authenticate without querying users"""
+    with QueryCounter() as queries:
+        response = client.get("/api/v1/me", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "testuser_auth"
+    assert queries.count == 0
+    assert user_identity_cache.stats()["hits"] >= 1
+
+
+def test_deleted_user_is_evicted_from_identity_cache(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test a deleted user's token stops working"""
+    assert client.get("/api/v1/me", headers=auth_headers).status_code == 200
+
+    user = db.query(User).filter(User.username == "testuser_auth").one()
+    db.delete(user)
+    db.commit()
+
+    assert user_identity_cache.get("testuser_auth") is None
+    assert client.get("/api/v1/me", headers=auth_headers).status_code == 401
+
+
+def test_core_delete_evicts_users_from_identity_cache(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test a Core DELETE on users, which fires no ORM events, also revokes cached identities"""
+    assert client.get("/api/v1/me", headers=auth_headers).status_code == 200
+
+    db.execute(delete(User).where(User.username == "testuser_auth"))
+    db.commit()
+
+    assert user_identity_cache.get("testuser_auth") is None
+    assert client.get("/api/v1/me", headers=auth_headers).status_code == 401
+
+
+def test_login_runs_single_statement(client: TestClient, test_user: User) -> None:
+    """Test login for new and existing users is one upsert statement"""
+    with QueryCounter() as queries:
+        existing = client.post("/api/v1/auth/login", json={"username": test_user.username})
+        new = client.post("/api/v1/auth/login", json={"username": "brand_new"})
+
+    assert existing.status_code == 200
+    assert new.status_code == 200
+    assert queries.count == 2
+    assert all("ON CONFLICT" in statement for statement in queries.statements)
+
+
+def test_get_or_create_user_upsert_returns_existing_row(run_db: RunDB, db: Session) -> None:
+    """Test a second upsert for one username returns the first row unchanged"""
+    first = run_db(lambda session: get_or_create_user(session, "storm"))
+    second = run_db(lambda session: get_or_create_user(session, "storm"))
+
+    assert second.id == first.id
+    assert second.created_at == first.created_at
+    assert db.query(User).filter(User.username == "storm").count() == 1
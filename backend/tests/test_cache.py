@@ -0,0 +1,80 @@
+"""
+Tests for in-process cache utilities
+"""
+
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hit_and_miss_counters() -> None:
+    """Test get records hits and misses"""
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted when full"""
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_entries_expire() -> None:
+    """Test entries are dropped after their TTL"""
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=30, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 29
+    assert cache.get("a") == 1
+
+    clock.now = 31
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_by_weight() -> None:
+    """Test least recently used entries are evicted to stay under max_weight"""
+    cache: TTLCache[str, str] = TTLCache(
+        max_size=10, ttl_seconds=60, max_weight=10, weigher=len
+    )
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", "xxxx")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "xxxx"
+    assert cache.stats()["weight"] == 8
+
+    # Larger than the whole budget: not cached, nothing evicted
+    cache.set("d", "x" * 11)
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+    cache.delete("a")
+    assert cache.stats()["weight"] == 4
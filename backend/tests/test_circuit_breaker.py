@@ -0,0 +1,149 @@
+"""
+Tests for the circuit breaker
+"""
+
+import pytest
+
+from app.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, **kwargs: object) -> CircuitBreaker:
+    options: dict[str, object] = {
+        "window_size": 10,
+        "min_calls": 4,
+        "failure_rate_threshold": 0.5,
+        "slow_call_seconds": 1.0,
+        "slow_call_rate_threshold": 0.5,
+        "open_seconds": 30.0,
+        "clock": clock,
+    }
+    options.update(kwargs)
+    return CircuitBreaker(**options)  # type: ignore[arg-type]
+
+
+def test_opens_on_failure_rate() -> None:
+    """Test the circuit opens once enough recorded calls fail"""
+    breaker = _breaker(FakeClock())
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_success(0.1)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_opens_on_slow_calls() -> None:
+    """Test the circuit opens when most calls are slower than the threshold"""
+    breaker = _breaker(FakeClock())
+
+    for duration in (0.1, 5.0, 5.0, 0.1):
+        breaker.before_call()
+        breaker.record_success(duration)
+
+    assert breaker.is_open
+
+
+def test_waits_for_min_calls() -> None:
+    """Test a few early failures do not open the circuit"""
+    breaker = _breaker(FakeClock())
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_closes_circuit() -> None:
+    """Test a successful probe after the open period restores service"""
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now = 30.0
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    """Test a failed or slow probe opens the circuit for another period"""
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record_failure()
+
+    clock.now = 30.0
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now = 59.0
+    assert breaker.is_open
+    clock.now = 60.0
+    breaker.before_call()
+    breaker.record_success(5.0)
+    assert breaker.is_open
+    assert breaker.stats()["times_opened"] == 3
+
+
+def test_ignored_probe_frees_its_slot() -> None:
+    """Test a probe with an irrelevant outcome lets another probe through"""
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+    breaker.record_failure()
+
+    clock.now = 30.0
+    breaker.before_call()
+    breaker.record_ignored()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_lost_probe_slot_is_freed_after_timeout() -> None:
+    """Test a probe that never reports back stops blocking the half-open circuit"""
+    clock = FakeClock()
+    breaker = _breaker(clock, min_calls=1, probe_timeout_seconds=60.0)
+    breaker.record_failure()
+
+    clock.now = 30.0
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 90.0
+    breaker.before_call()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
@@ -0,0 +1,26 @@
+"""
+Tests for database configuration helpers
+"""
+
+import pytest
+
+from app.core.database import async_database_url
+
+
+def test_async_database_url_uses_async_drivers() -> None:
+    """Test sync URLs are mapped to asyncpg and aiosqlite"""
+    assert (
+        async_database_url("postgresql://user:secret@db:5432/dishdash")
+        == "postgresql+asyncpg://user:secret@db:5432/dishdash"
+    )
+    assert (
+        async_database_url("postgresql+psycopg2://user@db/dishdash")
+        == "postgresql+asyncpg://user@db/dishdash"
+    )
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+def test_async_database_url_rejects_unknown_backend() -> None:
+    """Test backends without a configured async driver fail loudly"""
+    with pytest.raises(ValueError):
+        async_database_url("mysql://user@db/dishdash")
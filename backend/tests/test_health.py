@@ -36,3 +36,19 @@ def test_health_check_endpoint_accessible_without_auth(client: TestClient) -> No
     # Should not require authentication
     assert response.status_code == 200
 
+
+
+def test_health_stats(client: TestClient) -> None:
+    """Test stats endpoint reports recipe cache counters"""
+    response = client.get("/health/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert "recipe_list_cache" in data
+    assert "hits" in data["recipe_list_cache"]
+    assert "misses" in data["recipe_list_cache"]
+    assert "hit_rate" in data["recipe_cache"]["recipes"]
+    assert "weight" in data["recipe_cache"]["recipes"]
+    assert data["ai_circuit_breaker"]["state"] == "closed"
+    assert "pool" in data["db_pool"]
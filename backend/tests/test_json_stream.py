@@ -0,0 +1,59 @@
+"""
+Tests for incremental JSON parsing
+"""
+
+import json
+
+import pytest
+
+from app.utils.json_stream import IncrementalJSONParser
+
+
+def _feed_in_chunks(text: str, size: int) -> list[tuple[str, object]]:
+    parser = IncrementalJSONParser()
+    events: list[tuple[str, object]] = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+@pytest.mark.parametrize("size", [1, 5, 1000])  # type: ignore[misc]
+def test_emits_fields_and_array_elements(size: int) -> None:
+    """Test scalars, objects and array elements are emitted in order"""
+    document = {
+        "name": 'Soup "du jour" {special}',
+        "servings": 2,
+        "vegan": False,
+        "notes": None,
+        "timing": {"prep": [5, 10]},
+        "recipes": [{"name": "A", "tags": ["x]"]}, {"name": "B"}],
+        "steps": ["Chop", "Boil"],
+    }
+
+    for text in (json.dumps(document), json.dumps(document, indent=2)):
+        assert _feed_in_chunks(text, size) == [
+            ("name", 'Soup "du jour" {special}'),
+            ("servings", 2),
+            ("vegan", False),
+            ("notes", None),
+            ("timing", {"prep": [5, 10]}),
+            ("recipes", {"name": "A", "tags": ["x]"]}),
+            ("recipes", {"name": "B"}),
+            ("steps", "Chop"),
+            ("steps", "Boil"),
+        ]
+
+
+def test_array_element_emitted_before_document_ends() -> None:
+    """Test an element is available as soon as its object closes"""
+    parser = IncrementalJSONParser()
+
+    assert parser.feed('{"recipes": [{"name": "A"') == []
+    assert parser.feed("}, {") == [("recipes", {"name": "A"})]
+    assert parser.feed('"name": "B"}]}') == [("recipes", {"name": "B"})]
+
+
+def test_emit_without_captured_value_raises() -> None:
+    """Test an inconsistent parser state raises even when asserts are stripped"""
+    with pytest.raises(json.JSONDecodeError):
+        IncrementalJSONParser()._emit(0, [])
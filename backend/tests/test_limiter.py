@@ -0,0 +1,154 @@
+"""
+Tests for the adaptive concurrency limiter
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.limiter import AdaptiveConcurrencyLimiter, LimiterRejectedError
+
+
+class OverloadError(Exception):
+    """Stand-in for a 429 response"""
+
+
+def _limiter(**kwargs: object) -> AdaptiveConcurrencyLimiter:
+    options: dict[str, object] = {
+        "is_overload": lambda error: isinstance(error, OverloadError),
+        "retry_base_delay": 0.001,
+        "retry_max_delay": 0.002,
+    }
+    options.update(kwargs)
+    return AdaptiveConcurrencyLimiter(**options)  # type: ignore[arg-type]
+
+
+def test_window_grows_on_success_and_halves_on_overload() -> None:
+    """Test AIMD adjustment of the concurrency window"""
+    limiter = _limiter(initial_limit=4, max_retries=0)
+
+    async def ok() -> str:
+        return "ok"
+
+    async def overloaded() -> str:
+        raise OverloadError()
+
+    async def run() -> None:
+        for _ in range(8):
+            await limiter.call(ok)
+        assert limiter.limit == 5
+
+        with pytest.raises(OverloadError):
+            await limiter.call(overloaded)
+        assert limiter.limit == 2
+
+    asyncio.run(run())
+
+
+def test_concurrent_overloads_decrease_window_once() -> None:
+    """Test a burst of overloads from one round trip halves the window once"""
+    limiter = _limiter(initial_limit=8, max_retries=0)
+
+    async def overloaded() -> str:
+        await asyncio.sleep(0.01)
+        raise OverloadError()
+
+    async def run() -> None:
+        results = await asyncio.gather(
+            *(limiter.call(overloaded) for _ in range(8)), return_exceptions=True
+        )
+        assert all(isinstance(result, OverloadError) for result in results)
+        assert limiter.overloads == 8
+        assert limiter.limit == 4
+
+        # A call started after the decrease shrinks the window again
+        with pytest.raises(OverloadError):
+            await limiter.call(overloaded)
+        assert limiter.limit == 2
+
+    asyncio.run(run())
+
+
+def test_overload_errors_are_retried() -> None:
+    """Test a rate-limited call succeeds after retries"""
+    limiter = _limiter(max_retries=3)
+    attempts = 0
+
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise OverloadError()
+        return "ok"
+
+    assert asyncio.run(limiter.call(flaky)) == "ok"
+    assert attempts == 3
+    assert limiter.stats()["retries"] == 2
+
+
+def test_other_errors_are_not_retried() -> None:
+    """Test non-overload errors fail immediately without shrinking the window"""
+    limiter = _limiter(initial_limit=4)
+    attempts = 0
+
+    async def broken() -> str:
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(limiter.call(broken))
+
+    assert attempts == 1
+    assert limiter.limit == 4
+
+
+def test_queue_is_bounded() -> None:
+    """Test callers beyond the window and the queue are rejected"""
+    limiter = _limiter(initial_limit=1, min_limit=1, max_queue=1)
+
+    async def run() -> list[object]:
+        release = asyncio.Event()
+
+        async def hold() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(limiter.call(hold))
+        second = asyncio.ensure_future(limiter.call(hold))
+        await asyncio.sleep(0.01)
+        assert limiter.stats()["queue_depth"] == 1
+
+        with pytest.raises(LimiterRejectedError):
+            await limiter.call(hold)
+
+        release.set()
+        return list(await asyncio.gather(first, second))
+
+    assert asyncio.run(run()) == ["done", "done"]
+    assert limiter.stats()["rejected"] == 1
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_queue_wait_times_out() -> None:
+    """Test queued callers give up after the queue timeout"""
+    limiter = _limiter(initial_limit=1, min_limit=1, queue_timeout=0.05)
+
+    async def run() -> None:
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            await release.wait()
+
+        holder = asyncio.ensure_future(limiter.call(hold))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(LimiterRejectedError):
+            await limiter.acquire()
+
+        release.set()
+        await holder
+
+    asyncio.run(run())
+    assert limiter.stats()["timeouts"] == 1
+    assert limiter.stats()["queue_depth"] == 0
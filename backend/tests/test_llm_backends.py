@@ -0,0 +1,146 @@
+"""
+Tests for LLM backends and the fake LLM server
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from mistralai.models import SDKError
+
+from app.llm import (
+    FakeLLMBackend,
+    FakeLLMConfig,
+    LLMBackendError,
+    MistralBackend,
+    create_fake_llm_app,
+)
+from app.main import app
+from app.schemas.recipe import RecipeDetailsRequest, RecipeGenerateRequest
+from app.services.ai_service import AIService
+
+NO_LATENCY = FakeLLMConfig(latency_ms=0, tokens_per_second=0, seed=1)
+
+
+def test_fake_backend_is_deterministic() -> None:
+    """Test the same prompt always produces the same recipes"""
+    service = AIService(FakeLLMBackend(NO_LATENCY))
+    request = RecipeGenerateRequest(ingredients=["chicken", "rice"])
+
+    first = asyncio.run(service._request_recipe_list(request))
+    second = asyncio.run(service._request_recipe_list(request))
+
+    assert len(first) == 6
+    assert first == second
+    assert first[0].name.startswith("Chicken")
+
+
+def test_fake_backend_details_are_valid_recipes() -> None:
+    """Test fake details contain everything needed to store a recipe"""
+    service = AIService(FakeLLMBackend(NO_LATENCY))
+
+    data = asyncio.run(
+        service.generate_recipe_details(RecipeDetailsRequest(recipe_name="Lemon Chicken", servings=4))
+    )
+
+    assert data["name"] == "Lemon Chicken"
+    assert data["servings"] == 4
+    assert data["ingredients"]
+    assert "\n" in data["instructions"]
+
+
+def test_fake_backend_injects_errors() -> None:
+    """Test a 100% error rate always fails with the configured status"""
+    backend = FakeLLMBackend(FakeLLMConfig(latency_ms=0, error_rate=1.0, error_status=503))
+
+    with pytest.raises(LLMBackendError) as exc_info:
+        asyncio.run(backend.complete([{"role": "user", "content": "hi"}]))
+
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.parametrize("distribution", ["fixed", "uniform", "exponential", "lognormal"])  # type: ignore[misc]
+def test_fake_backend_latency_distributions(distribution: str) -> None:
+    """Test every latency distribution produces non-negative delays around the mean"""
+    backend = FakeLLMBackend(
+        FakeLLMConfig(latency_ms=100, latency_distribution=distribution, seed=7)
+    )
+
+    samples = [backend.sample_latency() for _ in range(2000)]
+
+    assert min(samples) >= 0
+    assert 0.08 < sum(samples) / len(samples) < 0.12
+
+
+def _mistral_backend_for(config: FakeLLMConfig) -> MistralBackend:
+    """Point the real Mistral SDK at the fake server app"""
+    transport = httpx.ASGITransport(app=create_fake_llm_app(config))
+    return MistralBackend(
+        api_key="test_key",
+        model="fake-model",
+        server_url="http://fake-llm",
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+
+
+def test_fake_server_speaks_mistral_protocol() -> None:
+    """Test the Mistral SDK can complete and stream against the fake server"""
+    backend = _mistral_backend_for(NO_LATENCY)
+    messages = AIService(backend)._build_recipe_details_messages(
+        RecipeDetailsRequest(recipe_name="Garlic Bread")
+    )
+
+    async def run() -> tuple[str | None, str]:
+        content = await backend.complete(messages)
+        streamed = "".join([chunk async for chunk in backend.stream(messages)])
+        await backend.aclose()
+        return content, streamed
+
+    content, streamed = asyncio.run(run())
+
+    assert content is not None
+    assert json.loads(content)["name"] == "Garlic Bread"
+    assert streamed == content
+
+
+def test_fake_server_returns_injected_errors() -> None:
+    """Test injected failures reach the SDK as HTTP errors"""
+    backend = _mistral_backend_for(FakeLLMConfig(latency_ms=0, error_rate=1.0, error_status=429))
+
+    with pytest.raises(SDKError) as exc_info:
+        asyncio.run(backend.complete([{"role": "user", "content": "hi"}]))
+
+    assert exc_info.value.status_code == 429
+
+
+def test_fake_server_starts_without_app_settings() -> None:
+    """Test the fake LLM server entry point does not load the API's settings"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.llm.fake_server; assert 'app.core.config' not in sys.modules",
+        ],
+        cwd=Path(__file__).resolve().parents[1],
+        env={"PATH": "", "PYTHONPATH": ""},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_app_shutdown_closes_llm_backend() -> None:
+    """Test the backend's HTTP client is closed when the app shuts down"""
+    from app.services.ai_service import ai_service
+
+    with patch.object(ai_service.backend, "aclose", new=AsyncMock()) as mock_aclose:
+        with TestClient(app):
+            mock_aclose.assert_not_awaited()
+        mock_aclose.assert_awaited_once()
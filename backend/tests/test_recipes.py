@@ -2,14 +2,50 @@
 Tests for recipe endpoints
 """
 
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.database import async_engine
 from app.models.recipe import Recipe
 from app.models.saved_recipe import SavedRecipe
-from app.schemas.recipe import RecipeListItem
+from app.models.user import User
+from app.models.user_preferences import UserPreferences
+from app.schemas.recipe import RecipeDetailsRequest, RecipeListItem
+from app.services.ai_service import AICircuitOpenError, AIServiceUnavailableError
+from app.services.auth_service import user_identity_cache
+from app.services.recipe_cache import recipe_cache
+from tests.conftest import QueryCounter
+
+
+class OpenConnections:
+    """Count connections currently checked out from the async engine"""
+
+    def __init__(self) -> None:
+        self.open = 0
+        self.total = 0
+
+    def _checkout(self, *args: Any) -> None:
+        self.open += 1
+        self.total += 1
+
+    def _checkin(self, *args: Any) -> None:
+        self.open -= 1
+
+    def __enter__(self) -> "OpenConnections":
+        event.listen(async_engine.sync_engine, "checkout", self._checkout)
+        event.listen(async_engine.sync_engine, "checkin", self._checkin)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        event.remove(async_engine.sync_engine, "checkout", self._checkout)
+        event.remove(async_engine.sync_engine, "checkin", self._checkin)
 
 
 def test_generate_recipes_success(
@@ -54,6 +90,88 @@ def test_generate_recipes_success(
         assert data["recipes"][1]["name"] == "Tomato Pasta"
 
 
+def test_generate_recipes_applies_stored_preferences(
+    client: TestClient, test_user_preferences: UserPreferences
+) -> None:
+    """Test stored restrictions and allergies are merged into generation requests"""
+    login = client.post("/api/v1/auth/login", json={"username": "testuser"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    request = {"ingredients": ["rice"], "dietary_restrictions": ["Vegetarian", "low-salt"]}
+    mock_recipes = [RecipeListItem(name="Fried Rice", description="Quick fried rice")]
+
+    with patch("app.api.v1.recipes.ai_service.generate_recipe_list") as mock_ai:
+        mock_ai.return_value = mock_recipes
+        first = client.post("/api/v1/recipes/generate", headers=headers, json=request)
+        # Preferences are now cached: generating again runs no query
+        with QueryCounter() as queries:
+            client.post("/api/v1/recipes/generate", headers=headers, json=request)
+        # Saving preferences replaces the cached ones
+        client.put("/api/v1/me/preferences", headers=headers, json={"allergies": ["soy"]})
+        client.post("/api/v1/recipes/generate", headers=headers, json=request)
+
+    assert first.status_code == 200
+    assert queries.count == 0
+    merged = mock_ai.call_args_list[0].args[0]
+    assert merged.dietary_restrictions == ["Vegetarian", "low-salt"]
+    assert merged.allergies == ["nuts"]
+    assert mock_ai.call_args_list[2].args[0].allergies == ["soy"]
+
+
+def test_get_recipe_details_separates_allergies(
+    client: TestClient, test_user_preferences: UserPreferences, test_recipe: Recipe
+) -> None:
+    """Test a stored recipe made without the user's allergies is not reused"""
+    login = client.post("/api/v1/auth/login", json={"username": "testuser"})
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    nut_free_recipe = {
+        "name": test_recipe.name,
+        "servings": 2,
+        "ingredients": [{"name": "pasta", "quantity": "200g"}],
+        "instructions": "Cook pasta",
+    }
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        return_value=nut_free_recipe,
+    ) as mock_ai:
+        response = client.post(
+            "/api/v1/recipes/details", headers=headers, json={"recipe_name": test_recipe.name}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["id"] != test_recipe.id
+    request = mock_ai.call_args.args[0]
+    assert request.dietary_restrictions == ["vegetarian"]
+    assert request.allergies == ["nuts"]
+
+
+def test_generate_recipes_releases_db_connection(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test no pooled connection is held while the AI generates"""
+    checked_out: list[int] = []
+
+    async def fake_generate(request: Any) -> list[RecipeListItem]:
+        checked_out.append(connections.open)
+        return [RecipeListItem(name="Pasta Carbonara")]
+
+    # Authenticate from the database rather than the identity cache
+    user_identity_cache.clear()
+    with (
+        OpenConnections() as connections,
+        patch("app.api.v1.recipes.ai_service.generate_recipe_list", new=fake_generate),
+    ):
+        response = client.post(
+            "/api/v1/recipes/generate",
+            headers=auth_headers,
+            json={"ingredients": ["pasta"], "servings": 2},
+        )
+
+    assert response.status_code == 200
+    assert checked_out == [0]
+    assert connections.total > 0
+
+
 def test_generate_recipes_no_auth(client: TestClient) -> None:
     """Test generating recipes without authentication fails"""
     response = client.post(
@@ -80,6 +198,157 @@ def test_generate_recipes_no_results(
         assert response.status_code == 404
 
 
+def test_generate_recipes_ai_overloaded(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test an overloaded AI provider returns 503 instead of 500"""
+    with patch("app.api.v1.recipes.ai_service.generate_recipe_list") as mock_ai:
+        mock_ai.side_effect = AIServiceUnavailableError("AI provider is overloaded")
+
+        response = client.post(
+            "/api/v1/recipes/generate",
+            headers=auth_headers,
+            json={"ingredients": ["pasta"], "servings": 2},
+        )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_generate_recipes_degraded_when_circuit_open(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test an open circuit serves stored recipes sharing ingredients"""
+    for name, ingredients in (
+        ("Chicken Rice Bowl", ["chicken breast", "rice"]),
+        ("Chicken Salad", ["chicken", "lettuce"]),
+        ("Chocolate Cake", ["flour", "chocolate"]),
+    ):
+        db.add(
+            Recipe(
+                name=name,
+                servings=2,
+                ingredients=[{"name": item, "quantity": "100g"} for item in ingredients],
+                instructions="Cook",
+            )
+        )
+    db.commit()
+
+    with patch("app.api.v1.recipes.ai_service.generate_recipe_list") as mock_ai:
+        mock_ai.side_effect = AICircuitOpenError("AI provider is temporarily unavailable")
+
+        response = client.post(
+            "/api/v1/recipes/generate",
+            headers=auth_headers,
+            json={"ingredients": ["Chicken", "rice"], "servings": 2},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["degraded"] is True
+    assert [recipe["name"] for recipe in data["recipes"]] == ["Chicken Rice Bowl", "Chicken Salad"]
+
+
+def test_generate_recipes_circuit_open_without_matches(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test an open circuit with no stored match returns 503"""
+    with patch("app.api.v1.recipes.ai_service.generate_recipe_list") as mock_ai:
+        mock_ai.side_effect = AICircuitOpenError("AI provider is temporarily unavailable")
+
+        response = client.post(
+            "/api/v1/recipes/generate",
+            headers=auth_headers,
+            json={"ingredients": ["saffron"], "servings": 2},
+        )
+
+    assert response.status_code == 503
+
+
+def test_generate_recipes_stream(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test streaming recipe generation sends one SSE event per recipe"""
+
+    async def fake_stream(request: Any) -> AsyncIterator[RecipeListItem]:
+        yield RecipeListItem(name="Pasta Carbonara", cooking_time=20)
+        yield RecipeListItem(name="Tomato Pasta", cooking_time=15)
+
+    with patch("app.api.v1.recipes.ai_service.stream_recipe_list", new=fake_stream):
+        response = client.post(
+            "/api/v1/recipes/generate/stream",
+            headers=auth_headers,
+            json={"ingredients": ["pasta", "tomatoes"], "servings": 2},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [lines[0] for lines in events] == ["event: recipe", "event: recipe", "event: done"]
+    assert '"name": "Pasta Carbonara"' in events[0][1]
+    assert events[2][1] == 'data: {"count": 2, "degraded": false}'
+
+
+def test_generate_recipes_stream_no_results(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test streaming recipe generation reports an error event when empty"""
+
+    async def empty_stream(request: Any) -> AsyncIterator[RecipeListItem]:
+        return
+        yield
+
+    with patch("app.api.v1.recipes.ai_service.stream_recipe_list", new=empty_stream):
+        response = client.post(
+            "/api/v1/recipes/generate/stream",
+            headers=auth_headers,
+            json={"ingredients": ["unknown"], "servings": 2},
+        )
+
+    assert response.status_code == 200
+    assert response.text.startswith("event: error")
+
+
+def test_get_recipe_details_rejects_long_names(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test names that would not fit the lookup key column are rejected before any AI call"""
+    long_name = "x" * 201
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details"
+    ) as mock_ai:
+        single = client.post(
+            "/api/v1/recipes/details", headers=auth_headers, json={"recipe_name": long_name}
+        )
+        batch = client.post(
+            "/api/v1/recipes/details/batch",
+            headers=auth_headers,
+            json={"recipe_names": ["Pasta", long_name]},
+        )
+
+    assert single.status_code == 422
+    assert batch.status_code == 422
+    mock_ai.assert_not_called()
+
+
+def test_get_recipe_details_preferences_error(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test a failure to read stored preferences returns the route's error response"""
+    with patch(
+        "app.api.v1.recipes.get_cached_user_preferences",
+        side_effect=RuntimeError("database unavailable"),
+    ):
+        response = client.post(
+            "/api/v1/recipes/details", headers=auth_headers, json={"recipe_name": "Pasta"}
+        )
+
+    assert response.status_code == 500
+    assert response.json()["detail"].startswith("Failed to get recipe details")
+
+
 def test_get_recipe_details_new_recipe(
     client: TestClient, auth_headers: dict[str, str], db: Session
 ) -> None:
@@ -119,6 +388,158 @@ def test_get_recipe_details_new_recipe(
         assert recipe is not None
 
 
+def test_get_recipe_details_matches_name_variants(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe, db: Session
+) -> None:
+    """Test casing and spacing variants of a stored recipe name do not regenerate it"""
+    with patch("app.services.recipe_generation_service.ai_service.generate_recipe_details") as mock_ai:
+        response = client.post(
+            "/api/v1/recipes/details",
+            headers=auth_headers,
+            json={"recipe_name": "  test   PASTA ", "servings": 2},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == test_recipe.id
+    mock_ai.assert_not_called()
+    assert db.query(Recipe).count() == 1
+
+
+def test_get_recipe_details_separates_dietary_restrictions(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
+) -> None:
+    """Test a stored recipe is not reused for a request with other restrictions"""
+    vegan_recipe = {
+        "name": test_recipe.name,
+        "servings": 2,
+        "ingredients": [{"name": "pasta", "quantity": "200g"}],
+        "instructions": "Cook pasta",
+    }
+    request = {"recipe_name": test_recipe.name, "dietary_restrictions": ["Vegan"]}
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        return_value=vegan_recipe,
+    ) as mock_ai:
+        first = client.post("/api/v1/recipes/details", headers=auth_headers, json=request)
+        # Same restrictions in another casing reuse the stored vegan recipe
+        request["dietary_restrictions"] = [" vegan"]
+        second = client.post("/api/v1/recipes/details", headers=auth_headers, json=request)
+
+    assert first.status_code == 200
+    assert first.json()["id"] != test_recipe.id
+    assert second.json()["id"] == first.json()["id"]
+    assert mock_ai.call_count == 1
+
+
+def test_get_recipe_details_reuses_recipe_renamed_by_ai(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test a recipe the AI named differently is found again by the requested name"""
+    renamed = {
+        "name": "Creamy Chicken Pasta",
+        "servings": 2,
+        "ingredients": [{"name": "chicken", "quantity": "200g"}],
+        "instructions": "Cook",
+    }
+    request = {"recipe_name": "chicken pasta"}
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        return_value=renamed,
+    ) as mock_ai:
+        responses = []
+        for _ in range(4):
+            # Go through the database, not just the in-process cache
+            recipe_cache.clear()
+            responses.append(client.post("/api/v1/recipes/details", headers=auth_headers, json=request))
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert {response.json()["id"] for response in responses} == {responses[0].json()["id"]}
+    assert responses[0].json()["name"] == "Creamy Chicken Pasta"
+    assert mock_ai.call_count == 1
+    assert db.query(Recipe).count() == 1
+
+
+def test_get_recipe_details_batch_reuses_recipes_renamed_by_ai(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test batch-generated recipes are stored under the requested names"""
+
+    def rename(request: RecipeDetailsRequest) -> dict[str, Any]:
+        return {
+            "name": f"Chef's {request.recipe_name.title()}",
+            "servings": 2,
+            "ingredients": [{"name": "rice", "quantity": "200g"}],
+            "instructions": "Cook",
+        }
+
+    request = {"recipe_names": ["rice salad", "rice soup"]}
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        side_effect=rename,
+    ) as mock_ai:
+        first = client.post("/api/v1/recipes/details/batch", headers=auth_headers, json=request)
+        recipe_cache.clear()
+        second = client.post("/api/v1/recipes/details/batch", headers=auth_headers, json=request)
+        single = client.post(
+            "/api/v1/recipes/details", headers=auth_headers, json={"recipe_name": "Rice Soup"}
+        )
+
+    assert [recipe["name"] for recipe in first.json()["recipes"]] == ["Chef's Rice Salad", "Chef's Rice Soup"]
+    assert second.json() == first.json()
+    assert single.json() == first.json()["recipes"][1]
+    assert mock_ai.call_count == 2
+    assert db.query(Recipe).count() == 2
+
+
+def test_get_recipe_details_served_from_recipe_cache(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
+) -> None:
+    """Test a recipe read once is then served without querying the database"""
+    request = {"recipe_name": test_recipe.name, "servings": 2}
+    first = client.post("/api/v1/recipes/details", headers=auth_headers, json=request)
+
+    with QueryCounter() as queries:
+        second = client.post("/api/v1/recipes/details", headers=auth_headers, json=request)
+
+    assert second.json() == first.json()
+    # The user, their preferences and the recipe come from in-process caches
+    assert queries.count == 0
+    assert recipe_cache.stats()["recipes"]["hits"] >= 1
+
+
+def test_get_recipe_details_releases_db_connection(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test no pooled connection is held while the AI generates details"""
+    checked_out: list[int] = []
+
+    async def fake_generate(request: Any) -> dict[str, Any]:
+        checked_out.append(connections.open)
+        return {
+            "name": "Slow Soup",
+            "servings": 2,
+            "ingredients": [{"name": "water", "quantity": "1l"}],
+            "instructions": "Boil",
+        }
+
+    with (
+        OpenConnections() as connections,
+        patch("app.services.recipe_generation_service.ai_service.generate_recipe_details", new=fake_generate),
+    ):
+        response = client.post(
+            "/api/v1/recipes/details",
+            headers=auth_headers,
+            json={"recipe_name": "Slow Soup", "servings": 2},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["id"]
+    assert checked_out == [0]
+    assert connections.total > 0
+
+
 def test_get_recipe_details_existing_recipe(
     client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
 ) -> None:
@@ -136,6 +557,121 @@ def test_get_recipe_details_existing_recipe(
     assert data["id"] == test_recipe.id
 
 
+def test_get_recipe_details_batch(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe, db: Session
+) -> None:
+    """Test batch details returns stored recipes and generates missing ones"""
+    generated: list[str] = []
+
+    async def fake_generate(request: Any) -> dict[str, Any]:
+        generated.append(request.recipe_name)
+        if request.recipe_name == "Mystery Dish":
+            return {}
+        return {
+            "name": request.recipe_name,
+            "servings": request.servings,
+            "ingredients": [{"name": "flour", "quantity": "100g"}],
+            "instructions": "Bake",
+        }
+
+    with patch("app.services.recipe_generation_service.ai_service.generate_recipe_details", new=fake_generate):
+        response = client.post(
+            "/api/v1/recipes/details/batch",
+            headers=auth_headers,
+            json={
+                "recipe_names": ["Bread", test_recipe.name, "Mystery Dish", "Cake", "Bread"],
+                "servings": 3,
+            },
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert [recipe["name"] for recipe in data["recipes"]] == ["Bread", test_recipe.name, "Cake"]
+    assert data["recipes"][1]["id"] == test_recipe.id
+    assert data["failed"] == ["Mystery Dish"]
+    assert sorted(generated) == ["Bread", "Cake", "Mystery Dish"]
+    assert db.query(Recipe).filter(Recipe.name.in_(["Bread", "Cake"])).count() == 2
+
+
+def test_get_recipe_details_batch_requires_names(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test batch details rejects an empty name list"""
+    response = client.post(
+        "/api/v1/recipes/details/batch",
+        headers=auth_headers,
+        json={"recipe_names": []},
+    )
+
+    assert response.status_code == 422
+
+
+def _parse_sse(text: str) -> list[tuple[str, Any]]:
+    """Split an SSE body into (event, data) pairs"""
+    events = []
+    for block in text.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+def test_get_recipe_details_stream_new_recipe(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test streaming details sends sections progressively and stores the recipe"""
+
+    async def fake_stream(request: Any) -> AsyncIterator[tuple[str, Any]]:
+        yield "name", "Streamed Stew"
+        yield "servings", 4
+        yield "cooking_time", 90
+        yield "ingredients", {"name": "beef", "quantity": "1kg"}
+        yield "ingredients", {"name": "carrots", "quantity": "3"}
+        yield "instructions", "Brown the beef"
+        yield "instructions", "Simmer"
+
+    with patch("app.services.recipe_generation_service.ai_service.stream_recipe_details", new=fake_stream):
+        response = client.post(
+            "/api/v1/recipes/details/stream",
+            headers=auth_headers,
+            json={"recipe_name": "Streamed Stew", "servings": 4},
+        )
+
+    assert response.status_code == 200
+    events = _parse_sse(response.text)
+
+    assert [event for event, _ in events] == [
+        "field", "field", "field", "ingredient", "ingredient", "step", "step", "recipe",
+    ]
+    assert events[0][1] == {"name": "Streamed Stew"}
+    assert events[6][1] == {"index": 1, "text": "Simmer"}
+
+    recipe = db.query(Recipe).filter(Recipe.name == "Streamed Stew").first()
+    assert recipe is not None
+    assert events[-1][1]["id"] == recipe.id
+    assert recipe.instructions == "Brown the beef\nSimmer"
+
+
+def test_get_recipe_details_stream_existing_recipe(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
+) -> None:
+    """Test streaming details replays an existing recipe without the AI"""
+    with patch("app.services.recipe_generation_service.ai_service.stream_recipe_details") as mock_ai:
+        response = client.post(
+            "/api/v1/recipes/details/stream",
+            headers=auth_headers,
+            json={"recipe_name": test_recipe.name, "servings": 2},
+        )
+
+    mock_ai.assert_not_called()
+    events = _parse_sse(response.text)
+
+    assert events[0] == ("field", {"name": test_recipe.name})
+    assert [data for event, data in events if event == "step"][0] == {"index": 0, "text": "1. Cook pasta"}
+    assert events[-1][0] == "recipe"
+    assert events[-1][1]["id"] == test_recipe.id
+
+
 def test_get_saved_recipes_empty(
     client: TestClient, auth_headers: dict[str, str]
 ) -> None:
@@ -145,8 +681,8 @@ def test_get_saved_recipes_empty(
     assert response.status_code == 200
     data = response.json()
 
-    assert isinstance(data, list)
-    assert len(data) == 0
+    assert data["items"] == []
+    assert data["next_cursor"] is None
 
 
 def test_save_recipe(
@@ -208,6 +744,155 @@ def test_save_recipe_already_saved(
     assert response2.status_code == 400
 
 
+def test_save_and_unsave_recipe_run_single_statements(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
+) -> None:
+    """Test saving and unsaving each write with one statement"""
+    with QueryCounter() as save_queries:
+        response = client.post(f"/api/v1/recipes/saved/{test_recipe.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["recipe"]["id"] == test_recipe.id
+
+    with QueryCounter() as unsave_queries:
+        response = client.delete(f"/api/v1/recipes/saved/{test_recipe.id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    # Save: load the recipe, INSERT ... ON CONFLICT ... RETURNING (user is cached)
+    assert save_queries.count == 2
+    assert "ON CONFLICT" in save_queries.statements[-1]
+    # Unsave: DELETE ... RETURNING
+    assert unsave_queries.count == 1
+    assert "RETURNING" in unsave_queries.statements[-1]
+
+
+def test_put_saved_recipe_is_idempotent(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe, db: Session
+) -> None:
+    """Test PUT saves a recipe once and succeeds when repeated"""
+    url = f"/api/v1/recipes/saved/{test_recipe.id}"
+    response1 = client.put(url, headers=auth_headers)
+    response2 = client.put(url, headers=auth_headers)
+
+    assert response1.status_code == 201
+    assert response2.status_code == 200
+    assert response2.json()["id"] == response1.json()["id"]
+    assert response2.json()["recipe"]["id"] == test_recipe.id
+    assert db.query(SavedRecipe).filter(SavedRecipe.recipe_id == test_recipe.id).count() == 1
+
+
+def test_put_saved_recipe_not_found(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test PUT on an unknown recipe fails"""
+    response = client.put("/api/v1/recipes/saved/99999", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+def test_get_saved_recipe(
+    client: TestClient, auth_headers: dict[str, str], test_recipe: Recipe
+) -> None:
+    """Test getting one saved recipe by ID, and 404 once it is unsaved"""
+    url = f"/api/v1/recipes/saved/{test_recipe.id}"
+    client.put(url, headers=auth_headers)
+
+    response = client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["recipe"]["id"] == test_recipe.id
+    assert response.json()["recipe"]["ingredients"] == test_recipe.ingredients
+
+    client.delete(url, headers=auth_headers)
+    assert client.get(url, headers=auth_headers).status_code == 404
+
+
+def test_bulk_update_saved_recipes(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test saving and unsaving several recipes in one request"""
+    recipes = [
+        Recipe(
+            name=f"Bulk {index}",
+            servings=1,
+            ingredients=[{"name": "salt", "quantity": "1 pinch"}],
+            instructions="Mix",
+        )
+        for index in range(4)
+    ]
+    db.add_all(recipes)
+    db.commit()
+    ids = [recipe.id for recipe in recipes]
+    client.post(f"/api/v1/recipes/saved/{ids[1]}", headers=auth_headers)
+    client.post(f"/api/v1/recipes/saved/{ids[2]}", headers=auth_headers)
+
+    with QueryCounter() as queries:
+        response = client.post(
+            "/api/v1/recipes/saved/bulk",
+            headers=auth_headers,
+            json={"save": [ids[0], ids[1], 99999], "unsave": [ids[2], ids[3]]},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"recipe_id": ids[0], "action": "save", "status": "saved"},
+        {"recipe_id": ids[1], "action": "save", "status": "already_saved"},
+        {"recipe_id": 99999, "action": "save", "status": "not_found"},
+        {"recipe_id": ids[2], "action": "unsave", "status": "unsaved"},
+        {"recipe_id": ids[3], "action": "unsave", "status": "not_saved"},
+    ]
+    # Check recipe ids, one INSERT and one DELETE (user is cached)
+    assert queries.count == 3
+
+    saved = client.get("/api/v1/recipes/saved", headers=auth_headers).json()["items"]
+    assert {item["recipe"]["id"] for item in saved} == {ids[0], ids[1]}
+
+
+def test_bulk_update_saved_recipes_rejects_overlap(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test a recipe ID cannot be both saved and unsaved"""
+    response = client.post(
+        "/api/v1/recipes/saved/bulk",
+        headers=auth_headers,
+        json={"save": [1, 2], "unsave": [2]},
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_saved_recipes_query_count_is_constant(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test listing saved recipes runs the same number of queries for 1 or 30 recipes"""
+    recipes = [
+        Recipe(
+            name=f"Saved {index}",
+            servings=1,
+            ingredients=[{"name": "salt", "quantity": "1 pinch"}],
+            instructions="Mix",
+        )
+        for index in range(30)
+    ]
+    db.add_all(recipes)
+    db.commit()
+
+    def list_saved() -> tuple[int, list[dict[str, Any]]]:
+        with QueryCounter() as queries:
+            response = client.get("/api/v1/recipes/saved", headers=auth_headers)
+        assert response.status_code == 200
+        return queries.count, response.json()["items"]
+
+    client.post(f"/api/v1/recipes/saved/{recipes[0].id}", headers=auth_headers)
+    single_count, _ = list_saved()
+
+    for recipe in recipes[1:]:
+        client.post(f"/api/v1/recipes/saved/{recipe.id}", headers=auth_headers)
+    many_count, saved = list_saved()
+
+    # One query to load saved recipes with their recipe (user is cached)
+    assert single_count == many_count == 1
+    assert {item["recipe"]["name"] for item in saved} == {recipe.name for recipe in recipes}
+
+
 def test_get_saved_recipes_with_data(
     client: TestClient,
     auth_headers: dict[str, str],
@@ -224,13 +909,102 @@ def test_get_saved_recipes_with_data(
     response = client.get("/api/v1/recipes/saved", headers=auth_headers)
 
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
 
     assert len(data) == 1
     assert data[0]["recipe"]["id"] == test_recipe.id
     assert data[0]["recipe"]["name"] == test_recipe.name
 
 
+def test_get_saved_recipes_paginates_with_cursor(
+    client: TestClient, auth_headers: dict[str, str], db: Session
+) -> None:
+    """Test walking saved recipes page by page, including rows saved at the same time"""
+    user = db.query(User).filter(User.username == "testuser_auth").one()
+    recipes = [
+        Recipe(
+            name=f"Paged {index}",
+            servings=1,
+            ingredients=[{"name": "salt", "quantity": "1 pinch"}],
+            instructions="Mix",
+        )
+        for index in range(5)
+    ]
+    db.add_all(recipes)
+    db.flush()
+    # Three recipes share a timestamp so the id has to break the tie
+    saved_at = [datetime(2025, 10, 1, 12, 0)] * 3 + [
+        datetime(2025, 10, 2, 12, 0),
+        datetime(2025, 9, 30, 12, 0),
+    ]
+    db.add_all(
+        SavedRecipe(user_id=user.id, recipe_id=recipe.id, saved_at=when)
+        for recipe, when in zip(recipes, saved_at, strict=True)
+    )
+    db.commit()
+
+    names: list[str] = []
+    pages = 0
+    cursor: str | None = None
+    while True:
+        params: dict[str, Any] = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/recipes/saved", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) <= 2
+        names.extend(item["recipe"]["name"] for item in data["items"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert names == ["Paged 3", "Paged 0", "Paged 1", "Paged 2", "Paged 4"]
+
+
+def test_get_saved_recipes_summary_view(
+    client: TestClient,
+    auth_headers: dict[str, str],
+    test_recipe: Recipe,
+) -> None:
+    """Test the summary view only reads and returns list fields"""
+    client.post(f"/api/v1/recipes/saved/{test_recipe.id}", headers=auth_headers)
+
+    with QueryCounter() as queries:
+        response = client.get(
+            "/api/v1/recipes/saved", headers=auth_headers, params={"view": "summary"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["next_cursor"] is None
+    assert len(data["items"]) == 1
+    assert data["items"][0]["recipe"] == {
+        "id": test_recipe.id,
+        "name": test_recipe.name,
+        "description": test_recipe.description,
+        "cooking_time": test_recipe.cooking_time,
+        "difficulty": test_recipe.difficulty,
+    }
+    list_query = queries.statements[-1]
+    assert "saved_recipes" in list_query
+    assert "instructions" not in list_query
+    assert "ingredients" not in list_query
+
+
+def test_get_saved_recipes_invalid_cursor(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    """Test a malformed cursor is rejected"""
+    response = client.get(
+        "/api/v1/recipes/saved", headers=auth_headers, params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+
+
 def test_unsave_recipe(
     client: TestClient,
     auth_headers: dict[str, str],
@@ -289,7 +1063,7 @@ def test_recipe_isolation_between_users(
     response = client.get("/api/v1/recipes/saved", headers=headers2)
 
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
 
     # User 2 should have no saved recipes
     assert len(data) == 0
@@ -2,18 +2,40 @@
 Tests for business logic services
 """
 
+import asyncio
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.recipe import Recipe
+from app.models.recipe import Recipe, recipe_lookup_key, recipe_restriction_terms
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
-from app.schemas.recipe import RecipeCreate
+from app.schemas.recipe import RecipeCreate, RecipeDetailsRequest
 from app.schemas.user import UserPreferencesUpdate
+from app.services.ai_service import recipe_details_key
 from app.services.auth_service import authenticate_user, get_or_create_user
+from app.services.prefetch_service import RecipePrefetcher
+from app.services.recipe_cache import get_cached_recipe, recipe_cache
+from app.services.recipe_generation_service import (
+    details_flight,
+    generate_recipe_details_once,
+    stream_recipe_details,
+)
 from app.services.recipe_service import (
+    ENSURE_SAVED_ATTEMPTS,
+    bulk_update_saved_recipes,
     create_recipe,
+    create_recipes,
+    ensure_recipe_saved_for_user,
+    find_recipes_by_ingredients,
     get_recipe_by_id,
     get_recipe_by_name,
+    get_recipes_by_lookup_keys,
     get_saved_recipes_for_user,
     save_recipe_for_user,
     unsave_recipe_for_user,
@@ -23,44 +45,45 @@ from app.services.user_service import (
     get_user_preferences,
     update_user_preferences,
 )
+from tests.conftest import RunDB
 
 
 # Auth Service Tests
-def test_get_or_create_user_new(db: Session) -> None:
+def test_get_or_create_user_new(run_db: RunDB) -> None:
     """Test creating a new user"""
-    user = get_or_create_user(db, "newuser")
+    user = run_db(lambda session: get_or_create_user(session, "newuser"))
 
     assert user.username == "newuser"
     assert user.id is not None
 
 
-def test_get_or_create_user_existing(db: Session, test_user: User) -> None:
+def test_get_or_create_user_existing(run_db: RunDB, test_user: User) -> None:
     """Test getting an existing user"""
-    user = get_or_create_user(db, test_user.username)
+    user = run_db(lambda session: get_or_create_user(session, test_user.username))
 
     assert user.id == test_user.id
     assert user.username == test_user.username
 
 
-def test_authenticate_user_new(db: Session) -> None:
+def test_authenticate_user_new(run_db: RunDB) -> None:
     """Test authenticating a new user"""
-    user, token = authenticate_user(db, "authuser")
+    user, token = run_db(lambda session: authenticate_user(session, "authuser"))
 
     assert user.username == "authuser"
     assert token is not None
     assert len(token) > 0
 
 
-def test_authenticate_user_existing(db: Session, test_user: User) -> None:
+def test_authenticate_user_existing(run_db: RunDB, test_user: User) -> None:
     """Test authenticating an existing user"""
-    user, token = authenticate_user(db, test_user.username)
+    user, token = run_db(lambda session: authenticate_user(session, test_user.username))
 
     assert user.id == test_user.id
     assert token is not None
 
 
 # Recipe Service Tests
-def test_create_recipe(db: Session) -> None:
+def test_create_recipe(run_db: RunDB) -> None:
     """Test creating a recipe"""
     recipe_data = RecipeCreate(
         name="Test Recipe",
@@ -76,7 +99,7 @@ def test_create_recipe(db: Session) -> None:
         difficulty=3,
     )
 
-    recipe = create_recipe(db, recipe_data)
+    recipe = run_db(lambda session: create_recipe(session, recipe_data))
 
     assert recipe.id is not None
     assert recipe.name == "Test Recipe"
@@ -84,103 +107,282 @@ def test_create_recipe(db: Session) -> None:
     assert len(recipe.ingredients) == 2
 
 
-def test_get_recipe_by_id(db: Session, test_recipe: Recipe) -> None:
+def test_get_recipe_by_id(run_db: RunDB, test_recipe: Recipe) -> None:
     """Test getting recipe by ID"""
-    recipe = get_recipe_by_id(db, test_recipe.id)
+    recipe = run_db(lambda session: get_recipe_by_id(session, test_recipe.id))
 
     assert recipe is not None
     assert recipe.id == test_recipe.id
     assert recipe.name == test_recipe.name
 
 
-def test_get_recipe_by_id_not_found(db: Session) -> None:
+def test_get_recipe_by_id_not_found(run_db: RunDB) -> None:
     """Test getting non-existent recipe by ID"""
-    recipe = get_recipe_by_id(db, 99999)
+    recipe = run_db(lambda session: get_recipe_by_id(session, 99999))
 
     assert recipe is None
 
 
-def test_get_recipe_by_name(db: Session, test_recipe: Recipe) -> None:
+def test_get_recipe_by_name(run_db: RunDB, test_recipe: Recipe) -> None:
     """Test getting recipe by name"""
-    recipe = get_recipe_by_name(db, test_recipe.name)
+    recipe = run_db(lambda session: get_recipe_by_name(session, test_recipe.name))
 
     assert recipe is not None
     assert recipe.name == test_recipe.name
 
 
-def test_get_recipe_by_name_not_found(db: Session) -> None:
+def test_get_recipe_by_name_not_found(run_db: RunDB) -> None:
     """Test getting non-existent recipe by name"""
-    recipe = get_recipe_by_name(db, "Non Existent Recipe")
+    recipe = run_db(lambda session: get_recipe_by_name(session, "Non Existent Recipe"))
 
     assert recipe is None
 
 
-def test_save_recipe_for_user(db: Session, test_user: User, test_recipe: Recipe) -> None:
+def test_create_recipes_bulk(run_db: RunDB) -> None:
+    """Test creating several recipes in one commit"""
+    recipes_data = [
+        RecipeCreate(
+            name=f"Bulk {index}",
+            ingredients=[{"name": "salt", "quantity": "1 pinch"}],
+            instructions="Mix",
+        )
+        for index in range(3)
+    ]
+
+    recipes = run_db(lambda session: create_recipes(session, recipes_data))
+
+    assert [recipe.name for recipe in recipes] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert all(recipe.id is not None for recipe in recipes)
+
+
+def test_recipe_lookup_key_normalizes_name_and_restrictions() -> None:
+    """Test lookup keys ignore casing, spacing and restriction order"""
+    assert recipe_lookup_key("  Chicken   PASTA ") == "chicken pasta|"
+    assert recipe_lookup_key("Chicken Pasta", []) == recipe_lookup_key("chicken pasta")
+    assert recipe_lookup_key("Chicken Pasta", ["Vegan", "nut-free"]) == recipe_lookup_key(
+        "chicken pasta", ["nut-free ", "vegan", "VEGAN"]
+    )
+    assert recipe_lookup_key("Chicken Pasta", ["vegan"]) != recipe_lookup_key("Chicken Pasta")
+
+
+def test_find_recipes_by_ingredients_respects_restrictions(run_db: RunDB, db: Session) -> None:
+    """Test degraded suggestions only include recipes made for the same allergies"""
+    nut_free = recipe_restriction_terms(None, ["nuts"])
+    for name, terms in (("Satay Rice", None), ("Nut-free Rice", nut_free)):
+        db.add(
+            Recipe(
+                name=name,
+                ingredients=[{"name": "rice", "quantity": "200g"}],
+                instructions="Cook",
+                lookup_key=recipe_lookup_key(name, terms),
+            )
+        )
+    db.commit()
+
+    allergic = run_db(lambda session: find_recipes_by_ingredients(session, ["rice"], restriction_terms=nut_free))
+    anyone = run_db(lambda session: find_recipes_by_ingredients(session, ["rice"]))
+
+    assert [recipe.name for recipe in allergic] == ["Nut-free Rice"]
+    assert {recipe.name for recipe in anyone} == {"Satay Rice", "Nut-free Rice"}
+
+
+def test_find_recipes_by_ingredients_escapes_wildcards(run_db: RunDB, db: Session) -> None:
+    """Test "%" and "_" in requested ingredients are not LIKE wildcards"""
+    for name, ingredient, created_at in (
+        ("Rice Bowl", "rice", datetime(2025, 1, 1)),
+        # Newer, and would match "p_sta" if "_" were a wildcard
+        ("Pistachio Cake", "pista", datetime(2025, 1, 2)),
+    ):
+        db.add(
+            Recipe(
+                name=name,
+                ingredients=[{"name": ingredient, "quantity": "1"}],
+                instructions="Cook",
+                created_at=created_at,
+            )
+        )
+    db.commit()
+
+    recipes = run_db(
+        lambda session: find_recipes_by_ingredients(session, ["p_sta", "rice"], candidate_limit=1)
+    )
+
+    assert [recipe.name for recipe in recipes] == ["Rice Bowl"]
+
+
+def test_recipe_restriction_terms_keep_allergies_apart() -> None:
+    """Test allergies give other lookup keys than restrictions of the same name"""
+    assert recipe_restriction_terms(None, [" "]) is None
+    assert recipe_restriction_terms(["vegan"], [" Nuts"]) == ["vegan", "allergy:Nuts"]
+    assert recipe_lookup_key("Pasta", recipe_restriction_terms(None, ["nuts"])) != recipe_lookup_key(
+        "Pasta", recipe_restriction_terms(["nuts"], None)
+    )
+
+
+def test_get_recipes_by_lookup_keys(run_db: RunDB, test_recipe: Recipe) -> None:
+    """Test looking up recipes by lookup key, including ones inserted without a key"""
+    key = recipe_lookup_key(test_recipe.name)
+    recipes = run_db(
+        lambda session: get_recipes_by_lookup_keys(session, [key, recipe_lookup_key("Unknown")])
+    )
+
+    assert list(recipes) == [key]
+    assert recipes[key].id == test_recipe.id
+
+
+def test_recipe_cache_invalidated_on_update(run_db: RunDB, test_recipe: Recipe) -> None:
+    """Test an ORM update of a recipe drops it from the recipe cache"""
+    cached = run_db(lambda session: get_cached_recipe(session, test_recipe.id))
+    assert recipe_cache.get(test_recipe.id) == cached
+
+    async def rename(session: AsyncSession) -> None:
+        recipe = await session.get(Recipe, test_recipe.id)
+        recipe.name = "Renamed Pasta"
+        await session.commit()
+
+    run_db(rename)
+
+    assert recipe_cache.get(test_recipe.id) is None
+    reloaded = run_db(lambda session: get_cached_recipe(session, test_recipe.id))
+    assert reloaded.name == "Renamed Pasta"
+
+
+def test_recipe_cache_invalidated_by_core_statements(
+    run_db: RunDB, db: Session, test_user: User, test_recipe: Recipe
+) -> None:
+    """Test Core UPDATE and DELETE statements on recipes empty the recipe cache"""
+    run_db(lambda session: get_cached_recipe(session, test_recipe.id))
+
+    async def rename(session: AsyncSession) -> None:
+        await session.execute(
+            update(Recipe).where(Recipe.id == test_recipe.id).values(name="Renamed Pasta")
+        )
+        await session.commit()
+
+    run_db(rename)
+    assert recipe_cache.get(test_recipe.id) is None
+    reloaded = run_db(lambda session: get_cached_recipe(session, test_recipe.id))
+    assert reloaded.name == "Renamed Pasta"
+
+    # Statements on other tables leave cached recipes alone
+    run_db(lambda session: unsave_recipe_for_user(session, test_user, test_recipe.id))
+    assert recipe_cache.get(test_recipe.id) is not None
+
+    db.execute(delete(Recipe).where(Recipe.id == test_recipe.id))
+    db.commit()
+    assert recipe_cache.get(test_recipe.id) is None
+    assert run_db(lambda session: get_cached_recipe(session, test_recipe.id)) is None
+
+
+def test_save_recipe_for_user(run_db: RunDB, test_user: User, test_recipe: Recipe) -> None:
     """Test saving a recipe for a user"""
-    saved_recipe = save_recipe_for_user(db, test_user, test_recipe)
+    saved_recipe = run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
 
     assert saved_recipe.user_id == test_user.id
     assert saved_recipe.recipe_id == test_recipe.id
 
 
 def test_save_recipe_for_user_duplicate(
-    db: Session, test_user: User, test_recipe: Recipe
+    run_db: RunDB, test_user: User, test_recipe: Recipe
 ) -> None:
     """Test saving a recipe twice raises error"""
     # Save once
-    save_recipe_for_user(db, test_user, test_recipe)
+    run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
 
     # Try to save again
     try:
-        save_recipe_for_user(db, test_user, test_recipe)
+        run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
         raise AssertionError("Should have raised ValueError")
     except ValueError as e:
         assert "already saved" in str(e)
 
 
+def test_ensure_recipe_saved_for_user_is_idempotent(
+    run_db: RunDB, test_user: User, test_recipe: Recipe
+) -> None:
+    """Test saving a recipe twice returns the same saved recipe"""
+    first, first_created = run_db(
+        lambda session: ensure_recipe_saved_for_user(session, test_user, test_recipe.id)
+    )
+    second, second_created = run_db(
+        lambda session: ensure_recipe_saved_for_user(session, test_user, test_recipe.id)
+    )
+
+    assert first_created is True
+    assert second_created is False
+    assert second.id == first.id
+    assert second.recipe_id == test_recipe.id
+
+
+def test_ensure_recipe_saved_for_user_gives_up_after_retries(
+    run_db: RunDB, test_user: User, test_recipe: Recipe
+) -> None:
+    """Test a save that keeps racing with unsaves fails instead of recursing forever"""
+    with patch(
+        "app.services.recipe_service._insert_saved_recipe", return_value=None
+    ) as mock_insert, pytest.raises(RuntimeError):
+        run_db(lambda session: ensure_recipe_saved_for_user(session, test_user, test_recipe.id))
+
+    assert mock_insert.call_count == ENSURE_SAVED_ATTEMPTS
+
+
+def test_bulk_update_saved_recipes_rejects_overlap(
+    run_db: RunDB, test_user: User, test_recipe: Recipe
+) -> None:
+    """Test a recipe ID in both lists is rejected before any write"""
+    with pytest.raises(ValueError, match="both save and unsave"):
+        run_db(
+            lambda session: bulk_update_saved_recipes(
+                session, test_user, [test_recipe.id], [test_recipe.id]
+            )
+        )
+
+    assert run_db(lambda session: get_saved_recipes_for_user(session, test_user)) == []
+
+
 def test_unsave_recipe_for_user(
-    db: Session, test_user: User, test_recipe: Recipe
+    run_db: RunDB, test_user: User, test_recipe: Recipe
 ) -> None:
     """Test unsaving a recipe"""
     # Save first
-    save_recipe_for_user(db, test_user, test_recipe)
+    run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
 
     # Unsave
-    result = unsave_recipe_for_user(db, test_user, test_recipe.id)
+    result = run_db(lambda session: unsave_recipe_for_user(session, test_user, test_recipe.id))
 
     assert result is True
 
 
-def test_unsave_recipe_not_saved(db: Session, test_user: User) -> None:
+def test_unsave_recipe_not_saved(run_db: RunDB, test_user: User) -> None:
     """Test unsaving a recipe that wasn't saved"""
-    result = unsave_recipe_for_user(db, test_user, 99999)
+    result = run_db(lambda session: unsave_recipe_for_user(session, test_user, 99999))
 
     assert result is False
 
 
-def test_get_saved_recipes_for_user_empty(db: Session, test_user: User) -> None:
+def test_get_saved_recipes_for_user_empty(run_db: RunDB, test_user: User) -> None:
     """Test getting saved recipes when user has none"""
-    saved_recipes = get_saved_recipes_for_user(db, test_user)
+    saved_recipes = run_db(lambda session: get_saved_recipes_for_user(session, test_user))
 
     assert len(saved_recipes) == 0
 
 
 def test_get_saved_recipes_for_user_with_data(
-    db: Session, test_user: User, test_recipe: Recipe
+    run_db: RunDB, test_user: User, test_recipe: Recipe
 ) -> None:
     """Test getting saved recipes with data"""
     # Save recipe
-    save_recipe_for_user(db, test_user, test_recipe)
+    run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
 
     # Get saved recipes
-    saved_recipes = get_saved_recipes_for_user(db, test_user)
+    saved_recipes = run_db(lambda session: get_saved_recipes_for_user(session, test_user))
 
     assert len(saved_recipes) == 1
     assert saved_recipes[0].recipe_id == test_recipe.id
 
 
 def test_saved_recipes_ordered_by_date(
-    db: Session, test_user: User, test_recipe: Recipe
+    run_db: RunDB, test_user: User, test_recipe: Recipe
 ) -> None:
     """Test saved recipes are ordered by saved_at (most recent first)"""
     # Create second recipe
@@ -194,14 +396,14 @@ def test_saved_recipes_ordered_by_date(
         prep_time=5,
         difficulty=2,
     )
-    recipe2 = create_recipe(db, recipe2_data)
+    recipe2 = run_db(lambda session: create_recipe(session, recipe2_data))
 
     # Save recipes
-    save_recipe_for_user(db, test_user, test_recipe)
-    save_recipe_for_user(db, test_user, recipe2)
+    run_db(lambda session: save_recipe_for_user(session, test_user, test_recipe.id))
+    run_db(lambda session: save_recipe_for_user(session, test_user, recipe2.id))
 
     # Get saved recipes
-    saved_recipes = get_saved_recipes_for_user(db, test_user)
+    saved_recipes = run_db(lambda session: get_saved_recipes_for_user(session, test_user))
 
     # Most recent should be first
     assert len(saved_recipes) == 2
@@ -210,54 +412,187 @@ def test_saved_recipes_ordered_by_date(
 
 
 # User Service Tests
-def test_get_user_preferences_not_found(db: Session, test_user: User) -> None:
+def test_get_user_preferences_not_found(run_db: RunDB, test_user: User) -> None:
     """Test getting preferences for user with none"""
-    preferences = get_user_preferences(db, test_user)
+    preferences = run_db(lambda session: get_user_preferences(session, test_user))
     assert preferences is None
 
 
-def test_get_user_preferences_found(db: Session, test_user_preferences: UserPreferences) -> None:
+def test_get_user_preferences_found(run_db: RunDB, test_user_preferences: UserPreferences) -> None:
     """Test getting existing preferences"""
-    preferences = get_user_preferences(db, test_user_preferences.user)
+    preferences = run_db(lambda session: get_user_preferences(session, test_user_preferences.user))
     assert preferences is not None
     assert preferences.user_id == test_user_preferences.user_id
     assert preferences.dietary_restrictions == ["vegetarian"]
 
 
-def test_create_user_preferences(db: Session, test_user: User) -> None:
+def test_create_user_preferences(run_db: RunDB, test_user: User) -> None:
     """Test creating new preferences"""
     preferences_data = UserPreferencesUpdate(
         dietary_restrictions=["vegan"],
         allergies=["shellfish"],
     )
 
-    preferences = create_user_preferences(db, test_user, preferences_data)
+    preferences = run_db(lambda session: create_user_preferences(session, test_user, preferences_data))
 
     assert preferences.user_id == test_user.id
     assert preferences.dietary_restrictions == ["vegan"]
     assert preferences.allergies == ["shellfish"]
 
 
-def test_update_user_preferences(db: Session, test_user_preferences: UserPreferences) -> None:
+def test_update_user_preferences(run_db: RunDB, test_user_preferences: UserPreferences) -> None:
     """Test updating existing preferences"""
     update_data = UserPreferencesUpdate(
         dietary_restrictions=["vegan"]
     )
 
-    updated_preferences = update_user_preferences(db, test_user_preferences.user, update_data)
+    updated_preferences = run_db(lambda session: update_user_preferences(session, test_user_preferences.user, update_data))
 
     assert updated_preferences.dietary_restrictions == ["vegan"]
     # Other fields should remain unchanged
     assert updated_preferences.allergies == ["nuts"]
 
 
-def test_update_user_preferences_not_found(db: Session, test_user: User) -> None:
+def test_update_user_preferences_not_found(run_db: RunDB, test_user: User) -> None:
     """Test updating preferences that don't exist"""
     update_data = UserPreferencesUpdate(dietary_restrictions=["vegan"])
 
     try:
-        update_user_preferences(db, test_user, update_data)
+        run_db(lambda session: update_user_preferences(session, test_user, update_data))
         raise AssertionError("Should have raised ValueError")
     except ValueError as e:
         assert "User preferences not found" in str(e)
 
+
+
+# Recipe Generation Service Tests
+def test_generate_recipe_details_once_coalesces_concurrent_requests(db: Session) -> None:
+    """Test identical concurrent details requests share one AI call and one row"""
+    calls = 0
+
+    async def fake_generate(request: RecipeDetailsRequest) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {
+            "name": "Trending Curry",
+            "servings": 2,
+            "ingredients": [{"name": "curry paste", "quantity": "2 tbsp"}],
+            "instructions": "Simmer",
+        }
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                generate_recipe_details_once(RecipeDetailsRequest(recipe_name="Trending Curry"))
+                for _ in range(10)
+            )
+        )
+
+    with patch("app.services.recipe_generation_service.ai_service.generate_recipe_details", new=fake_generate):
+        results = asyncio.run(run())
+
+    assert calls == 1
+    assert {recipe.id for recipe in results} == {results[0].id}
+    assert db.query(Recipe).filter(Recipe.name == "Trending Curry").count() == 1
+
+
+def test_stream_recipe_details_shares_generation_with_other_requests(db: Session) -> None:
+    """Test streams and plain details requests for one recipe share one AI call and one row"""
+    calls = 0
+    recipe: dict[str, Any] = {
+        "name": "Shared Stew",
+        "servings": 2,
+        "ingredients": [{"name": "beef", "quantity": "1kg"}],
+        "instructions": "Simmer",
+    }
+
+    async def fake_generate(request: RecipeDetailsRequest) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return dict(recipe)
+
+    async def fake_stream(request: RecipeDetailsRequest) -> Any:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        yield "name", recipe["name"]
+        yield "ingredients", recipe["ingredients"][0]
+        yield "instructions", recipe["instructions"]
+
+    request = RecipeDetailsRequest(recipe_name="Shared Stew")
+
+    async def collect() -> list[tuple[str, Any]]:
+        return [event async for event in stream_recipe_details(request)]
+
+    async def run() -> tuple[Any, ...]:
+        # The stream starts generating, then a plain request and a second stream join it
+        first = asyncio.ensure_future(collect())
+        while not details_flight.in_flight(recipe_details_key(request)):
+            await asyncio.sleep(0.001)
+        return tuple(
+            await asyncio.gather(first, generate_recipe_details_once(request), collect())
+        )
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        new=fake_generate,
+    ), patch(
+        "app.services.recipe_generation_service.ai_service.stream_recipe_details",
+        new=fake_stream,
+    ):
+        first_stream, stored, second_stream = asyncio.run(run())
+
+    assert calls == 1
+    assert [event for event, _ in first_stream] == ["field", "ingredient", "step", "recipe"]
+    assert first_stream[-1] == ("recipe", stored.model_dump(mode="json"))
+    # The joining stream replays the stored recipe
+    assert second_stream[0] == ("field", {"name": "Shared Stew"})
+    assert second_stream[-1] == first_stream[-1]
+    assert db.query(Recipe).filter(Recipe.name == "Shared Stew").count() == 1
+
+
+# Prefetch Service Tests
+def test_prefetcher_generates_missing_recipes_once(db: Session, test_recipe: Recipe) -> None:
+    """Test prefetch stores new recipes, skips stored ones and deduplicates"""
+    generated: list[str] = []
+
+    async def fake_generate(request: RecipeDetailsRequest) -> dict[str, Any]:
+        generated.append(request.recipe_name)
+        await asyncio.sleep(0.01)
+        return {
+            "name": request.recipe_name,
+            "ingredients": [{"name": "rice", "quantity": "100g"}],
+            "instructions": "Cook",
+        }
+
+    async def run() -> RecipePrefetcher:
+        prefetcher = RecipePrefetcher(max_workers=2, max_queue=10)
+        prefetcher.start()
+        prefetcher.schedule(
+            [
+                RecipeDetailsRequest(recipe_name="Risotto"),
+                RecipeDetailsRequest(recipe_name="Risotto"),
+                RecipeDetailsRequest(recipe_name="Paella"),
+                RecipeDetailsRequest(recipe_name=test_recipe.name),
+            ]
+        )
+        await prefetcher.join()
+        await prefetcher.stop()
+        return prefetcher
+
+    with patch("app.services.recipe_generation_service.ai_service.generate_recipe_details", new=fake_generate):
+        prefetcher = asyncio.run(run())
+
+    assert sorted(generated) == ["Paella", "Risotto"]
+    assert prefetcher.deduplicated == 1
+    assert prefetcher.completed == 3
+    assert db.query(Recipe).filter(Recipe.name == "Risotto").count() == 1
+
+
+def test_prefetcher_not_started_schedules_nothing() -> None:
+    """Test prefetch is a no-op unless the workers are running"""
+    prefetcher = RecipePrefetcher(max_workers=1, max_queue=1)
+
+    assert prefetcher.schedule([RecipeDetailsRequest(recipe_name="Soup")]) == 0
@@ -0,0 +1,84 @@
+"""
+Tests for single-flight request coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    """Test identical concurrent keys run the function once"""
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [42] * 10
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "executed": 1, "coalesced": 9}
+
+
+def test_different_keys_run_separately() -> None:
+    """Test distinct keys are not coalesced"""
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def run() -> list[str]:
+        async def echo(value: str) -> str:
+            await asyncio.sleep(0.01)
+            return value
+
+        return list(await asyncio.gather(flight.do("a", lambda: echo("a")), flight.do("b", lambda: echo("b"))))
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert flight.executed == 2
+
+
+def test_exceptions_are_shared() -> None:
+    """Test every waiter sees the failure of the shared call"""
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def fail() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run() -> list[BaseException | int]:
+        return await asyncio.gather(
+            *(flight.do("key", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not flight.in_flight("key")
+
+
+def test_cancelled_caller_does_not_cancel_shared_work() -> None:
+    """Test cancelling one waiter leaves the others with a result"""
+    flight: SingleFlight[int] = SingleFlight()
+
+    async def work() -> int:
+        await asyncio.sleep(0.05)
+        return 7
+
+    async def run() -> int:
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 7
@@ -0,0 +1,100 @@
+"""
+Statement count benchmark per endpoint
+Runs a typical session against the API and counts the SQL statements each
+request sends to the database (see "Database round trips" in README.md)
+"""
+
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.schemas.recipe import RecipeDetailsRequest
+from tests.conftest import QueryCounter
+
+# Statements per request, in scenario order. Keep README.md in sync.
+EXPECTED_STATEMENTS = {
+    "PUT /me/preferences (create)": 1,
+    "PUT /me/preferences (update)": 1,
+    "GET /me/preferences": 1,
+    # Lookup, re-check inside the single flight, INSERT ... RETURNING
+    "POST /recipes/details (generated)": 3,
+    "POST /recipes/details (stored)": 0,
+    # One IN lookup, then one INSERT ... RETURNING per row on SQLite
+    # (a single multi-row INSERT on PostgreSQL)
+    "POST /recipes/details/batch (2 generated)": 3,
+    "PUT /recipes/saved/{id}": 1,
+    "GET /recipes/saved": 1,
+    "DELETE /recipes/saved/{id}": 1,
+    "POST /auth/login (existing user)": 1,
+    "POST /auth/login (new user)": 1,
+}
+
+
+def _generated_recipe(request: RecipeDetailsRequest) -> dict[str, Any]:
+    """Fake AI answer for any recipe name"""
+    return {
+        "name": request.recipe_name,
+        "servings": request.servings,
+        "ingredients": [{"name": "rice", "quantity": "200g"}],
+        "instructions": "Cook rice",
+    }
+
+
+def test_statements_per_endpoint(client: TestClient, auth_headers: dict[str, str]) -> None:
+    """Test each endpoint of a typical session runs the documented statement count"""
+    counts: dict[str, int] = {}
+
+    def measure(label: str, method: str, url: str, **kwargs: Any) -> Any:
+        with QueryCounter() as queries:
+            response = client.request(method, url, headers=auth_headers, **kwargs)
+        assert response.status_code < 300, (label, response.text)
+        counts[label] = queries.count
+        return response.json()
+
+    with patch(
+        "app.services.recipe_generation_service.ai_service.generate_recipe_details",
+        side_effect=_generated_recipe,
+    ):
+        measure(
+            "PUT /me/preferences (create)",
+            "PUT",
+            "/api/v1/me/preferences",
+            json={"allergies": ["nuts"]},
+        )
+        measure(
+            "PUT /me/preferences (update)",
+            "PUT",
+            "/api/v1/me/preferences",
+            json={"dietary_restrictions": ["vegan"]},
+        )
+        measure("GET /me/preferences", "GET", "/api/v1/me/preferences")
+        recipe = measure(
+            "POST /recipes/details (generated)",
+            "POST",
+            "/api/v1/recipes/details",
+            json={"recipe_name": "Rice Bowl"},
+        )
+        measure(
+            "POST /recipes/details (stored)",
+            "POST",
+            "/api/v1/recipes/details",
+            json={"recipe_name": "Rice Bowl"},
+        )
+        measure(
+            "POST /recipes/details/batch (2 generated)",
+            "POST",
+            "/api/v1/recipes/details/batch",
+            json={"recipe_names": ["Rice Salad", "Rice Soup"]},
+        )
+    measure("PUT /recipes/saved/{id}", "PUT", f"/api/v1/recipes/saved/{recipe['id']}")
+    measure("GET /recipes/saved", "GET", "/api/v1/recipes/saved")
+    measure("DELETE /recipes/saved/{id}", "DELETE", f"/api/v1/recipes/saved/{recipe['id']}")
+    with QueryCounter() as queries:
+        client.post("/api/v1/auth/login", json={"username": "testuser_auth"})
+    counts["POST /auth/login (existing user)"] = queries.count
+    with QueryCounter() as queries:
+        client.post("/api/v1/auth/login", json={"username": "first_login"})
+    counts["POST /auth/login (new user)"] = queries.count
+
+    assert counts == EXPECTED_STATEMENTS
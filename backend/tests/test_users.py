@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
+from tests.conftest import QueryCounter, RunDB
 
 
 class TestUserRoutes:
@@ -123,27 +124,61 @@ class TestUserRoutes:
 
         assert response.status_code == 403  # FastAPI returns 403 for protected routes
 
+    def test_update_user_preferences_single_statement(self, client: TestClient, auth_headers: dict[str, str]) -> None:
+        """Test creating and updating preferences each run one upsert"""
+        with QueryCounter() as queries:
+            created = client.put(
+                "/api/v1/me/preferences", json={"allergies": ["nuts"]}, headers=auth_headers
+            )
+            updated = client.put(
+                "/api/v1/me/preferences", json={"dietary_restrictions": ["vegan"]}, headers=auth_headers
+            )
+
+        assert created.status_code == 200
+        assert updated.status_code == 200
+        assert updated.json()["id"] == created.json()["id"]
+        assert updated.json()["allergies"] == ["nuts"]
+        assert updated.json()["dietary_restrictions"] == ["vegan"]
+        assert queries.count == 2
+        assert all(statement.lstrip().upper().startswith("INSERT") for statement in queries.statements)
+
+    def test_update_user_preferences_null_keeps_value(self, client: TestClient, db: Session, test_user_preferences: UserPreferences) -> None:
+        """Test an explicit null leaves the stored value unchanged"""
+        response = client.post("/api/v1/auth/login", json={"username": "testuser"})
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        response = client.put(
+            "/api/v1/me/preferences",
+            json={"dietary_restrictions": None, "allergies": ["soy"]},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["dietary_restrictions"] == ["vegetarian"]
+        assert response.json()["allergies"] == ["soy"]
+        assert db.query(UserPreferences).filter(UserPreferences.user_id == test_user_preferences.user_id).count() == 1
+
 
 class TestUserService:
     """Test user service functions"""
 
-    def test_get_user_preferences_not_found(self, db: Session, test_user: User) -> None:
+    def test_get_user_preferences_not_found(self, run_db: RunDB, test_user: User) -> None:
         """Test getting preferences for user with none"""
         from app.services.user_service import get_user_preferences
 
-        preferences = get_user_preferences(db, test_user)
+        preferences = run_db(lambda session: get_user_preferences(session, test_user))
         assert preferences is None
 
-    def test_get_user_preferences_found(self, db: Session, test_user: User, test_user_preferences: UserPreferences) -> None:
+    def test_get_user_preferences_found(self, run_db: RunDB, test_user: User, test_user_preferences: UserPreferences) -> None:
         """Test getting existing preferences"""
         from app.services.user_service import get_user_preferences
 
-        preferences = get_user_preferences(db, test_user)
+        preferences = run_db(lambda session: get_user_preferences(session, test_user))
         assert preferences is not None
         assert preferences.user_id == test_user.id
         assert preferences.dietary_restrictions == ["vegetarian"]
 
-    def test_create_user_preferences(self, db: Session, test_user: User) -> None:
+    def test_create_user_preferences(self, run_db: RunDB, test_user: User) -> None:
         """Test creating new preferences"""
         from app.schemas.user import UserPreferencesUpdate
         from app.services.user_service import create_user_preferences
@@ -153,13 +188,13 @@ class TestUserService:
             allergies=["shellfish"],
         )
 
-        preferences = create_user_preferences(db, test_user, preferences_data)
+        preferences = run_db(lambda session: create_user_preferences(session, test_user, preferences_data))
 
         assert preferences.user_id == test_user.id
         assert preferences.dietary_restrictions == ["vegan"]
         assert preferences.allergies == ["shellfish"]
 
-    def test_update_user_preferences(self, db: Session, test_user: User, test_user_preferences: UserPreferences) -> None:
+    def test_update_user_preferences(self, run_db: RunDB, test_user: User, test_user_preferences: UserPreferences) -> None:
         """Test updating existing preferences"""
         from app.schemas.user import UserPreferencesUpdate
         from app.services.user_service import update_user_preferences
@@ -168,13 +203,28 @@ class TestUserService:
             dietary_restrictions=["vegan"]
         )
 
-        updated_preferences = update_user_preferences(db, test_user, update_data)
+        updated_preferences = run_db(lambda session: update_user_preferences(session, test_user, update_data))
 
         assert updated_preferences.dietary_restrictions == ["vegan"]
         # Other fields should remain unchanged
         assert updated_preferences.allergies == ["nuts"]
 
-    def test_update_user_preferences_not_found(self, db: Session, test_user: User) -> None:
+    def test_update_user_preferences_single_statement(self, run_db: RunDB, test_user: User, test_user_preferences: UserPreferences) -> None:
+        """Test an update returns the row without a SELECT before or after"""
+        from app.schemas.user import UserPreferencesUpdate
+        from app.services.user_service import update_user_preferences
+
+        update_data = UserPreferencesUpdate(allergies=["soy"])
+        with QueryCounter() as queries:
+            updated_preferences = run_db(lambda session: update_user_preferences(session, test_user, update_data))
+
+        assert updated_preferences.allergies == ["soy"]
+        assert updated_preferences.dietary_restrictions == ["vegetarian"]
+        assert updated_preferences.updated_at >= test_user_preferences.updated_at
+        assert queries.count == 1
+        assert queries.statements[0].lstrip().upper().startswith("UPDATE")
+
+    def test_update_user_preferences_not_found(self, run_db: RunDB, test_user: User) -> None:
         """Test updating preferences that don't exist"""
         from app.schemas.user import UserPreferencesUpdate
         from app.services.user_service import update_user_preferences
@@ -182,4 +232,4 @@ class TestUserService:
         update_data = UserPreferencesUpdate(dietary_restrictions=["vegan"])
 
         with pytest.raises(ValueError, match="User preferences not found"):
-            update_user_preferences(db, test_user, update_data)
+            run_db(lambda session: update_user_preferences(session, test_user, update_data))
@@ -29,6 +29,9 @@ export default function RecipeResultsPage() {
   const [isSaving, setIsSaving] = useState(false);
   const [savedRecipeIds, setSavedRecipeIds] = useState<Set<string>>(new Set());
   const [error, setError] = useState('');
+  // Restrictions of the search, so details are looked up under the same key as the suggestions
+  const [searchRestrictions, setSearchRestrictions] = useState<string[]>([]);
+  const [searchAllergies, setSearchAllergies] = useState<string[]>([]);
 
   // Redirect to login if not authenticated
   useEffect(() => {
@@ -58,6 +61,8 @@ export default function RecipeResultsPage() {
   const loadRecipeDetails = async (ingredients: string[], restrictions: string[], allergies: string[]) => {
     setIsLoading(true);
     setError('');
+    setSearchRestrictions(restrictions);
+    setSearchAllergies(allergies);
     
     try {
       // First, get recipe suggestions from the generate endpoint
@@ -74,7 +79,8 @@ export default function RecipeResultsPage() {
         body: JSON.stringify({
           ingredients,
           servings: 2,
-          dietary_restrictions: restrictions
+          dietary_restrictions: restrictions,
+          allergies
         })
       });
       
@@ -126,7 +132,8 @@ export default function RecipeResultsPage() {
         body: JSON.stringify({
           recipe_name: recipeName,
           servings: 2,
-          dietary_restrictions: []
+          dietary_restrictions: searchRestrictions,
+          allergies: searchAllergies
         })
       });
       
@@ -5,23 +5,17 @@ import { Layout } from '@/components/layout/Layout';
 import { Card, CardHeader, CardTitle, Button, Loading, Input } from '@/components/ui';
 import { BookmarkIcon, MagnifyingGlassIcon, XMarkIcon } from '@heroicons/react/24/outline';
 
+// Summary view: full details are loaded on demand from GET /recipes/saved/{recipe_id}
 interface SavedRecipe {
   id: string;
-  recipe_id: number;
   user_id: number;
   saved_at: string;
   recipe: {
     id: number;
     name: string;
     description: string;
-    prep_time: number;
     cooking_time: number;
-    servings: number;
     difficulty: number;
-    ingredients: Array<{ name: string; quantity: string }>;
-    instructions: string;
-    created_at: string;
-    updated_at: string;
   };
 }
 
@@ -74,18 +68,29 @@ export default function SavedRecipesPage() {
       if (!apiUrl) {
         throw new Error('API URL not configured. Please set NEXT_PUBLIC_API_URL environment variable.');
       }
-      const response = await fetch(`${apiUrl}/recipes/saved`, {
-        headers: {
-          'Authorization': `Bearer ${localStorage.getItem('auth_token')}`
+      // The list is paginated: follow next_cursor until the last page
+      const recipes: SavedRecipe[] = [];
+      let cursor: string | null = null;
+      do {
+        const query: string = cursor
+          ? `?view=summary&limit=100&cursor=${encodeURIComponent(cursor)}`
+          : '?view=summary&limit=100';
+        const response = await fetch(`${apiUrl}/recipes/saved${query}`, {
+          headers: {
+            'Authorization': `Bearer ${localStorage.getItem('auth_token')}`
+          }
+        });
+
+        if (!response.ok) {
+          throw new Error(`Failed to load saved recipes: ${response.status}`);
         }
-      });
 
-      if (!response.ok) {
-        throw new Error(`Failed to load saved recipes: ${response.status}`);
-      }
+        const data = await response.json();
+        recipes.push(...(data.items || []));
+        cursor = data.next_cursor || null;
+      } while (cursor);
 
-      const data = await response.json();
-      setSavedRecipes(data || []);
+      setSavedRecipes(recipes);
     } catch (err) {
       console.error('Error loading saved recipes:', err);
       setError('Failed to load saved recipes. Please try again.');
@@ -102,21 +107,15 @@ export default function SavedRecipesPage() {
       if (!apiUrl) {
         throw new Error('API URL not configured. Please set NEXT_PUBLIC_API_URL environment variable.');
       }
-      const response = await fetch(`${apiUrl}/recipes/details`, {
-        method: 'POST',
+      // By ID: the saved recipe itself, whatever the user's current restrictions
+      const response = await fetch(`${apiUrl}/recipes/saved/${recipeId}`, {
         headers: {
-          'Content-Type': 'application/json',
           'Authorization': `Bearer ${localStorage.getItem('auth_token')}`
-        },
-        body: JSON.stringify({
-          recipe_name: recipeName,
-          servings: 2,
-          dietary_restrictions: []
-        })
+        }
       });
 
       if (response.ok) {
-        const detailsData = await response.json();
+        const detailsData = (await response.json()).recipe;
 
         // Create a recipe object with full details
         const fullRecipe = {